@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio wrappers
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.aio import analyze_batch_async, report_many_async
+from tmin.batch import analyze_batch, fleet_from_pipes
+
+class SlowPipe:
+    """Stand-in for PIPE whose report() takes a while and records how many run at once"""
+    lock = threading.Lock()
+
+    def __init__(self, log):
+        self.log = log
+
+    def report(self, measured_thickness, year_inspected=None, joint_type='Seamless', as_of=None, precision=None):
+        with self.lock:
+            self.log["running"] += 1
+            self.log["started"] += 1
+            self.log["peak"] = max(self.log["peak"], self.log["running"])
+        time.sleep(0.05)
+        with self.lock:
+            self.log["running"] -= 1
+        return {"measured_thickness": measured_thickness}
+
+def new_log():
+    return {"running": 0, "started": 0, "peak": 0}
+
+def test_async_analysis_matches_sync():
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+                allowable_stress=23333.0, corrosion_rate=10.0)
+
+    async def main():
+        single = await pipe.analysis_async(0.060, 2023, as_of=2025)
+        batch = await analyze_batch_async(fleet_from_pipes([pipe], [0.060], 2023), as_of=2025)
+        return single, batch
+
+    single, batch = asyncio.run(main())
+    assert single == pipe.analysis(0.060, 2023, as_of=2025)
+    assert batch["actual_thickness"][0] == single["actual_thickness"]
+
+def test_async_units_and_precision(tmp_path, monkeypatch):
+    """A metric fleet and a report precision reach the engine through the async entry points"""
+    monkeypatch.chdir(tmp_path)
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+                allowable_stress=23333.0, corrosion_rate=10.0)
+    fleet = fleet_from_pipes([pipe], [0.060], 2023)
+    metric = dict(fleet, pressure=[50.0 * 0.006894757293168361], allowable_stress=[23333.0 * 0.006894757293168361],
+                  corrosion_rate=[10.0 * 0.0254], measured_thickness=[0.060 * 25.4])
+
+    async def main():
+        results = await analyze_batch_async(metric, as_of=2025, units="metric")
+        files = await pipe.report_async(0.060, 2023, as_of=2025, precision=2)
+        return results, files
+
+    results, files = asyncio.run(main())
+    expected = analyze_batch(fleet, as_of=2025)
+    assert results["actual_thickness"][0] == pytest.approx(expected["actual_thickness"][0] * 25.4)
+    assert results["tmin_pressure"][0] == pytest.approx(expected["tmin_pressure"][0] * 25.4)
+    with open(files["full_report"]) as f:
+        assert "Measured Thickness: 0.06 inches" in f.read()
+
+def test_report_many_respects_concurrency_limit():
+    log = new_log()
+    jobs = [(SlowPipe(log), 0.1 * i) for i in range(6)] + [{"pipe": SlowPipe(log), "measured_thickness": 0.7}]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Threads render in parallel; the semaphore caps how many run at once
+        results = asyncio.run(report_many_async(jobs, concurrency=3, executor=executor))
+        assert [r["measured_thickness"] for r in results] == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.7])
+        assert log["peak"] == 3
+
+def test_concurrent_reports_write_distinct_files(tmp_path, monkeypatch):
+    """Reports rendered in the same second from a thread pool never overwrite each other"""
+    monkeypatch.chdir(tmp_path)
+    pipes = [PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+                  allowable_stress=23333.0, corrosion_rate=10.0) for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reports = asyncio.run(report_many_async([(pipe, 0.060, 2023) for pipe in pipes], concurrency=4,
+                                                executor=executor))
+    files = ["full_report", "summary_report", "json_report", "number_line_plot", "comparison_chart"]
+    for name in files:
+        assert len({report[name] for report in reports}) == len(pipes), name
+    assert len(os.listdir(tmp_path / "Reports")) == len(files) * len(pipes)
+
+def test_cancellation_stops_pending_reports():
+    log = new_log()
+    jobs = [(SlowPipe(log), 0.1) for _ in range(20)]
+
+    async def main():
+        task = asyncio.ensure_future(report_many_async(jobs, concurrency=2))
+        await asyncio.sleep(0.08)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert log["started"] < 20
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized batch analysis engine
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch, fleet_from_pipes, project_batch
+from tmin.dates import decimal_year
+
+AS_OF = date(2025, 1, 1)
+
+def make_pipe(**overrides):
+    fields = dict(
+        schedule="40",
+        nps="2",
+        pressure=50.0,
+        pressure_class=150,
+        metallurgy="Intermediate/Low CS",
+        allowable_stress=23333.0,
+        corrosion_rate=10.0,
+        default_retirement_limit=0.050
+    )
+    fields.update(overrides)
+    return PIPE(**fields)
+
+def assert_matches_scalar(pipes, measured, year_inspected, joint_types):
+    """Batch results must equal PIPE.analysis row for row"""
+    batch = analyze_batch(fleet_from_pipes(pipes, measured, year_inspected, joint_types), as_of=AS_OF)
+    for i, pipe in enumerate(pipes):
+        scalar = pipe.analysis(measured[i], year_inspected, joint_types[i], as_of=AS_OF)
+        for key, value in scalar.items():
+            if value is None:
+                assert np.isnan(batch[key][i]), key
+            else:
+                assert batch[key][i] == pytest.approx(value), key
+
+def test_welded_joint_factors():
+    """Welded pipe uses E from Table 102.4.3 and W from the WSRF table"""
+    pipe = make_pipe(design_temp=1250)
+    assert pipe.get_joint_factors("Seamless") == (1.0, 1.0)
+    assert pipe.get_joint_factors("ERW") == (0.85, 0.73)
+    assert make_pipe().get_joint_factors("ERW") == (0.85, 1.0)
+    assert pipe.tmin_pressure("ERW") > pipe.tmin_pressure("Seamless")
+
+def test_unknown_joint_type_error():
+    """Unknown joint types are rejected by both the scalar and batch paths"""
+    with pytest.raises(ValueError, match="Unknown joint_type"):
+        make_pipe().tmin_pressure("Spiral")
+    with pytest.raises(ValueError, match="Unknown joint_type"):
+        analyze_batch(fleet_from_pipes([make_pipe()], [0.2], joint_type="Spiral"))
+
+def test_mixed_seamless_and_welded_fleet():
+    """A mixed fleet is evaluated in one pass and agrees with PIPE.analysis"""
+    pipes = [
+        make_pipe(),
+        make_pipe(schedule="80", nps="6", pressure=1500.0, pressure_class=600, design_temp="1250+",
+                  pipe_config="90LR - Inner Elbow"),
+        make_pipe(nps="3", pressure=300.0, pressure_class=300, design_temp=1250,
+                  pipe_config="90LR - Outer Elbow"),
+        make_pipe(schedule="160", nps="1", pressure=600.0, pressure_class=900, design_temp="<900"),
+    ]
+    assert_matches_scalar(pipes, [0.060, 0.400, 0.200, 0.300], 2023,
+                          ["Seamless", "ERW", "EFW", "Furnace Butt Weld"])
+
+def test_metallurgy_selects_tables():
+    """Y coefficient and API 574 table follow the material registry"""
+    assert make_pipe(design_temp=950).get_Y_coefficient() == 0.5
+    assert make_pipe(metallurgy="SS 316/316L", design_temp=1150).get_Y_coefficient() == 0.7
+    assert make_pipe(metallurgy="SS 316/316L", pressure_class=2500).tmin_structural() == 0.160
+    assert make_pipe(pressure_class=2500).tmin_structural() == 0.180
+
+def test_allowable_stress_curve_fallback():
+    """A missing allowable stress is taken from the material's curve when one exists"""
+    assert make_pipe(allowable_stress=None, design_temp=950).get_allowable_stress() == 4500
+    with pytest.raises(ValueError, match="allowable_stress must be specified"):
+        make_pipe(metallurgy="SS 304/304L", allowable_stress=None).get_allowable_stress()
+
+def test_mixed_material_fleet():
+    """A mixed-material fleet is dispatched in one pass and agrees with PIPE.analysis"""
+    pipes = [
+        make_pipe(metallurgy=metallurgy, design_temp=temp, pressure=600.0, pressure_class=pressure_class)
+        for metallurgy, temp, pressure_class in [
+            ("Intermediate/Low CS", 950, 600),
+            ("SS 316/316L", 1150, 2500),
+            ("SS 304/304L", "<900", 300),
+            ("Inconel 625", 1250, 900),
+            ("Other", 1000, 1500),
+        ]
+    ]
+    pipes.append(make_pipe(allowable_stress=None, design_temp=1000))
+    assert_matches_scalar(pipes, [0.300] * len(pipes), None, ["Seamless"] * len(pipes))
+
+def test_batch_future_inspection_year_error():
+    """Future inspection years are rejected for the whole batch"""
+    with pytest.raises(ValueError, match="cannot be in the future"):
+        analyze_batch(fleet_from_pipes([make_pipe()], [0.060], year_inspected=2030))
+
+def test_hostile_nps_is_rejected_not_evaluated(tmp_path, monkeypatch):
+    """NPS strings are parsed, never evaluated, on both the batch and the scalar path"""
+    monkeypatch.chdir(tmp_path)
+    marker = tmp_path / "evaluated"
+    hostile = "__import__('pathlib').Path('evaluated').touch() or 2"
+    fleet = fleet_from_pipes([make_pipe(), make_pipe(pipe_config="90LR - Inner Elbow")], [0.1, 0.1], 2020)
+    fleet["nps"] = [hostile, "1-" + hostile]
+    with pytest.raises(ValueError):
+        analyze_batch(fleet, as_of=AS_OF)
+    results = analyze_batch(fleet, as_of=AS_OF, errors="reject")
+    assert not results["valid"].any()
+    with pytest.raises(ValueError, match="Could not convert NPS"):
+        make_pipe(nps=hostile).tmin_structural()
+    assert not marker.exists()
+
+def test_as_of_uses_fractional_years():
+    """Corrosion loss is projected over fractional years between inspection and as-of dates"""
+    pipe = make_pipe()
+    scalar = pipe.analysis(0.100, year_inspected=date(2023, 7, 2), as_of="2025-07-02")
+    assert scalar["actual_thickness"] == pytest.approx(0.080, abs=1e-4)
+    assert decimal_year(date(2025, 7, 2)) == pytest.approx(2025.5, abs=0.01)
+    assert decimal_year(np.datetime64("2024-01-01")) == 2024.0
+
+    fleet = fleet_from_pipes([pipe, pipe], [0.100, 0.100],
+                             year_inspected=[date(2023, 7, 2), np.datetime64("2023-07-02")])
+    batch = analyze_batch(fleet, as_of="2025-07-02")
+    np.testing.assert_allclose(batch["actual_thickness"], scalar["actual_thickness"])
+
+def test_project_batch_matches_single_dates():
+    """Many as-of dates in one call equal one analyze_batch call per date"""
+    pipes = [make_pipe(), make_pipe(nps="6", schedule="80", corrosion_rate=5.0), make_pipe(corrosion_rate=None)]
+    fleet = fleet_from_pipes(pipes, [0.150, 0.400, 0.150], year_inspected=2020)
+    dates = [2020, date(2022, 3, 1), 2030.25]
+    projection = project_batch(fleet, dates)
+    assert projection["actual_thickness"].shape == (3, 3)
+    np.testing.assert_allclose(projection["as_of"], [decimal_year(d) for d in dates])
+    for i, as_of in enumerate(dates):
+        single = analyze_batch(fleet, as_of=as_of)
+        for key in ("actual_thickness", "above_api574RL", "life_span", "below_defaultRL"):
+            np.testing.assert_array_equal(projection[key][i], single[key])
+        np.testing.assert_array_equal(projection["governing_type"], single["governing_type"])
+    with pytest.raises(ValueError, match="cannot be in the future"):
+        project_batch(fleet, [2019])
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm local daemon and command forwarding
+"""
+
+import pytest
+import sys
+import os
+import subprocess
+import time
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin import daemon
+
+pytestmark = pytest.mark.skipif(not daemon.SUPPORTED, reason="needs Unix domain sockets and fork")
+
+PACKAGE_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    path = str(tmp_path / "tmin.sock")
+    env = {**os.environ, "PYTHONPATH": os.path.abspath(PACKAGE_ROOT)}
+    process = subprocess.Popen([sys.executable, "-m", "tmin.daemon", "daemon", "start", "--socket", path],
+                               env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(300):
+        if daemon.request({"command": "ping"}, path) is not None:
+            break
+        time.sleep(0.1)
+    else:
+        process.kill()
+        pytest.fail("daemon did not start")
+    yield path
+    daemon.request({"command": "stop"}, path)
+    process.wait(timeout=10)
+
+def test_forward_returns_none_without_daemon(tmp_path):
+    assert daemon.forward(["--help"], str(tmp_path / "missing.sock")) is None
+    assert daemon.request({"command": "ping"}, str(tmp_path / "missing.sock")) is None
+
+def test_untrusted_socket_is_ignored(tmp_path):
+    """A socket other users can reach is never connected to, so nothing is sent to it"""
+    import socket
+    path = str(tmp_path / "planted.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(1)
+    try:
+        os.chmod(path, 0o666)
+        assert daemon.forward(["--help"], path) is None
+        assert daemon.request({"command": "ping"}, path) is None
+    finally:
+        listener.close()
+
+def test_only_tmin_environment_is_forwarded(tmp_path, monkeypatch):
+    env = {"TMIN_TABLE_DIR": "/tables", "TZ": "UTC", "AWS_SECRET_ACCESS_KEY": "secret", "HOME": "/root"}
+    assert daemon.forwarded_env(env) == {"TMIN_TABLE_DIR": "/tables", "TZ": "UTC"}
+
+    monkeypatch.delenv("TMIN_DAEMON_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    assert os.path.basename(os.path.dirname(daemon.socket_path())) == f"tmin-{os.getuid()}"
+
+def test_main_falls_back_to_in_process(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("TMIN_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    with pytest.raises(SystemExit) as exit_info:
+        daemon.main(["--help"])
+    assert exit_info.value.code == 0
+    assert "TMIN - Pipe Thickness Analysis Tool" in capsys.readouterr().out
+
+def test_daemon_runs_commands_in_the_client_directory(running_daemon, tmp_path, monkeypatch, capsys):
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.chdir(work)
+    code = daemon.forward(["-s", "40", "-n", "2", "-p", "50", "-c", "150", "-m", "Intermediate/Low CS",
+                           "-a", "23333", "-t", "0.060", "--no-disclaimer", "--as-of", "2025-01-01"],
+                          running_daemon)
+    assert code == 0
+    assert "Analysis complete!" in capsys.readouterr().out
+    assert any(name.endswith(".txt") for name in os.listdir(work / "Reports"))
+
+    # Argument errors come back on stderr with argparse's exit code
+    assert daemon.forward(["-s", "99", "--no-disclaimer"], running_daemon) == 2
+    assert "invalid choice" in capsys.readouterr().err
+
+    status = daemon.request({"command": "ping"}, running_daemon)
+    assert status["served"] == 2
+
+def test_stop_removes_the_socket(running_daemon):
+    assert daemon.request({"command": "stop"}, running_daemon)["stopped"] > 0
+    for _ in range(50):
+        if not os.path.exists(running_daemon):
+            break
+        time.sleep(0.1)
+    assert not os.path.exists(running_daemon)
+    assert daemon.forward(["--help"], running_daemon) is None
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for comparing analysis result sets between inspection campaigns
+"""
+
+import pytest
+import sys
+import os
+import json
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch
+from tmin.diff import diff_results
+from tmin.export import read_results, write_results
+
+FLEET = {
+    "cml": ["A", "B", "C", "D"],
+    "schedule": "40",
+    "nps": ["2", "2", "3", "4"],
+    "pressure": 50.0,
+    "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333.0,
+    "corrosion_rate": [5.0, 10.0, 2.0, None],
+    "default_retirement_limit": 0.050,
+    "year_inspected": 2020,
+    "measured_thickness": [0.100, 0.090, 0.200, 0.200],
+}
+
+def campaigns():
+    """Before: the 2020 readings; after: new readings for A-C, D dropped and E added"""
+    before = {"cml": FLEET["cml"], **analyze_batch(FLEET, as_of=2020)}
+    after_fleet = dict(FLEET, cml=["A", "B", "C", "E"], year_inspected=2024,
+                       measured_thickness=[0.080, 0.040, 0.199, 0.200])
+    after = {"cml": after_fleet["cml"], **analyze_batch(after_fleet, as_of=2024)}
+    return before, after
+
+def test_changes_by_cml():
+    before, after = campaigns()
+    diff = diff_results(before, after, life_loss=5.0)
+    assert diff.cml.tolist() == ["A", "B", "C"]
+    assert diff.added.tolist() == ["E"] and diff.removed.tolist() == ["D"]
+    # B went from 0.090 to 0.040: below the 0.050 retirement limit and the structural minimum
+    assert diff.crossed["retirement_limit"].tolist() == [False, True, False]
+    assert diff.crossed["governing"][1]
+    expected_loss = before["life_span"][:3] - after["life_span"][:3]
+    np.testing.assert_allclose(diff.life_lost, expected_loss)
+    assert diff.lost_life.tolist() == [True, False, False]
+    assert diff.changed.tolist() == [True, True, False]
+    changes = diff.changes()
+    assert changes[0] == [f"lost {expected_loss[0]:.1f} years of life"]
+    assert "crossed retirement_limit" in changes[1]
+
+def test_governing_type_change():
+    before, after = campaigns()
+    after = dict(after, governing_type=np.array(["structural", "structural", "pressure", "structural"]))
+    diff = diff_results(before, after)
+    assert diff.governing_changed.tolist() == [False, False, True]
+    assert diff.changes()[-1] == ["governing structural -> pressure"]
+
+def test_json_delta_and_report(tmp_path):
+    before, after = campaigns()
+    diff = diff_results(before, after)
+    delta = json.load(open(diff.write_json(tmp_path / "delta.json")))
+    assert delta["counts"]["changed"] == 2 and delta["counts"]["added"] == 1
+    assert [entry["cml"] for entry in delta["changed"]] == ["A", "B"]
+    assert delta["changed"][1]["after"]["actual_thickness"] == pytest.approx(0.040)
+    assert delta["changed"][1]["after"]["life_span"] is None
+    text = open(diff.write_report(tmp_path / "changes.txt")).read()
+    assert "B: crossed" in text and "E: added" in text and "D: removed" in text
+
+def test_results_files(tmp_path):
+    before, after = campaigns()
+    write_results(tmp_path / "before.csv", {"cml": before["cml"]}, before)
+    write_results(tmp_path / "after.jsonl", {"cml": after["cml"]}, after)
+    loaded = read_results(tmp_path / "before.csv")
+    assert np.isnan(loaded["life_span"][3])
+    diff = diff_results(tmp_path / "before.csv", tmp_path / "after.jsonl")
+    assert diff.counts() == diff_results(before, after).counts()
+
+def test_repeated_cml():
+    before, after = campaigns()
+    with pytest.raises(ValueError):
+        diff_results(dict(before, cml=["A", "A", "B", "C"]), after)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the ASME B36.10M / B36.19M pipe dimension table
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.dimensions import get_dimensions, lookup, nps_to_float, schedule_codes
+from tmin.asmetables.pipe_dimensions import pipe_OD, nominal_wall
+
+def make_pipe(schedule, nps):
+    return PIPE(schedule=schedule, nps=nps, pressure=50.0, pressure_class=150,
+                metallurgy="Intermediate/Low CS", allowable_stress=23333.0)
+
+def test_schedule_10_small_bore():
+    """Schedule 10 covers the small NPS values the old per-schedule tables were missing"""
+    assert make_pipe("10", "3/8").get_OD() == 0.675
+    assert make_pipe("10", "1/2").get_OD() == 0.840
+    assert make_pipe("10", "1/2").get_ID() == 0.674
+    assert make_pipe("10", "1/2").tmin_pressure() > 0
+
+def test_dimensions_od_wall_id():
+    """OD, nominal wall and ID come from one normalized table"""
+    assert get_dimensions("2", "40") == (2.375, 0.154, 2.067)
+    assert get_dimensions("12", "STD") == (12.750, 0.375, 12.0)
+    assert get_dimensions("12", "40") == (12.750, 0.406, 11.938)
+    assert get_dimensions("1-1/2", "80S") == get_dimensions("1.5", "80S")
+    assert get_dimensions("2", "120") is None  # not a B36.10M schedule for NPS 2
+    assert get_dimensions("2-3/8", "40") is None
+    assert make_pipe("120", "2").get_OD() is None
+    with pytest.raises(ValueError, match="Invalid schedule"):
+        make_pipe("35", "2").get_OD()
+
+def test_vectorized_lookup_matches_table():
+    """The sorted-key lookup returns every tabulated pair and NaN for unknown pairs"""
+    pairs = [(nps, schedule) for nps, walls in nominal_wall.items() for schedule in walls]
+    od, wall = lookup(np.array([nps_to_float(n) for n, _ in pairs]), schedule_codes([s for _, s in pairs]))
+    np.testing.assert_array_equal(od, [pipe_OD[n] for n, _ in pairs])
+    np.testing.assert_array_equal(wall, [nominal_wall[n][s] for n, s in pairs])
+
+    od, wall = lookup(np.array([2.0, 2.0, np.nan]), schedule_codes(["120", "bogus", "40"]))
+    assert np.isnan(od).all() and np.isnan(wall).all()
+
+if __name__ == "__main__":
+    pytest.main([__file__])
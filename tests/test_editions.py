@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the code edition registry
+"""
+
+import pytest
+import sys
+import os
+import json
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch, analyze_editions
+from tmin.editions import get_edition, load_edition_file, save_edition_npz, available_editions
+from tmin.asmetables.api_574_2025 import API574_CS_400F, API574_SS_400F
+from tmin.asmetables.api_574_2009 import API574_2009_TABLE_6
+
+OWNER_TOML = """
+name = "OWNER-TEST"
+version = "2026.1"
+base = "2025"
+description = "Owner-user override of the 2025 edition"
+
+[structural."Intermediate/Low CS"."2"]
+150 = 0.075
+"""
+
+FLEET = {
+    "schedule": "40",
+    "nps": ["2", "6", "12"],
+    "pressure": 50.0,
+    "pressure_class": [150, 300, 600],
+    "metallurgy": ["Intermediate/Low CS", "SS 316/316L", "Intermediate/Low CS"],
+    "allowable_stress": 23333.0,
+    "measured_thickness": [0.100, 0.250, 0.300],
+}
+
+def test_builtin_editions_match_tables():
+    """Compiled built-in editions reproduce the asmetables dictionaries"""
+    edition = get_edition("2025")
+    assert edition.structural_thickness("Intermediate/Low CS", "8", 600) == API574_CS_400F["8"][600]
+    assert edition.structural_thickness("SS 304/304L", "8", 600) == API574_SS_400F["8"][600]
+    assert get_edition("2009").structural_thickness("SS 316/316L", "3", 2500) == \
+        API574_2009_TABLE_6["3"]["default_minimum_structural_thickness"]
+    assert get_edition("2025") is edition  # compiled once per process
+
+def test_toml_owner_override(tmp_path):
+    """A TOML edition inherits its base and overrides individual entries"""
+    path = tmp_path / "owner.toml"
+    path.write_text(OWNER_TOML)
+    edition = load_edition_file(path)
+
+    assert "OWNER-TEST" in available_editions()
+    assert edition.version == "2026.1"
+    assert edition.structural_thickness("Intermediate/Low CS", "2", 150) == 0.075
+    assert edition.structural_thickness("Intermediate/Low CS", "2", 300) == API574_CS_400F["2"][300]
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150,
+                metallurgy="Intermediate/Low CS", allowable_stress=23333.0, API_table="OWNER-TEST")
+    assert pipe.tmin_structural() == 0.075
+
+def test_json_and_npz_round_trip(tmp_path):
+    """JSON and NPZ edition files compile to the same arrays"""
+    json_path = tmp_path / "owner.json"
+    json_path.write_text(json.dumps({
+        "name": "OWNER-JSON", "version": "1",
+        "structural": {"*": {"2": {"150": 0.09, "300": 0.1}}},
+    }))
+    edition = load_edition_file(json_path)
+    assert edition.structural_thickness("Inconel 625", "2", 300) == 0.1
+    with pytest.raises(KeyError):
+        edition.structural_thickness("Inconel 625", "2", 600)
+
+    npz_path = tmp_path / "owner.npz"
+    save_edition_npz(edition, npz_path)
+    loaded = load_edition_file(npz_path, register=False)
+    assert loaded.name == "OWNER-JSON"
+    assert loaded.nps_keys == edition.nps_keys
+    np.testing.assert_array_equal(loaded.structural, edition.structural)
+
+def test_analyze_editions_side_by_side():
+    """Several editions evaluated at once agree with separate batch runs"""
+    results = analyze_editions(FLEET, ["2025", "2009"])
+    for name in ["2025", "2009"]:
+        single = analyze_batch({**FLEET, "API_table": name})
+        for key, values in single.items():
+            np.testing.assert_array_equal(results[name][key], values)
+    assert not np.array_equal(results["2025"]["tmin_structural"], results["2009"]["tmin_structural"])
+
+def test_unknown_edition_error():
+    """Unknown editions are rejected with the list of registered editions"""
+    with pytest.raises(ValueError, match="Unknown code edition"):
+        analyze_batch({**FLEET, "API_table": "1999"})
+
+if __name__ == "__main__":
+    pytest.main([__file__])
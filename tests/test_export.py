@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON Lines and CSV result outputs
+"""
+
+import pytest
+import sys
+import os
+import csv
+import io
+import json
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch
+from tmin.export import ResultWriter, analysis_record, write_results
+
+FLEET = {
+    "cml": ["CML-1", "CML-2", "CML-3"],
+    "schedule": ["40", "bogus", "40"],
+    "nps": ["2", "2", "3"],
+    "pressure": 50.0,
+    "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333.0,
+    "corrosion_rate": [10.0, 10.0, None],
+    "default_retirement_limit": 0.050,
+    "year_inspected": 2023,
+    "measured_thickness": [0.060, 0.060, 0.200],
+}
+
+def test_jsonl_and_csv_records(tmp_path):
+    results = analyze_batch(FLEET, as_of=2025, errors="reject")
+    assert write_results(tmp_path / "results.jsonl", FLEET, results) == 2
+    with open(tmp_path / "results.jsonl") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["cml"] for r in records] == ["CML-1", "CML-3"]
+    assert records[0]["actual_thickness"] == pytest.approx(0.040)
+    assert records[0]["above_api574RL"] is None and records[0]["life_span"] is None
+    assert records[0]["structural_adequate"] is False
+    assert "RETIREMENT RECOMMENDED: Below API 574 retirement limit" in records[0]["recommendations"]
+    assert records[1]["pressure_adequate"] is True
+
+    write_results(tmp_path / "results.csv", FLEET, results)
+    with open(tmp_path / "results.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["cml"] for r in rows] == ["CML-1", "CML-3"]
+    assert rows[0]["life_span"] == "" and rows[0]["structural_adequate"] == "false"
+    assert float(rows[1]["tmin_structural"]) == records[1]["tmin_structural"]
+
+def test_streaming_chunks_share_one_header():
+    buffer = io.StringIO()
+    with ResultWriter(buffer, "csv") as writer:
+        for chunk in range(3):
+            fleet = {**FLEET, "schedule": "40", "cml": [f"C{chunk}-{i}" for i in range(3)]}
+            writer.write(fleet, analyze_batch(fleet, as_of=2025))
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == 10 and lines.count(lines[0]) == 1
+    with pytest.raises(ValueError, match="format must be"):
+        ResultWriter(buffer, "xml")
+
+def test_single_analysis_record_matches_batch():
+    pipe = PIPE(schedule="40", nps="3", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+                allowable_stress=23333.0, default_retirement_limit=0.050)
+    record = analysis_record(pipe, pipe.analysis(0.200, as_of=2025))
+    fleet = {**FLEET, "schedule": "40", "corrosion_rate": None, "year_inspected": None, "API_table": "2025"}
+    batch = analyze_batch(fleet, as_of=2025)
+    buffer = io.StringIO()
+    write_results(buffer, {k: v for k, v in fleet.items() if k != "cml"}, batch, "jsonl")
+    assert json.loads(buffer.getvalue().splitlines()[2]) == json.loads(json.dumps(record))
+
+def test_report_with_inspection_date(tmp_path, monkeypatch):
+    """A date inspection value is recorded as a decimal year in the JSON report"""
+    monkeypatch.chdir(tmp_path)
+    pipe = PIPE("40", "2", 50.0, 150, "Intermediate/Low CS", 23333.0, corrosion_rate=5.0)
+    files = pipe.report(0.2, year_inspected=date(2020, 6, 30), as_of=date(2025, 1, 1))
+    with open(files["json_report"]) as f:
+        record = json.load(f)
+    assert record["year_inspected"] == pytest.approx(2020 + 181 / 366)
+    assert record["actual_thickness"] == pytest.approx(files["analysis_results"]["actual_thickness"])
+    assert not [name for name in os.listdir("Reports") if name.endswith(".tmp")]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for fleet manifests and the manifest CLI mode
+"""
+
+import pytest
+import sys
+import os
+import csv
+import zipfile
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin import cli
+from tmin.batch import analyze_batch
+from tmin.manifest import load_manifest, manifest_fleet, read_manifest, report_names
+from tmin.validation import validate_batch
+
+MANIFEST = """
+[defaults]
+pressure_class = 150
+metallurgy = "Intermediate/Low CS"
+allowable_stress = 23333.0
+
+[circuit.C-101]
+pressure = 50.0
+corrosion_rate = 10.0
+
+[circuit.C-102]
+pressure = 300.0
+api_table = "2009"
+
+[[pipe]]
+cml = "CML-001"
+circuit = "C-101"
+schedule = "40"
+nps = "2"
+readings = [
+    {measured_thickness = 0.058, year_inspected = "2024-03-15"},
+    {measured_thickness = 0.062, year_inspected = 2021},
+]
+
+[[pipe]]
+cml = "CML-002"
+circuit = "C-102"
+schedule = "80"
+nps = "4"
+measured_thickness = 0.25
+year_inspected = 2023
+
+[[pipe]]
+cml = "CML-003"
+circuit = "C-101"
+schedule = "40"
+nps = "7"
+corrosion_rate = 5.0
+readings = [0.2]
+"""
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    path = tmp_path / "fleet.toml"
+    path.write_text(MANIFEST)
+    return path
+
+def test_defaults_circuits_and_pipe_fields_are_layered(manifest_path):
+    fleet = load_manifest(manifest_path)
+    assert fleet["cml"] == ["CML-001", "CML-002", "CML-003"]
+    assert fleet["pressure"] == [50.0, 300.0, 50.0]
+    assert fleet["API_table"] == ["2025", "2009", "2025"]
+    assert fleet["corrosion_rate"][2] == 5.0
+    assert fleet["pressure_class"] == [150, 150, 150]
+    # The latest reading is chosen by inspection date, not list position
+    assert fleet["measured_thickness"] == [0.058, 0.25, 0.2]
+
+def test_all_readings_become_rows(manifest_path):
+    fleet = load_manifest(manifest_path, readings="all")
+    assert fleet["cml"] == ["CML-001", "CML-001", "CML-002", "CML-003"]
+    assert fleet["measured_thickness"] == [0.058, 0.062, 0.25, 0.2]
+    assert report_names(fleet) == ["CML-001_1", "CML-001_2", "CML-002", "CML-003"]
+
+    results = analyze_batch(fleet, as_of=date(2025, 1, 1), errors="reject")
+    assert results["valid"].tolist() == [True, True, True, False]
+
+def test_unparseable_inspection_date_rejects_its_row(manifest_path):
+    document = read_manifest(manifest_path)
+    document["pipe"][0]["readings"][1]["year_inspected"] = "2024-13-45"
+    fleet = manifest_fleet(document)
+    assert fleet["year_inspected"][0] == "2024-13-45"
+
+    validation = validate_batch(fleet, as_of=date(2025, 1, 1))
+    assert validation.valid.tolist() == [False, True, False]
+    assert (0, "year_inspected", "unparseable inspection date") in set(
+        zip(validation.rows.tolist(), validation.columns.tolist(), validation.reasons.tolist()))
+
+def test_yaml_and_json_manifests_match_toml(manifest_path, tmp_path):
+    import json
+    document = read_manifest(manifest_path)
+    json_path = tmp_path / "fleet.json"
+    json_path.write_text(json.dumps(document))
+    assert load_manifest(json_path) == load_manifest(manifest_path)
+
+    yaml = pytest.importorskip("yaml")
+    yaml_path = tmp_path / "fleet.yaml"
+    yaml_path.write_text(yaml.safe_dump(json.loads(json.dumps(document))))
+    assert load_manifest(yaml_path) == load_manifest(manifest_path)
+
+def test_manifest_errors():
+    with pytest.raises(ValueError, match="no \\[\\[pipe\\]\\]"):
+        manifest_fleet({"defaults": {}})
+    with pytest.raises(ValueError, match="Unknown field"):
+        manifest_fleet({"pipe": [{"cml": "A", "thickness": 0.1}]})
+    with pytest.raises(ValueError, match="Unknown circuit"):
+        manifest_fleet({"circuit": {"C-1": {}}, "pipe": [{"cml": "A", "circuit": "C-2"}]})
+    with pytest.raises(ValueError, match="readings must be"):
+        manifest_fleet({"pipe": [{"cml": "A"}]}, readings="first")
+
+def test_cli_runs_a_manifest_as_one_batch(manifest_path, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    cli.main(["-f", str(manifest_path), "--no-disclaimer", "--as-of", "2025-01-01", "-o", "out",
+              "--readings", "all"])
+    output = capsys.readouterr().out
+    assert "Analyzing 4 readings" in output and "1 rejected" in output
+
+    files = sorted(os.listdir(tmp_path / "out"))
+    archive = next(name for name in files if name.endswith(".zip"))
+    with zipfile.ZipFile(tmp_path / "out" / archive) as zf:
+        assert zf.namelist() == ["TMIN_report_CML-001_1.txt", "TMIN_report_CML-001_2.txt",
+                                 "TMIN_report_CML-002.txt"]
+    results = next(name for name in files if name.endswith("TMIN_results.csv"))
+    with open(tmp_path / "out" / results) as f:
+        assert [row["cml"] for row in csv.DictReader(f)] == ["CML-001", "CML-001", "CML-002"]
+    assert any(name.endswith("TMIN_rejected_rows.csv") for name in files)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
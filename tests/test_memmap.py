@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for memory-mapped result columns
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch, project_batch
+from tmin.memmap import analyze_to_memmap, open_results, project_to_memmap
+
+FLEET = {
+    "schedule": ["40", "80", "40", "40", "80"],
+    "nps": ["2", "6", "3", "2", "4"],
+    "pressure": [50.0, 600.0, 75.0, 50.0, 300.0],
+    "pressure_class": [150, 600, 300, 150, 300],
+    "metallurgy": ["Intermediate/Low CS", "SS 316/316L", "Intermediate/Low CS", "Intermediate/Low CS",
+                   "Intermediate/Low CS"],
+    "allowable_stress": [23333.0, 20000.0, 23333.0, None, 23333.0],
+    "measured_thickness": [0.060, 0.400, 0.120, 0.150, 0.300],
+    "corrosion_rate": [10.0, None, 15.0, 5.0, 2.0],
+    "year_inspected": [2022, None, 2022, 2020, 2021],
+}
+
+def assert_same(results, expected):
+    assert set(expected) <= set(results)
+    for name, values in expected.items():
+        if np.asarray(values).dtype.kind == "f":
+            np.testing.assert_allclose(results[name], values, equal_nan=True)
+        else:
+            np.testing.assert_array_equal(results[name], values)
+
+def test_chunked_files_match_one_batch(tmp_path):
+    results = analyze_to_memmap(FLEET, tmp_path / "results", chunk_size=2, as_of=2025)
+    assert_same(results, analyze_batch(FLEET, as_of=2025))
+    assert (tmp_path / "results" / "tmin_pressure.bin").stat().st_size == 5 * 8
+    assert isinstance(results.raw("tmin_pressure"), np.memmap)
+    assert results.manifest["as_of_year"] == 2025
+
+def test_default_as_of_is_resolved_once(tmp_path, monkeypatch):
+    """Every chunk is projected to the as-of year stored in the manifest, even if the date changes mid-run"""
+    from datetime import date, timedelta
+    import tmin.dates
+
+    class TickingDate(date):
+        calls = 0
+
+        @classmethod
+        def today(cls):
+            cls.calls += 1
+            day = date(2025, 1, 1) + timedelta(days=100 * cls.calls)
+            return cls(day.year, day.month, day.day)
+
+    monkeypatch.setattr(tmin.dates, "date", TickingDate)
+    results = analyze_to_memmap(FLEET, tmp_path, chunk_size=1)
+    as_of = results.manifest["as_of_year"]
+    assert_same(results, analyze_batch(FLEET, as_of=as_of))
+
+def test_reopen_is_zero_copy_and_read_only(tmp_path):
+    analyze_to_memmap(FLEET, tmp_path, chunk_size=3, as_of=2025)
+    results = open_results(tmp_path)
+    column = results["default_retirement_limit"]
+    assert isinstance(column, np.memmap)
+    assert not column.flags.writeable
+    assert list(results["governing_type"]) == list(analyze_batch(FLEET, as_of=2025)["governing_type"])
+
+def test_records_and_rejected_rows(tmp_path):
+    fleet = dict(FLEET, nps=["2", "6", "7", "2", "4"])
+    records = ({name: values[i] for name, values in fleet.items()} for i in range(5))
+    results = analyze_to_memmap(records, tmp_path, chunk_size=2, as_of=2025, errors="reject")
+    assert_same(results, analyze_batch(fleet, as_of=2025, errors="reject"))
+    assert results["governing_type"][2] == ""
+
+def test_chunks_cover_all_rows(tmp_path):
+    results = analyze_to_memmap(FLEET, tmp_path, as_of=2025)
+    chunks = list(results.chunks(chunk_size=2))
+    assert [rows for rows, _ in chunks] == [slice(0, 2), slice(2, 4), slice(4, 5)]
+    np.testing.assert_allclose(np.concatenate([chunk["tmin_pressure"] for _, chunk in chunks]),
+                               results["tmin_pressure"])
+
+def test_projection_reopens_in_date_by_row_layout(tmp_path):
+    dates = [2024, 2026, "2030-06-30"]
+    results = project_to_memmap(FLEET, dates, tmp_path, chunk_size=2)
+    expected = project_batch(FLEET, dates)
+    assert results["actual_thickness"].shape == (3, 5)
+    assert_same(results, expected)
+
+def test_invalid_chunk_size(tmp_path):
+    with pytest.raises(ValueError):
+        analyze_to_memmap(FLEET, tmp_path, chunk_size=0)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
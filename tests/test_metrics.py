@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prometheus-style metrics registry
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import urllib.request
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch
+from tmin.aio import report_many_async
+from tmin.metrics import METRICS, Histogram
+from tmin.profiling import PROFILER
+
+FLEET = {
+    "schedule": ["40", "80", "40", "40"], "nps": ["2", "4", "2", "7"], "pressure": 50.0, "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS", "allowable_stress": 23333.0,
+    "measured_thickness": [0.06, 0.2, 0.07, 0.1], "design_temp": 900, "year_inspected": 2023,
+}
+
+@pytest.fixture
+def metrics():
+    METRICS.reset()
+    METRICS.enable()
+    yield METRICS
+    METRICS.disable()
+    METRICS.reset()
+
+def test_nothing_is_recorded_while_disabled():
+    METRICS.reset()
+    analyze_batch({**FLEET, "nps": ["2", "4", "2", "3"]}, as_of=date(2025, 1, 1))
+    assert METRICS.pipes_analyzed.value(source="batch") == 0
+    assert not PROFILER.active
+
+def test_batch_throughput_rejects_and_lookups(metrics):
+    results = analyze_batch(FLEET, as_of=date(2025, 1, 1), errors="reject")
+    assert results["valid"].tolist() == [True, True, True, False]
+
+    assert metrics.pipes_analyzed.value(source="batch") == 3
+    assert metrics.analysis_seconds.value(source="batch") > 0
+    assert metrics.pipes_per_second.value() > 0
+    assert metrics.validation_rows.value() == 4
+    assert metrics.validation_rejected.value() == 1
+    assert metrics.validation_errors.value(column="nps") >= 1
+    # design_temp resolves once for four rows
+    assert metrics.lookups.value() >= 4
+    assert 0 < metrics.lookup_hit_ratio.value() < 1
+    assert metrics.stage_seconds.count(stage="batch.analyze") == 1
+
+def test_errors_are_counted(metrics):
+    with pytest.raises(ValueError):
+        analyze_batch(FLEET, as_of=date(2025, 1, 1))
+    assert metrics.errors.value(source="batch") == 1
+
+def test_render_is_prometheus_text_format(metrics):
+    analyze_batch(FLEET, as_of=date(2025, 1, 1), errors="reject")
+    text = metrics.render()
+    assert "# TYPE tmin_pipes_analyzed_total counter" in text
+    assert 'tmin_pipes_analyzed_total{source="batch"} 3' in text
+    assert "# TYPE tmin_stage_duration_seconds histogram" in text
+    assert 'tmin_stage_duration_seconds_bucket{stage="batch.analyze",le="+Inf"} 1' in text
+    assert "tmin_worker_busy_seconds_total 0" in text
+    assert text.endswith("\n")
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency", ["kind"], buckets=[0.1, 1.0])
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, kind='a"b')
+    assert histogram.samples() == [
+        'latency_seconds_bucket{kind="a\\"b",le="0.1"} 1',
+        'latency_seconds_bucket{kind="a\\"b",le="1"} 2',
+        'latency_seconds_bucket{kind="a\\"b",le="+Inf"} 3',
+        'latency_seconds_sum{kind="a\\"b"} 5.55',
+        'latency_seconds_count{kind="a\\"b"} 3',
+    ]
+    with pytest.raises(ValueError):
+        histogram.observe(1.0)
+
+def test_write_textfile_and_serve(metrics, tmp_path):
+    analyze_batch(FLEET, as_of=date(2025, 1, 1), errors="reject")
+    path = metrics.write_textfile(str(tmp_path / "tmin.prom"))
+    with open(path) as f:
+        assert 'tmin_pipes_analyzed_total{source="batch"} 3' in f.read()
+    assert os.listdir(tmp_path) == ["tmin.prom"]
+
+    server = metrics.serve(port=0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert 'tmin_pipes_analyzed_total{source="batch"} 3' in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{host}:{port}/other")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_report_render_latency_and_worker_utilization(metrics, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150,
+                metallurgy="Intermediate/Low CS", allowable_stress=23333.0)
+    asyncio.run(report_many_async([(pipe, 0.06), (pipe, 0.07)], concurrency=2))
+
+    assert metrics.pipes_analyzed.value(source="pipe") == 2
+    assert metrics.stage_seconds.count(stage="pipe.report") == 2
+    assert metrics.stage_seconds.count(stage="plot.savefig") == 4
+    assert metrics.worker_busy_seconds.value() > 0
+    assert 0 < metrics.worker_utilization.value() <= 1
+    assert metrics.workers_busy.value() == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the stage timers and profile dumps
+"""
+
+import pytest
+import sys
+import os
+import json
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch
+from tmin.profiling import PROFILER, profile, stage
+
+FLEET = {
+    "schedule": ["40", "80"], "nps": ["2", "4"], "pressure": [50.0, 300.0], "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS", "allowable_stress": 23333.0, "measured_thickness": [0.06, 0.2],
+    "corrosion_rate": 10.0, "year_inspected": 2023,
+}
+
+def test_stages_are_not_recorded_unless_profiling():
+    PROFILER.reset()
+    with stage("test.disabled"):
+        pass
+    analyze_batch(FLEET, as_of=date(2025, 1, 1))
+    assert PROFILER.calls == {}
+    assert PROFILER.events == []
+
+def test_profile_records_stage_counts_and_nesting():
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150,
+                metallurgy="Intermediate/Low CS", allowable_stress=23333.0, corrosion_rate=10.0)
+    with profile(cprofile=False) as profiler:
+        pipe.analysis(0.06, 2023, as_of=date(2025, 1, 1))
+        pipe.analysis(0.07, 2023, as_of=date(2025, 1, 1))
+        analyze_batch(FLEET, as_of=date(2025, 1, 1))
+    assert not PROFILER.enabled
+    assert profiler.calls["pipe.analysis"] == 2
+    assert profiler.calls["pipe.tmin_pressure"] == 2
+    for name in ("batch.analyze", "batch.lookup", "batch.project", "batch.results"):
+        assert profiler.calls[name] == 1
+    # Nested stages never take longer than the stage around them
+    assert profiler.seconds["batch.lookup"] <= profiler.seconds["batch.analyze"]
+    assert profiler.seconds["batch.analyze"] <= profiler.wall_time()
+
+    summary = profiler.summary()
+    assert summary.splitlines()[0].startswith("Stage")
+    assert "pipe.analysis" in summary and "Wall time" in summary
+
+def test_profile_writes_cprofile_and_chrome_trace(tmp_path):
+    with profile(str(tmp_path / "prof")):
+        analyze_batch(FLEET, as_of=date(2025, 1, 1))
+
+    assert (tmp_path / "prof" / "tmin.prof").stat().st_size > 0
+    with open(tmp_path / "prof" / "tmin_trace.json") as f:
+        trace = json.load(f)
+    events = {event["name"]: event for event in trace["traceEvents"]}
+    assert {"batch.analyze", "batch.lookup"} <= set(events)
+    outer, inner = events["batch.analyze"], events["batch.lookup"]
+    assert outer["ph"] == "X" and outer["cat"] == "batch"
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+def test_profile_times_report_and_plot_writes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150,
+                metallurgy="Intermediate/Low CS", allowable_stress=23333.0)
+    with profile(cprofile=False) as profiler:
+        pipe.report(0.06)
+    assert profiler.calls["io.write"] == 3
+    assert profiler.calls["plot.savefig"] == 2
+    assert profiler.calls["report.generate"] == 1
+    assert profiler.calls["pipe.report"] == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__])
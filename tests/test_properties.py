@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Property-based differential tests: the batch engine against PIPE.analysis
+
+Hypothesis draws fleets of random pipe configurations from the keys of the
+asmetables lookup tables. Every row validate_batch accepts must match the
+scalar PIPE.analysis result, and every row it rejects must make the scalar
+path raise.
+"""
+
+import pytest
+import sys
+import os
+import contextlib
+import io
+import numpy as np
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import JOINT_TYPES, PIPE_CONFIGS, RESULT_COLUMNS, analyze_batch, project_batch
+from tmin.asmetables.materials import MATERIAL_NAMES
+from tmin.asmetables.pipe_dimensions import nominal_wall, pipe_schedules
+from tmin.editions import PRESSURE_CLASSES
+
+AS_OF = 2025.5
+
+NPS_BY_SCHEDULE = {schedule: [nps for nps, walls in nominal_wall.items() if schedule in walls]
+                   for schedule in pipe_schedules}
+DESIGN_TEMPS = ["<900", 900, 950, 1000, 1050, 1100, 1150, 1200, 1250, "1250+"]
+
+def optional(strategy):
+    return st.none() | strategy
+
+def pipe_rows():
+    """One fleet row: table keys for the categorical fields, plausible ranges for the numeric ones"""
+    return st.sampled_from(pipe_schedules).flatmap(lambda schedule: st.fixed_dictionaries({
+        "schedule": st.just(schedule),
+        "nps": st.sampled_from(NPS_BY_SCHEDULE[schedule]),
+        "pressure": st.floats(0, 3000),
+        "pressure_class": st.sampled_from(PRESSURE_CLASSES),
+        "metallurgy": st.sampled_from(MATERIAL_NAMES),
+        "allowable_stress": optional(st.floats(5000, 40000)),
+        "design_temp": st.sampled_from(DESIGN_TEMPS),
+        "pipe_config": st.sampled_from(PIPE_CONFIGS),
+        "corrosion_rate": optional(st.floats(0, 50)),
+        "default_retirement_limit": optional(st.floats(0.01, 0.5)),
+        "API_table": st.sampled_from(["2025", "2009"]),
+        "joint_type": st.sampled_from(JOINT_TYPES),
+        "measured_thickness": st.floats(0.01, 3.0),
+        # Past the as-of date too: future inspections are rejected only when a corrosion rate is set
+        "year_inspected": optional(st.floats(1990, AS_OF + 10)),
+    }))
+
+fleets = st.lists(pipe_rows(), min_size=1, max_size=12)
+
+def to_fleet(rows):
+    return {name: [row[name] for row in rows] for name in rows[0]}
+
+def scalar_analysis(row):
+    """PIPE.analysis for one row, None when the scalar path rejects the configuration"""
+    fields = {name: row[name] for name in PIPE.__dataclass_fields__}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return PIPE(**fields).analysis(row["measured_thickness"], row["year_inspected"], row["joint_type"],
+                                           as_of=AS_OF)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+@settings(max_examples=150, deadline=None)
+@given(fleets)
+def test_batch_matches_scalar_analysis(rows):
+    results = analyze_batch(to_fleet(rows), as_of=AS_OF, errors="reject")
+    for i, row in enumerate(rows):
+        expected = scalar_analysis(row)
+        assert results["valid"][i] == (expected is not None), row
+        if expected is None:
+            continue
+        for key in RESULT_COLUMNS:
+            value = expected[key]
+            if key == "governing_type":
+                assert results[key][i] == value
+            elif key == "year_inspected":
+                assert results[key][i] == pytest.approx(np.nan if value is None else value, nan_ok=True)
+            elif value is None:
+                assert np.isnan(results[key][i]), key
+            else:
+                assert results[key][i] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+@settings(max_examples=75, deadline=None)
+@given(fleets, st.randoms(use_true_random=False))
+def test_rows_are_independent(rows, random):
+    """Shuffling the fleet shuffles the results and nothing else"""
+    order = list(range(len(rows)))
+    random.shuffle(order)
+    results = analyze_batch(to_fleet(rows), as_of=AS_OF, errors="reject")
+    shuffled = analyze_batch(to_fleet([rows[i] for i in order]), as_of=AS_OF, errors="reject")
+    for key in RESULT_COLUMNS + ["valid"]:
+        np.testing.assert_array_equal(np.asarray(results[key])[order], shuffled[key])
+
+@settings(max_examples=75, deadline=None)
+@given(pipe_rows(), st.lists(st.floats(AS_OF, AS_OF + 50), min_size=2, max_size=6, unique=True))
+def test_projection_never_thickens(row, dates):
+    """Projected thickness is non-increasing in time and the limits do not depend on the date"""
+    row = dict(row, year_inspected=2020.0)
+    if scalar_analysis(row) is None:
+        return
+    dates = sorted(dates)
+    projection = project_batch(to_fleet([row]), dates)
+    assert np.all(np.diff(projection["actual_thickness"][:, 0]) <= 0)
+    single = analyze_batch(to_fleet([row]), as_of=dates[-1])
+    assert projection["actual_thickness"][-1, 0] == pytest.approx(single["actual_thickness"][0])
+    assert projection["governing_thickness"][0] == max(single["tmin_pressure"][0], single["tmin_structural"][0])
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk report rendering
+"""
+
+import pytest
+import sys
+import os
+import tarfile
+import zipfile
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch, fleet_from_pipes
+from tmin.report_generator import ReportGenerator
+
+PIPES = [
+    PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+         allowable_stress=23333.0, corrosion_rate=10.0, default_retirement_limit=0.050),
+    PIPE(schedule="80", nps="6", pressure=600.0, pressure_class=600, metallurgy="SS 316/316L",
+         allowable_stress=20000.0, design_temp=1000),
+    PIPE(schedule="40", nps="3", pressure=75.0, pressure_class=300, metallurgy="Intermediate/Low CS",
+         allowable_stress=23333.0, corrosion_rate=15.0, default_retirement_limit=0.080),
+]
+MEASURED = [0.060, 0.400, 0.120]
+
+def without_ids(text):
+    return [line for line in text.splitlines() if not line.startswith(("Analysis ID:", "Report Generated:"))]
+
+def test_bulk_reports_match_single_reports(tmp_path, monkeypatch):
+    """The compiled template renders the same report text as generate_report"""
+    monkeypatch.chdir(tmp_path)
+    fleet = fleet_from_pipes(PIPES, MEASURED, year_inspected=2022)
+    fleet["cml"] = ["CML-1", "CML-2", "CML-3"]
+    generator = ReportGenerator()
+    bulk = dict(generator.render_batch_reports(fleet, analyze_batch(fleet, as_of=2025)))
+    assert list(bulk) == ["CML-1", "CML-2", "CML-3"]
+    for pipe, measured, name in zip(PIPES, MEASURED, fleet["cml"]):
+        results = pipe.analysis(measured, 2022, as_of=2025)
+        with open(generator.generate_report(pipe, results, results["actual_thickness"])) as f:
+            assert without_ids(bulk[name]) == without_ids(f.read())
+
+def test_bulk_reports_print_inspection_dates_as_given(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    inspected = ["2022-06-30", date(2023, 1, 1), 2022]
+    fleet = fleet_from_pipes(PIPES, MEASURED, year_inspected=inspected)
+    generator = ReportGenerator()
+    bulk = [text for _, text in generator.render_batch_reports(fleet, analyze_batch(fleet, as_of=2025))]
+    for pipe, measured, year, text in zip(PIPES, MEASURED, inspected, bulk):
+        results = pipe.analysis(measured, year, as_of=2025)
+        with open(generator.generate_report(pipe, results, results["actual_thickness"])) as f:
+            assert without_ids(text) == without_ids(f.read())
+    assert [line for text in bulk for line in text.splitlines() if line.startswith("Inspection Year")] == [
+        "Inspection Year: 2022-06-30", "Inspection Year: 2023-01-01", "Inspection Year: 2022"]
+
+def test_write_batch_reports_archives(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fleet = fleet_from_pipes(PIPES, MEASURED, year_inspected=2022)
+    fleet["schedule"] = ["40", "bogus", "40"]
+    results = analyze_batch(fleet, as_of=2025, errors="reject")
+    generator = ReportGenerator()
+
+    with zipfile.ZipFile(generator.write_batch_reports(fleet, results)) as zf:
+        assert zf.namelist() == ["TMIN_report_0.txt", "TMIN_report_2.txt"]
+    with tarfile.open(generator.write_batch_reports(fleet, results, archive="tar")) as tf:
+        assert tf.getnames() == ["TMIN_report_0.txt", "TMIN_report_2.txt"]
+    with open(generator.write_batch_reports(fleet, results, archive="txt")) as f:
+        assert f.read().count("TMIN - PIPE THICKNESS ANALYSIS REPORT") == 2
+    with pytest.raises(ValueError, match="archive must be"):
+        generator.write_batch_reports(fleet, results, archive="rar")
+
+def test_archive_members_stay_inside_the_archive(tmp_path, monkeypatch):
+    """CML names with path separators cannot name members outside the extraction directory"""
+    monkeypatch.chdir(tmp_path)
+    fleet = fleet_from_pipes(PIPES, MEASURED, year_inspected=2022)
+    fleet["cml"] = ["../../evil", "/etc/passwd", "U1 CML-3"]
+    results = analyze_batch(fleet, as_of=2025)
+    generator = ReportGenerator()
+
+    expected = ["TMIN_report_______evil.txt", "TMIN_report__etc_passwd.txt", "TMIN_report_U1_CML-3.txt"]
+    with zipfile.ZipFile(generator.write_batch_reports(fleet, results)) as zf:
+        assert zf.namelist() == expected
+    with tarfile.open(generator.write_batch_reports(fleet, results, archive="tar")) as tf:
+        assert tf.getnames() == expected
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for severity-first report scheduling
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch
+from tmin.scheduler import SEVERITY_LABELS, iter_prioritized_reports, priority_order, severity
+
+FLEET = {
+    "cml": ["A", "B", "C", "D", "E"],
+    "schedule": ["40", "80", "40", "40", "80"],
+    "nps": ["2", "6", "3", "2", "4"],
+    "pressure": [50.0, 600.0, 75.0, 50.0, 300.0],
+    "pressure_class": [150, 600, 300, 150, 300],
+    "metallurgy": ["Intermediate/Low CS", "SS 316/316L", "Intermediate/Low CS", "Intermediate/Low CS",
+                   "Intermediate/Low CS"],
+    "allowable_stress": [23333.0, 20000.0, 23333.0, None, 23333.0],
+    "measured_thickness": [0.060, 0.400, 0.120, 0.150, 0.300],
+    "corrosion_rate": [10.0, None, 15.0, 5.0, 2.0],
+    "year_inspected": [2022, None, 2022, 2020, 2021],
+}
+
+def expected_order(results):
+    """Reference ordering: tier, then remaining life (unknown last), then row"""
+    tiers = severity(results)
+    life = [np.inf if np.isnan(v) else v for v in results["life_span"]]
+    return sorted(range(len(tiers)), key=lambda row: (tiers[row], life[row], row))
+
+def test_priority_order():
+    results = analyze_batch(FLEET, as_of=2025)
+    assert priority_order(results).tolist() == expected_order(results)
+    tiers = severity(results)
+    assert set(tiers.tolist()) <= {0, 1, 2}
+    assert tiers[0] < 2  # 0.060" of 2" sch 40 at 10 mpy is below its limits by 2025
+
+def test_rejected_rows_are_skipped():
+    fleet = dict(FLEET, nps=["2", "6", "7", "2", "4"])
+    results = analyze_batch(fleet, as_of=2025, errors="reject")
+    assert 2 not in priority_order(results).tolist()
+
+def test_reports_stream_in_priority_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = analyze_batch(FLEET, as_of=2025)
+    reports = list(iter_prioritized_reports(FLEET, as_of=2025, reports_dir="out", plots=False))
+    assert [r.row for r in reports] == expected_order(results)
+    assert [r.rank for r in reports] == list(range(5))
+    first = reports[0]
+    assert first.severity == SEVERITY_LABELS[severity(results)[first.row]]
+    with open(first.files["full_report"]) as f:
+        assert "Analysis ID: TMIN_" in f.read()
+    assert os.path.basename(first.files["full_report"]) == f"TMIN_report_{first.name}.txt"
+
+def test_cml_names_cannot_leave_reports_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fleet = {name: values[:2] for name, values in FLEET.items()}
+    fleet["cml"] = ["../../escaped", "/tmp/absolute"]
+    reports = list(iter_prioritized_reports(fleet, as_of=2025, reports_dir="out", plots=False))
+    assert sorted(os.listdir(tmp_path / "out")) == ["TMIN_report_______escaped.txt", "TMIN_report__tmp_absolute.txt"]
+    assert {r.name for r in reports} == {"../../escaped", "/tmp/absolute"}
+
+def test_colliding_cml_names_get_distinct_files(tmp_path, monkeypatch):
+    """CMLs that sanitize to the same name still get one report and one set of plots each"""
+    monkeypatch.chdir(tmp_path)
+    fleet = {name: values[:3] for name, values in FLEET.items()}
+    fleet["cml"] = ["CML_1", "CML/1", "CML 1"]
+    reports = list(iter_prioritized_reports(fleet, as_of=2025, reports_dir="out"))
+    files = [path for report in reports for path in report.files.values()]
+    assert len(set(files)) == len(files) == 9
+    assert sorted(os.listdir(tmp_path / "out")) == sorted(os.path.basename(path) for path in files)
+    by_row = {report.row: os.path.basename(report.files["full_report"]) for report in reports}
+    assert by_row == {0: "TMIN_report_CML_1.txt", 1: "TMIN_report_CML_1_1.txt", 2: "TMIN_report_CML_1_2.txt"}
+
+def test_plots_in_thread_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fleet = {name: values[:3] for name, values in FLEET.items()}
+    with ThreadPoolExecutor(2) as pool:
+        reports = list(iter_prioritized_reports(fleet, as_of=2025, reports_dir="out", executor=pool, window=1))
+    # A window of one renders strictly in priority order
+    assert [r.row for r in reports] == [0, 2, 1]
+    for report in reports:
+        assert os.path.exists(report.files["number_line_plot"])
+        assert os.path.exists(report.files["comparison_chart"])
+
+def test_invalid_window():
+    with pytest.raises(ValueError):
+        next(iter_prioritized_reports(FLEET, window=0))
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite inspection history store
+"""
+
+import pytest
+import sys
+import os
+import time
+import numpy as np
+from datetime import date
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch
+from tmin.store import InspectionStore
+
+AS_OF = date(2025, 1, 1)
+
+FLEET = {
+    "cml": ["A-1", "A-1", "A-2", "B-1", "B-2"],
+    "circuit": ["A", "A", "A", "B", "B"],
+    "schedule": ["40", "40", "80", "40", "40"],
+    "nps": ["2", "2", "4", "2", "7"],
+    "pressure": 50.0, "pressure_class": 150, "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333.0,
+    "corrosion_rate": [10.0, 10.0, 2.0, None, 5.0],
+    "measured_thickness": [0.070, 0.062, 0.300, 0.100, 0.200],
+    "year_inspected": [2019, "2023-07-02", 2022, 2024, 2024],
+}
+
+@pytest.fixture
+def store():
+    with InspectionStore() as store:
+        store.ingest(FLEET)
+        yield store
+
+def test_ingest_keeps_one_pipe_per_cml_and_every_reading(store):
+    assert store.conn.execute("SELECT COUNT(*) FROM pipes").fetchone()[0] == 4
+    assert store.conn.execute("SELECT COUNT(*) FROM readings").fetchone()[0] == 5
+    history = store.readings(cmls=["A-1"])
+    assert history["measured_thickness"].tolist() == [0.070, 0.062]
+    assert history["year_inspected"][1] == pytest.approx(2023.5, abs=0.01)
+    assert store.readings(since=2024)["cml"].tolist() == ["B-1", "B-2"]
+
+def test_latest_readings_feed_analyze_batch(store):
+    fleet = store.latest_readings()
+    assert fleet["cml"].tolist() == ["A-1", "A-2", "B-1", "B-2"]
+    assert fleet["measured_thickness"].tolist() == [0.062, 0.300, 0.100, 0.200]
+    assert np.isnan(fleet["corrosion_rate"][2])
+    assert store.latest_readings(circuit="B")["cml"].tolist() == ["B-1", "B-2"]
+
+    results = analyze_batch(fleet, as_of=AS_OF, errors="reject")
+    assert results["valid"].tolist() == [True, True, True, False]
+
+def test_analyze_stores_results_and_retirement_dates(store):
+    analysis = store.analyze(as_of=AS_OF)
+    results = analysis["results"]
+    stored = store.conn.execute("SELECT cml, actual_thickness, governing_type FROM results ORDER BY cml").fetchall()
+    assert [row[0] for row in stored] == ["A-1", "A-2", "B-1"]
+    assert stored[0][1] == pytest.approx(results["actual_thickness"][0])
+
+    # A-1 is already below its structural limit, A-2 has decades left, B-1 has no corrosion rate
+    assert store.retiring_before(2026)["cml"].tolist() == ["A-1"]
+    later = store.retiring_before(2200)
+    assert later["cml"].tolist() == ["A-1", "A-2"]
+    margin = results["actual_thickness"][1] - results["governing_thickness"][1]
+    assert later["retirement_year"][1] == pytest.approx(2025 + margin * 1000 / 2.0)
+    assert store.retiring_before(2200, circuit="B")["cml"].tolist() == []
+
+    # A new reading replaces the stored analysis of its CML
+    store.add_readings(["A-2"], [0.05], ["2024-06-30"])
+    store.analyze(as_of=AS_OF, cmls=["A-2"])
+    assert store.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 3
+    assert store.retiring_before(2026)["cml"].tolist() == ["A-1", "A-2"]
+
+def test_default_as_of_is_resolved_once(store, monkeypatch):
+    """Results are stored under the as-of they were projected to, even if the date changes mid-run"""
+    from datetime import timedelta
+    import tmin.dates
+
+    class TickingDate(date):
+        calls = 0
+
+        @classmethod
+        def today(cls):
+            cls.calls += 1
+            day = date(2025, 1, 1) + timedelta(days=100 * cls.calls)
+            return cls(day.year, day.month, day.day)
+
+    monkeypatch.setattr(tmin.dates, "date", TickingDate)
+    analysis = store.analyze()
+    stored = store.conn.execute("SELECT as_of, actual_thickness FROM results ORDER BY cml").fetchall()
+    expected = analyze_batch(analysis["fleet"], as_of=stored[0][0], errors="reject")
+    assert len({row[0] for row in stored}) == 1
+    np.testing.assert_allclose([row[1] for row in stored], expected["actual_thickness"][expected["valid"]])
+    np.testing.assert_allclose(analysis["results"]["actual_thickness"], expected["actual_thickness"], equal_nan=True)
+
+def test_queries_use_indexes(store):
+    def plan(query, *params):
+        return " ".join(row[-1] for row in store.conn.execute("EXPLAIN QUERY PLAN " + query, params))
+    latest = plan("SELECT id FROM readings WHERE cml = ? ORDER BY year_inspected DESC, id DESC LIMIT 1", "A-1")
+    assert "readings_cml_date" in latest and "TEMP B-TREE" not in latest
+    assert "results_retirement" in plan("SELECT cml FROM results WHERE retirement_year < ?", 2030.0)
+    assert "pipes_circuit" in plan("SELECT cml FROM pipes WHERE circuit = ?", "A")
+
+def test_bulk_ingest_and_latest_query_scale(tmp_path):
+    n = 200_000
+    cml = np.char.add("CML-", (np.arange(n) % 50_000).astype(str))
+    fleet = {"cml": cml, "circuit": np.char.add("C-", (np.arange(n) % 100).astype(str)),
+             "schedule": "40", "nps": "2", "pressure": 50.0, "pressure_class": 150,
+             "metallurgy": "Intermediate/Low CS", "allowable_stress": 23333.0, "corrosion_rate": 5.0,
+             "measured_thickness": np.linspace(0.1, 0.15, n), "year_inspected": 2000 + np.arange(n) // 50_000}
+    with InspectionStore(tmp_path / "history.db") as store:
+        assert store.ingest(fleet) == n
+        start = time.perf_counter()
+        latest = store.latest_readings()
+        elapsed = time.perf_counter() - start
+        assert len(latest["cml"]) == 50_000
+        assert (latest["year_inspected"] == 2003).all()
+        assert elapsed < 2.0
+        start = time.perf_counter()
+        assert len(store.latest_readings(circuit="C-7")["cml"]) == 500
+        assert time.perf_counter() - start < 0.5
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming analysis over iterables of records
+"""
+
+import pytest
+import sys
+import os
+import csv
+import io
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch
+from tmin.streaming import iter_analyze, iter_results
+
+FLEET = {
+    "schedule": ["40", "80", "40", "40", "80"],
+    "nps": ["2", "6", "3", "2", "4"],
+    "pressure": [50.0, 600.0, 75.0, 50.0, 300.0],
+    "pressure_class": [150, 600, 300, 150, 300],
+    "metallurgy": ["Intermediate/Low CS", "SS 316/316L", "Intermediate/Low CS", "Intermediate/Low CS",
+                   "Intermediate/Low CS"],
+    "allowable_stress": [23333.0, 20000.0, 23333.0, None, 23333.0],
+    "measured_thickness": [0.060, 0.400, 0.120, 0.150, 0.300],
+    "corrosion_rate": [10.0, None, 15.0, 5.0, 2.0],
+    "year_inspected": [2022, None, 2022, 2020, 2021],
+}
+
+def records():
+    """Dict records, produced lazily"""
+    for i in range(5):
+        yield {name: values[i] for name, values in FLEET.items()}
+
+def test_chunks_match_one_batch():
+    expected = analyze_batch(FLEET, as_of=2025)
+    chunks = list(iter_analyze(records(), chunk_size=2, as_of=2025))
+    assert [len(fleet["nps"]) for fleet, _ in chunks] == [2, 2, 1]
+    for key in ("actual_thickness", "tmin_pressure", "life_span", "governing_type"):
+        np.testing.assert_array_equal(np.concatenate([results[key] for _, results in chunks]), expected[key])
+
+def test_tuple_and_csv_records():
+    """Tuples follow the column order; csv.reader strings and empty fields are accepted"""
+    columns = list(FLEET)
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(zip(*[["" if v is None else v for v in FLEET[name]] for name in columns]))
+    buffer.seek(0)
+    rows = list(iter_results(csv.reader(buffer), chunk_size=3, columns=columns, as_of=2025))
+    expected = analyze_batch(FLEET, as_of=2025)
+    assert [row["nps"] for row in rows] == FLEET["nps"]
+    assert [row["actual_thickness"] for row in rows] == pytest.approx(expected["actual_thickness"].tolist())
+    assert rows[1]["life_span"] is None
+
+    tuples = [tuple(FLEET[name][i] for name in columns) for i in range(5)]
+    assert len(list(iter_results(iter(tuples), columns=columns, as_of=2025))) == 5
+    with pytest.raises(ValueError, match="at most"):
+        next(iter_analyze([tuple(range(20))]))
+
+def test_generator_is_lazy():
+    consumed = []
+    def source():
+        for record in records():
+            consumed.append(record)
+            yield record
+    stream = iter_analyze(source(), chunk_size=2, as_of=2025)
+    assert consumed == []
+    next(stream)
+    assert len(consumed) == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the binary table cache
+"""
+
+import pytest
+import sys
+import os
+import json
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin import tablecache
+
+def test_shipped_cache_is_current():
+    """The cache shipped in the package matches the table sources (run tmin-build-tables if not)"""
+    cached = tablecache.read_cache()
+    assert cached is not None, "table cache is stale, rebuild it with tmin-build-tables"
+    compiled = tablecache.compile_tables()
+    assert sorted(cached) == sorted(compiled)
+    for name, array in compiled.items():
+        np.testing.assert_array_equal(cached[name], array)
+
+def test_build_writes_memory_mapped_tables(tmp_path):
+    """Built tables are read back as read-only memory maps"""
+    tablecache.build(tmp_path)
+    tables = tablecache.read_cache(tmp_path)
+    assert isinstance(tables["E"], np.memmap)
+    assert not tables["E"].flags.writeable
+    assert tables["joint_types"].tolist()[0] == "Seamless"
+
+def test_stale_cache_is_ignored(tmp_path):
+    """A cache built from different table sources is not used"""
+    tablecache.build(tmp_path)
+    manifest_path = tmp_path / tablecache.MANIFEST
+    manifest = json.loads(manifest_path.read_text())
+    manifest["fingerprint"] = "0" * 64
+    manifest_path.write_text(json.dumps(manifest))
+    assert tablecache.read_cache(tmp_path) is None
+    assert tablecache.read_cache(tmp_path / "missing") is None
+
+def _worker_table_dir():
+    return os.path.dirname(tablecache.load_tables()["E"].filename)
+
+def test_workers_map_shared_tables(tmp_path, monkeypatch):
+    """With a stale shipped cache, share_tables builds one private cache that spawned workers map"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    monkeypatch.delenv(tablecache.SHARED_DIR_ENV, raising=False)
+    monkeypatch.setattr(tablecache, "TABLE_DIR", tmp_path / "missing")
+    directory = tablecache.share_tables()
+    assert directory.name.startswith("tmin-tables-")
+    assert os.environ[tablecache.SHARED_DIR_ENV] == str(directory)
+    assert tablecache.share_tables() == directory
+
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=tablecache.attach_tables) as executor:
+        worker_dirs = {executor.submit(_worker_table_dir).result() for _ in range(2)}
+    assert worker_dirs == {str(directory)}
+
+if __name__ == "__main__":
+    pytest.main([__file__])
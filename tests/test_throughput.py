@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Throughput guards for the batch engine
+
+A per-row Python fallback still gives correct answers, so these tests
+check the work instead: scalar PIPE lookups must run once per distinct
+configuration rather than once per row, and a vectorized batch must be much
+faster per row than PIPE.analysis on the same machine.
+"""
+
+import pytest
+import sys
+import os
+import contextlib
+import io
+import time
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.core import PIPE
+from tmin.batch import analyze_batch, project_batch
+from tmin.validation import validate_batch
+
+def large_fleet(n, seed=0):
+    """n rows drawn from a handful of configurations, with per-row readings"""
+    rng = np.random.default_rng(seed)
+    return {
+        "schedule": rng.choice(["40", "80"], n),
+        "nps": rng.choice(["2", "3", "4", "6"], n),
+        "pressure": rng.uniform(0, 500, n),
+        "pressure_class": rng.choice([150, 300, 600], n),
+        "metallurgy": rng.choice(["Intermediate/Low CS", "SS 316/316L"], n),
+        "allowable_stress": 20000.0,
+        "design_temp": rng.choice(["900", "1000"], n),
+        "pipe_config": rng.choice(["straight", "90LR - Inner Elbow", "90LR - Outer Elbow"], n),
+        "joint_type": rng.choice(["Seamless", "ERW"], n),
+        "measured_thickness": rng.uniform(0.1, 0.3, n),
+        "corrosion_rate": rng.uniform(0, 10, n),
+        "year_inspected": 2020.0,
+    }
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+@pytest.fixture
+def pipe_calls(monkeypatch):
+    """Count calls of the scalar PIPE methods the batch engine may use for lookups"""
+    calls = {"count": 0}
+    for name in ("round_temp", "get_radii", "get_Y_coefficient", "get_allowable_stress", "tmin_pressure",
+                 "tmin_structural", "analysis", "_convert_nps_to_table_key", "_convert_nps_to_float"):
+        method = getattr(PIPE, name)
+
+        def counted(*args, _method=method, **kwargs):
+            calls["count"] += 1
+            return _method(*args, **kwargs)
+        monkeypatch.setattr(PIPE, name, counted)
+    return calls
+
+def test_scalar_lookups_scale_with_configurations_not_rows(pipe_calls):
+    small = analyze_batch(large_fleet(1000), as_of=2025)
+    small_calls = pipe_calls["count"]
+    pipe_calls["count"] = 0
+    large = analyze_batch(large_fleet(50000), as_of=2025)
+    assert len(large["governing_type"]) == 50000 and len(small["governing_type"]) == 1000
+    # Same distinct configurations, 50x the rows: lookups stay bounded by the configuration count
+    assert pipe_calls["count"] <= max(small_calls, 1) * 2
+    assert pipe_calls["count"] < 200
+
+def test_validation_and_projection_do_not_loop_over_rows(pipe_calls):
+    fleet = large_fleet(50000)
+    assert validate_batch(fleet, 2025).n_rejected == 0
+    project_batch(fleet, [2025, 2030, 2035])
+    assert pipe_calls["count"] < 200
+
+def test_batch_is_much_faster_per_row_than_scalar():
+    n = 100000
+    fleet = large_fleet(n)
+    analyze_batch(fleet, as_of=2025)
+    batch_per_row = best_time(lambda: analyze_batch(fleet, as_of=2025)) / n
+
+    pipe = PIPE("40", "2", 50.0, 150, "Intermediate/Low CS", 23333.0, corrosion_rate=5.0)
+
+    def scalar():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(200):
+                pipe.analysis(0.200, 2020, as_of=2025)
+    scalar_per_row = best_time(scalar) / 200
+    # Typically 20-30x; a per-row fallback would be no faster than the scalar path
+    assert batch_per_row * 5 < scalar_per_row
+
+if __name__ == "__main__":
+    pytest.main([__file__])
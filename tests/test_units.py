@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for metric unit systems at the batch engine boundary
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch, analyze_editions, project_batch
+from tmin.core import PIPE
+from tmin.memmap import analyze_to_memmap
+from tmin.report_generator import ReportGenerator
+from tmin.streaming import iter_analyze
+from tmin.units import LENGTH_RESULTS, UnitSystem, get_units
+
+FLEET = {
+    "schedule": "40",
+    "nps": ["2", "3"],
+    "pressure": 50.0,
+    "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333.0,
+    "corrosion_rate": [10.0, 2.0],
+    "default_retirement_limit": 0.050,
+    "year_inspected": 2020,
+    "measured_thickness": [0.060, 0.200],
+}
+
+# The same fleet in MPa, mm and mm/yr
+METRIC_FLEET = dict(FLEET, pressure=50.0 * 0.006894757293168361, allowable_stress=23333.0 * 0.006894757293168361,
+                    corrosion_rate=[10.0 * 0.0254, 2.0 * 0.0254], default_retirement_limit=0.050 * 25.4,
+                    measured_thickness=[0.060 * 25.4, 0.200 * 25.4])
+
+
+def test_metric_results_match_imperial():
+    """A metric fleet gives the imperial results with thicknesses in mm"""
+    imperial = analyze_batch(FLEET, as_of=2024)
+    metric = analyze_batch(METRIC_FLEET, as_of=2024, units="metric")
+    for name, values in imperial.items():
+        expected = values * 25.4 if name in LENGTH_RESULTS else values
+        if np.asarray(values).dtype.kind == "f":
+            np.testing.assert_allclose(metric[name], expected, rtol=1e-9, err_msg=name)
+        else:
+            np.testing.assert_array_equal(metric[name], expected, err_msg=name)
+
+    projected = project_batch(METRIC_FLEET, [2024, 2030], units="metric")
+    np.testing.assert_allclose(projected["actual_thickness"],
+                               project_batch(FLEET, [2024, 2030])["actual_thickness"] * 25.4, rtol=1e-9)
+
+
+def test_metric_units_through_every_batch_entry_point(tmp_path):
+    """Editions, streaming and memmap results take the same units argument as analyze_batch"""
+    expected = analyze_batch(METRIC_FLEET, as_of=2024, units="metric")
+    editions = analyze_editions(METRIC_FLEET, ["2025"], as_of=2024, units="metric")
+    records = [{name: values[i] if isinstance(values, list) else values for name, values in METRIC_FLEET.items()}
+               for i in range(2)]
+    (_, streamed), = iter_analyze(records, as_of=2024, units="metric")
+    stored = analyze_to_memmap(records, tmp_path, as_of=2024, units="metric")
+    assert stored.manifest["units"]["length"] == "mm"
+    for results in (editions["2025"], streamed, stored):
+        for name in LENGTH_RESULTS:
+            np.testing.assert_allclose(results[name], expected[name], rtol=1e-9, err_msg=name)
+
+
+def test_metric_report_text():
+    """Batch reports label pressures, thicknesses and rates in the fleet's units"""
+    results = analyze_batch(METRIC_FLEET, as_of=2024, units="metric")
+    name, text = next(ReportGenerator("metric").render_batch_reports(METRIC_FLEET, results, ["A", "B"]))
+    assert name == "A"
+    assert "MPa" in text and " mm" in text and "mm/yr" in text
+    assert "psi" not in text and "inches" not in text
+
+    assessment = ReportGenerator.assessment_columns(results, "metric")
+    assert assessment["api574_status"][0].endswith(" mm")
+
+
+def test_report_precision(tmp_path, monkeypatch):
+    """Thicknesses print to the unit system's precision in single-pipe and batch reports"""
+    monkeypatch.chdir(tmp_path)
+    results = analyze_batch(METRIC_FLEET, as_of=2024, units="metric")
+    _, default = next(ReportGenerator("metric").render_batch_reports(METRIC_FLEET, results, ["A", "B"]))
+    _, text = next(ReportGenerator(get_units("metric", precision=2)).render_batch_reports(METRIC_FLEET, results,
+                                                                                          ["A", "B"]))
+    assert "Measured Thickness: 1.5240 mm" in default
+    assert "Measured Thickness: 1.52 mm" in text
+    assert ReportGenerator.assessment_columns(results, get_units("metric", 1))["api574_status"][0].endswith(
+        f"by {results['api574_RL'][0] - results['actual_thickness'][0]:.1f} mm")
+
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+                allowable_stress=23333.0)
+    files = pipe.report(0.060, year_inspected=2020, as_of=2024, precision=2)
+    with open(files["full_report"]) as f:
+        assert "Measured Thickness: 0.06 inches" in f.read()
+    with open(files["summary_report"]) as f:
+        assert f"Actual Thickness: {files['analysis_results']['actual_thickness']:.2f} inches" in f.read()
+
+    with pytest.raises(ValueError, match="precision"):
+        get_units(precision=-1)
+
+
+def test_unknown_units():
+    with pytest.raises(ValueError, match="Unknown unit system"):
+        get_units("furlongs")
+    with pytest.raises(ValueError, match="Unknown unit 'ft'"):
+        UnitSystem(length="ft")
+    with pytest.raises(ValueError, match="Unknown unit system"):
+        analyze_batch(FLEET, units="cgs")
+
+
+def test_metric_number_line(tmp_path):
+    """Plots scale the pipe's table dimensions to mm and label the axis in mm"""
+    pytest.importorskip("matplotlib")
+    from tmin.visualization import ThicknessVisualizer
+
+    results = analyze_batch(METRIC_FLEET, as_of=2024, units="metric")
+    analysis_results = {name: float(values[0]) if np.asarray(values).dtype.kind == "f" else values[0]
+                        for name, values in results.items()}
+    visualizer = ThicknessVisualizer("metric")
+    visualizer.reports_dir = str(tmp_path)
+    pipe = PIPE(schedule="40", nps="2", pressure=50.0, pressure_class=150, metallurgy="Intermediate/Low CS",
+                allowable_stress=23333.0)
+    path = visualizer.create_thickness_number_line(pipe, analysis_results, analysis_results["actual_thickness"],
+                                                   filename="metric_number_line")
+    assert os.path.exists(path)
+    assert visualizer._suffix == " mm"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
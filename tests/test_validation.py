@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized batch input validation
+"""
+
+import pytest
+import sys
+import os
+import csv
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tmin.batch import analyze_batch
+from tmin.validation import validate_batch
+
+def make_fleet(**overrides):
+    fleet = {
+        "schedule": ["40", "40", "40", "40", "40"],
+        "nps": ["2", "3", "4", "6", "8"],
+        "pressure": 50.0,
+        "pressure_class": 150,
+        "metallurgy": "Intermediate/Low CS",
+        "allowable_stress": 23333.0,
+        "corrosion_rate": 10.0,
+        "year_inspected": 2023,
+        "measured_thickness": [0.150, 0.200, 0.220, 0.260, 0.300],
+    }
+    fleet.update(overrides)
+    return fleet
+
+def test_clean_fleet_has_no_rejects():
+    result = validate_batch(make_fleet())
+    assert result.valid.all()
+    assert result.n_rejected == 0
+
+def test_bad_rows_are_reported_not_raised():
+    """Each kind of bad row is caught by a vectorized check and reported against its column"""
+    fleet = make_fleet(
+        schedule=["40", "bogus", "40", "120", "40"],
+        nps=["2", "3", "4", "2", "8"],
+        pressure_class=[150, 150, 175, 150, 150],
+        year_inspected=[2023, 2023, 2023, 2023, 2030],
+    )
+    result = validate_batch(fleet)
+    np.testing.assert_array_equal(result.valid, [True, False, False, False, False])
+    reasons = set(zip(result.rows.tolist(), result.columns.tolist(), result.reasons.tolist()))
+    assert (1, "schedule", "unknown schedule") in reasons
+    assert (2, "pressure_class", "unknown pressure class") in reasons
+    assert (3, "nps", "NPS not available in schedule") in reasons
+    assert (4, "year_inspected", "inspection year in the future") in reasons
+    assert "1 of 5 rows accepted" in result.summary()
+
+def test_future_inspection_without_corrosion_rate_is_accepted():
+    """As in PIPE.analysis, a future inspection year only matters when a corrosion rate is set"""
+    result = validate_batch(make_fleet(year_inspected=2030, corrosion_rate=[10.0, None, None, None, None]),
+                            as_of=2025)
+    np.testing.assert_array_equal(result.valid, [False, True, True, True, True])
+
+def test_temperature_and_material_checks():
+    result = validate_batch(make_fleet(
+        design_temp=[900, 1500, 1050, 900, 900],
+        allowable_stress=[23333.0, 23333.0, None, 23333.0, 23333.0],
+        metallurgy=["Intermediate/Low CS"] * 4 + ["Unobtainium"],
+        measured_thickness=[0.150, 0.200, 0.220, -1.0, 0.300],
+    ))
+    np.testing.assert_array_equal(result.valid, [True, False, False, False, False])
+    reasons = dict(zip(result.rows.tolist(), result.reasons.tolist()))
+    assert reasons[1] == "design temperature out of range"
+    assert reasons[2] == "allowable stress missing and no material curve at design temperature"
+    assert reasons[3] == "missing or non-positive measured thickness"
+    assert reasons[4] == "unknown metallurgy"
+
+def test_reject_mode_analyzes_valid_rows(tmp_path):
+    fleet = make_fleet(schedule=["40", "bogus", "40", "40", "40"], pressure="n/a")
+    with pytest.raises(ValueError):
+        analyze_batch(fleet)
+    assert not analyze_batch(fleet, errors="reject")["valid"].any()
+
+    fleet["pressure"] = 50.0
+    results = analyze_batch(fleet, errors="reject")
+    clean = analyze_batch(make_fleet())
+    np.testing.assert_array_equal(results["valid"], [True, False, True, True, True])
+    assert np.isnan(results["tmin_pressure"][1]) and results["governing_type"][1] == ""
+    mask = results["valid"]
+    np.testing.assert_array_equal(results["tmin_pressure"][mask], clean["tmin_pressure"][mask])
+    np.testing.assert_array_equal(results["governing_type"][mask], clean["governing_type"][mask])
+
+    path = validate_batch(fleet).write_report(tmp_path / "rejected.csv")
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{"row": "1", "column": "schedule", "value": "bogus", "reason": "unknown schedule"}]
+
+def test_hostile_nps_is_rejected_not_evaluated(tmp_path, monkeypatch):
+    """Untrusted NPS strings are parsed, never evaluated, including for elbow radii"""
+    monkeypatch.chdir(tmp_path)
+    hostile = "__import__('pathlib').Path('evaluated').touch() or 2"
+    fleet = make_fleet(nps=[hostile, "1-" + hostile, "4", "6", "8"],
+                       pipe_config=["90LR - Inner Elbow", "straight", "straight", "straight", "straight"])
+    result = validate_batch(fleet)
+    assert result.valid.tolist() == [False, False, True, True, True]
+    assert set(result.reasons.tolist()) == {"unparseable NPS"}
+    assert not (tmp_path / "evaluated").exists()
+
+def test_missing_required_column():
+    fleet = make_fleet()
+    del fleet["nps"]
+    with pytest.raises(ValueError, match="missing required columns"):
+        validate_batch(fleet)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
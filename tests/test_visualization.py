@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk thickness visualizations
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+# Add the parent directory to the path so we can import the tmin module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import matplotlib
+matplotlib.use("Agg")
+
+from tmin.batch import analyze_batch, project_batch
+from tmin.visualization import ThicknessVisualizer
+
+FLEET = {
+    "schedule": "40",
+    "nps": ["2", "2", "6", "6"],
+    "pressure": 50.0,
+    "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333.0,
+    "corrosion_rate": [10.0, 5.0, 20.0, 0.0],
+    "year_inspected": 2020,
+    "measured_thickness": [0.150, 0.150, 0.280, 0.280],
+}
+
+def test_retirement_years():
+    """Projected retirement is where the thickness line crosses the governing limit"""
+    projection = project_batch(FLEET, np.arange(2020, 2041))
+    years = ThicknessVisualizer._retirement_years(projection["as_of"], projection["actual_thickness"].T,
+                                                  projection["governing_thickness"])
+    expected = 2020 + (np.array([0.150, 0.150, 0.280]) - projection["governing_thickness"][:3]) \
+        / (np.array([10.0, 5.0, 20.0]) * 0.001)
+    np.testing.assert_allclose(years[:3], expected)
+    assert np.isnan(years[3])  # no corrosion, never retires
+
+def test_projection_plots_per_circuit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    projection = project_batch(FLEET, np.arange(2020, 2041))
+    paths = ThicknessVisualizer().create_projection_plots(projection, ["U1/A", "U1/A", "U2", "U2"],
+                                                          labels=["CML-1", "CML-2", "CML-3", "CML-4"], dpi=50)
+    assert sorted(paths) == ["U1/A", "U2"]
+    for path in paths.values():
+        assert os.path.getsize(path) > 0
+        assert "/" not in os.path.basename(path).replace("thickness_projection_", "")
+
+def test_fleet_dashboard_counts(tmp_path, monkeypatch):
+    """Dashboard aggregations match a row-by-row count"""
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(0)
+    n = 500
+    fleet = {**FLEET,
+             "nps": rng.choice(["1/2", "2", "10", "3/4"], n),
+             "pressure": rng.choice([50.0, 1500.0], n),
+             "pressure_class": rng.choice([150, 600], n),
+             "corrosion_rate": rng.uniform(1, 20, n),
+             "default_retirement_limit": 0.1,
+             "measured_thickness": rng.uniform(0.05, 0.5, n)}
+    circuits = rng.choice(["C1", "C2", "C3"], n)
+    results = analyze_batch(fleet, as_of=2025)
+    visualizer = ThicknessVisualizer()
+
+    nps_names, class_names, total, pressure = visualizer.governing_type_counts(
+        results, fleet["nps"], fleet["pressure_class"])
+    assert nps_names.tolist() == ["1/2", "3/4", "2", "10"] and class_names.tolist() == ["150", "600"]
+    for i, nps in enumerate(nps_names):
+        for j, pc in enumerate(class_names):
+            rows = (fleet["nps"] == nps) & (fleet["pressure_class"] == int(pc))
+            assert total[i, j] == rows.sum()
+            assert pressure[i, j] == (results["governing_type"][rows] == "pressure").sum()
+
+    names, counts, below_governing, below_default = visualizer.below_limit_counts(results, circuits)
+    for i, name in enumerate(names):
+        rows = circuits == name
+        assert counts[i] == rows.sum()
+        assert below_governing[i] == (results["actual_thickness"][rows] < results["governing_thickness"][rows]).sum()
+        assert below_default[i] == (results["actual_thickness"][rows] <= 0.1).sum()
+
+    paths = visualizer.create_fleet_dashboard(results, fleet["nps"], fleet["pressure_class"], circuits, dpi=50)
+    assert sorted(paths) == ["below_limit", "governing_type", "remaining_life"]
+    assert all(os.path.getsize(path) > 0 for path in paths.values())
+
+def test_dashboard_counts_skip_rejected_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fleet = dict(FLEET, schedule=["40", "bogus", "40", "40"])
+    results = analyze_batch(fleet, as_of=2025, errors="reject")
+    visualizer = ThicknessVisualizer()
+    _, _, total, _ = visualizer.governing_type_counts(results, fleet["nps"], 150)
+    assert total.tolist() == [[1], [2]]
+    names, counts, below_governing, _ = visualizer.below_limit_counts(results, ["C1", "C1", "C2", "C3"])
+    assert names.tolist() == ["C1", "C2", "C3"] and counts.tolist() == [1, 1, 1]
+
+def test_concurrent_rendering_without_pyplot(tmp_path):
+    """Figures rendered from a thread pool match the serial ones and never touch pyplot"""
+    import subprocess
+    script = """
+import os, sys
+from concurrent.futures import ThreadPoolExecutor
+from tmin.batch import analyze_batch
+from tmin.visualization import ThicknessVisualizer
+
+fleet = {"schedule": "40", "nps": ["2", "3", "4", "6"], "pressure": 50.0, "pressure_class": 150,
+         "metallurgy": "Intermediate/Low CS", "allowable_stress": 23333.0, "year_inspected": 2020,
+         "measured_thickness": [0.150, 0.200, 0.200, 0.280]}
+results = analyze_batch(fleet, as_of=2020)
+
+def render(row, directory):
+    visualizer = ThicknessVisualizer()
+    visualizer.reports_dir = directory
+    analysis = {name: values[row].item() for name, values in results.items()}
+    return visualizer.create_comparison_chart(analysis, analysis["actual_thickness"], filename=f"chart_{row}")
+
+os.makedirs("serial"), os.makedirs("threads")
+serial = [render(row, "serial") for row in range(4)]
+with ThreadPoolExecutor(4) as pool:
+    threaded = list(pool.map(render, range(4), ["threads"] * 4))
+for a, b in zip(serial, threaded):
+    assert open(a, "rb").read() == open(b, "rb").read(), (a, b)
+print("matplotlib.pyplot" in sys.modules)
+"""
+    env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(__file__), '..'))
+    out = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "False"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,3 +1,13 @@
-from .core import PIPE
+import importlib
 
-__all__ = ['PIPE']
+__all__ = ['PIPE', 'analyze_batch', 'iter_analyze']
+
+# Exports are imported on first use, so the tmin command can hand off to a
+# running daemon (see tmin.daemon) without loading NumPy and matplotlib
+_EXPORTS = {'PIPE': 'core', 'analyze_batch': 'batch', 'iter_analyze': 'streaming'}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,125 @@
+"""
+Asyncio wrappers for embedding tmin in event-loop applications
+
+Analysis and report generation run in an executor so the event loop stays
+responsive while matplotlib renders. Any concurrent.futures executor can be
+passed; None uses the loop's default thread pool. Plots are drawn on
+per-call Agg figures without pyplot, so reports render in parallel in threads
+as well as in a ProcessPoolExecutor.
+
+Cancelling a coroutine cancels the work that has not started yet; a render
+already running in a worker finishes and its result is discarded.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+
+from .batch import analyze_batch
+from .metrics import METRICS
+
+
+async def _run(executor: Optional[Executor], func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run func in the executor"""
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+async def analysis_async(pipe, measured_thickness: float, year_inspected=None, joint_type='Seamless',
+                         as_of=None, executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    PIPE.analysis without blocking the event loop
+
+    Args:
+        pipe: PIPE instance
+        measured_thickness, year_inspected, joint_type, as_of: As for PIPE.analysis
+        executor: Executor to run in (default: the loop's default executor)
+
+    Returns:
+        Dict with analysis results, as PIPE.analysis
+    """
+    return await _run(executor, pipe.analysis, measured_thickness, year_inspected, joint_type, as_of)
+
+
+async def report_async(pipe, measured_thickness: float, year_inspected=None, joint_type='Seamless',
+                       as_of=None, executor: Optional[Executor] = None,
+                       precision: Optional[int] = None) -> Dict[str, Any]:
+    """
+    PIPE.report without blocking the event loop
+
+    Args:
+        pipe: PIPE instance
+        measured_thickness, year_inspected, joint_type, as_of, precision: As for PIPE.report
+        executor: Executor to render in (default: the loop's default executor)
+
+    Returns:
+        Dict containing paths to generated files, as PIPE.report
+    """
+    return await _run(executor, pipe.report, measured_thickness, year_inspected, joint_type, as_of, precision)
+
+
+async def analyze_batch_async(fleet: Mapping[str, Any], as_of=None, errors: str = "raise",
+                              executor: Optional[Executor] = None, units=None) -> Dict[str, np.ndarray]:
+    """analyze_batch without blocking the event loop; arguments as for analyze_batch"""
+    return await _run(executor, analyze_batch, fleet, as_of=as_of, errors=errors, units=units)
+
+
+async def report_many_async(jobs: Iterable[Union[Mapping[str, Any], tuple]], concurrency: int = 4,
+                            executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
+    """
+    Generate reports for many pipes with at most `concurrency` in flight
+
+    Args:
+        jobs: (pipe, measured_thickness[, year_inspected[, joint_type[, as_of]]]) tuples, or dicts
+            with a 'pipe' entry and PIPE.report keyword arguments (including precision)
+        concurrency: Maximum number of reports submitted to the executor at once
+        executor: Executor to render in (default: the loop's default executor)
+
+    Returns:
+        PIPE.report results in job order. If one report fails or the coroutine is
+        cancelled, the reports not yet started are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be positive, got {concurrency}")
+    limit = asyncio.Semaphore(concurrency)
+    busy = [0.0]
+
+    async def render(pipe, args, kwargs):
+        if not METRICS.enabled:
+            return await report_async(pipe, *args, executor=executor, **kwargs)
+        METRICS.workers_busy.inc()
+        start = time.perf_counter()
+        try:
+            return await report_async(pipe, *args, executor=executor, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            busy[0] += elapsed
+            METRICS.workers_busy.dec()
+            METRICS.worker_busy_seconds.inc(elapsed)
+
+    async def run(job):
+        if isinstance(job, Mapping):
+            kwargs = dict(job)
+            pipe = kwargs.pop("pipe")
+            args = ()
+        else:
+            pipe, *args = job
+            kwargs = {}
+        async with limit:
+            return await render(pipe, args, kwargs)
+
+    started = time.perf_counter()
+    tasks = [asyncio.ensure_future(run(job)) for job in jobs]
+    try:
+        reports = list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    if METRICS.enabled and tasks:
+        METRICS.worker_utilization.set(busy[0] / ((time.perf_counter() - started) * concurrency))
+    return reports
@@ -0,0 +1,17 @@
+# Allowable Stress Curves (psi) by design temperature (F)
+# ASME B31.1 Mandatory Appendix A
+#
+# None marks temperatures above the material's permitted range. Materials whose
+# curve is not tabulated here require a user-defined allowable_stress.
+
+# Table A-1, Carbon Steel, A106 Grade B seamless
+A106_GR_B_allowable = {
+    900: 6500,
+    950: 4500,
+    1000: 2500,
+    1050: None,
+    1100: None,
+    1150: None,
+    1200: None,
+    1250: None
+}
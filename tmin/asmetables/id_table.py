@@ -3,109 +3,16 @@
 ###########################################
 
 # ID = OD - 2 * (nominal wall thickness for that schedule/NPS)
+# Per-schedule views of the ASME B36.10M / B36.19M dimension table in pipe_dimensions.py
 
-trueID_10 = {
-    '3/4': 0.995,
-    '1': 1.265,
-    '1-1/4': 1.610,
-    '1-1/2': 1.900,
-    '2': 2.323,
-    '2-1/2': 2.769,
-    '3': 3.294,
-    '3-1/2': 3.786,
-    '4': 4.260,
-}
+from .pipe_dimensions import pipe_OD, nominal_wall
 
-trueID_40 = {
-    '3/8': 0.493,
-    '1/2': 0.622,
-    '3/4': 0.824,
-    '1': 1.049,
-    '1-1/4': 1.380,
-    '1-1/2': 1.610,
-    '2': 2.067,
-    '2-1/2': 2.469,
-    '3': 3.068,
-    '3-1/2': 3.548,
-    '4': 4.026,
-    '5': 5.047,
-    '6': 6.065,
-    '8': 7.981,
-    '10': 10.020,
-    '12': 12.000,
-    '14': 13.250,
-    '16': 15.250,
-    '18': 17.250,
-    '20': 19.250,
-    '24': 23.250,
-}
+def _schedule_ID(schedule):
+    return {nps: round(pipe_OD[nps] - 2 * walls[schedule], 3)
+            for nps, walls in nominal_wall.items() if schedule in walls}
 
-trueID_80 = {
-    '3/8': 0.423,
-    '1/2': 0.546,
-    '3/4': 0.742,
-    '1': 0.957,
-    '1-1/4': 1.278,
-    '1-1/2': 1.500,
-    '2': 1.939,
-    '2-1/2': 2.323,
-    '3': 2.900,
-    '3-1/2': 3.364,
-    '4': 3.826,
-    '5': 4.813,
-    '6': 5.761,
-    '8': 7.625,
-    '10': 9.564,
-    '12': 11.442,
-    '14': 13.250,
-    '16': 15.000,
-    '18': 16.876,
-    '20': 18.812,
-    '24': 22.624,
-}
-
-trueID_120 = {
-    '1/2': 0.494,
-    '3/4': 0.696,
-    '1': 0.884,
-    '1-1/4': 1.201,
-    '1-1/2': 1.410,
-    '2': 1.814,
-    '2-1/2': 2.164,
-    '3': 2.731,
-    '3-1/2': 3.182,
-    '4': 3.624,
-    '5': 4.500,
-    '6': 5.501,
-    '8': 7.407,
-    '10': 9.312,
-    '12': 11.314,
-    '14': 13.250,
-    '16': 15.000,
-    '18': 16.876,
-    '20': 18.812,
-    '24': 22.624,
-}
-
-trueID_160 = {
-    '1/2': 0.434,
-    '3/4': 0.614,
-    '1': 0.815,
-    '1-1/4': 1.123,
-    '1-1/2': 1.330,
-    '2': 1.687,
-    '2-1/2': 2.025,
-    '3': 2.635,
-    '3-1/2': 3.070,
-    '4': 3.546,
-    '5': 4.408,
-    '6': 5.377,
-    '8': 7.249,
-    '10': 9.126,
-    '12': 11.000,
-    '14': 12.750,
-    '16': 14.500,
-    '18': 16.376,
-    '20': 18.312,
-    '24': 22.126,
-}
+trueID_10 = _schedule_ID("10")
+trueID_40 = _schedule_ID("40")
+trueID_80 = _schedule_ID("80")
+trueID_120 = _schedule_ID("120")
+trueID_160 = _schedule_ID("160")
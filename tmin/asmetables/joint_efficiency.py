@@ -0,0 +1,32 @@
+from .wsrf import WSRF
+
+# Longitudinal Weld Joint Efficiency (E) and Weld Strength Reduction (W) Factors
+# ASME B31.1 Table 102.4.3 (E) and Table 102.4.7 (W, see wsrf.py)
+#
+# Both tables are keyed by joint type and design temperature (F) so they share the
+# temperature axis of the Y coefficient tables in y_coeff.py.
+
+joint_temperatures = [900, 950, 1000, 1050, 1100, 1150, 1200, 1250]
+
+_longitudinal_E = {
+    "Seamless": 1.00,
+    "ERW": 0.85,                 # Electric resistance weld, straight or spiral
+    "EFW": 0.85,                 # Electric fusion weld, single butt
+    "EFW Double Butt": 0.90,     # Electric fusion weld, double butt
+    "Furnace Butt Weld": 0.60,   # Furnace butt weld, continuous weld
+}
+
+joint_efficiency_E = {
+    joint_type: {temp: E for temp in joint_temperatures}
+    for joint_type, E in _longitudinal_E.items()
+}
+
+# Seamless pipe has no longitudinal weld, so W = 1.0 at every temperature.
+# Welded pipe takes W from the WSRF table where tabulated and 1.0 below it.
+weld_strength_W = {
+    joint_type: {
+        temp: 1.0 if joint_type == "Seamless" else WSRF.get(str(temp), 1.0)
+        for temp in joint_temperatures
+    }
+    for joint_type in _longitudinal_E
+}
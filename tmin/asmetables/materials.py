@@ -0,0 +1,46 @@
+from .y_coeff import ferritic_steels_y, austenitic_steels_y, other_metals_y
+from .api_574_2025 import API574_CS_400F, API574_SS_400F
+from .allowable_stress import A106_GR_B_allowable
+
+# Material Registry
+# Maps each metallurgy to its integer code, Y coefficient table (ASME B31.1 Table 104.1.2-1),
+# API 574 (2025) structural minimum table and allowable stress curve.
+#
+# Codes are positional and used to index the compiled lookup grids in tmin.batch.
+# Inconel 625 (UNS N06625) is not listed in Table 104.1.2-1 and takes the "other ductile
+# metals" column. Materials without an API 574 table of their own use the carbon steel table.
+
+MATERIALS = {
+    "Intermediate/Low CS": {
+        "code": 0,
+        "y_table": ferritic_steels_y,
+        "api574_table": API574_CS_400F,
+        "allowable_stress": A106_GR_B_allowable,
+    },
+    "SS 316/316L": {
+        "code": 1,
+        "y_table": austenitic_steels_y,
+        "api574_table": API574_SS_400F,
+        "allowable_stress": None,
+    },
+    "SS 304/304L": {
+        "code": 2,
+        "y_table": austenitic_steels_y,
+        "api574_table": API574_SS_400F,
+        "allowable_stress": None,
+    },
+    "Inconel 625": {
+        "code": 3,
+        "y_table": other_metals_y,
+        "api574_table": API574_CS_400F,
+        "allowable_stress": None,
+    },
+    "Other": {
+        "code": 4,
+        "y_table": other_metals_y,
+        "api574_table": API574_CS_400F,
+        "allowable_stress": None,
+    },
+}
+
+MATERIAL_NAMES = sorted(MATERIALS, key=lambda name: MATERIALS[name]["code"])
@@ -2,108 +2,15 @@
 # ANSI Nominal Pipe Sizes - Outer Diameters
 ###########################################
 
-trueOD_10 = {
-            '3/4' : 1.050,
-            '1':  1.315,
-            '1-1/4': 1.660,
-            '1-1/2': 1.900,
-            '2': 2.375,
-            '2-1/2': 2.875,
-            '3': 3.500,
-            '3-1/2': 4.000,
-            '4': 4.500
-        }
+# Per-schedule views of the ASME B36.10M / B36.19M dimension table in pipe_dimensions.py
 
-trueOD_40 = {
-    '3/8': 0.675,
-    '1/2': 0.840,
-    '3/4': 1.050,
-    '1': 1.315,
-    '1-1/4': 1.660,
-    '1-1/2': 1.900,
-    '2': 2.375,
-    '2-1/2': 2.875,
-    '3': 3.500,
-    '3-1/2': 4.000,
-    '4': 4.500,
-    '5': 5.563,
-    '6': 6.625,
-    '8': 8.625,
-    '10': 10.750,
-    '12': 12.750,
-    '14': 14.000,
-    '16': 16.000,
-    '18': 18.000,
-    '20': 20.000,
-    '24': 24.000
-}
+from .pipe_dimensions import pipe_OD, nominal_wall
 
-trueOD_80 = {
-    '3/8': 0.675,
-    '1/2': 0.840,
-    '3/4': 1.050,
-    '1': 1.315,
-    '1-1/4': 1.660,
-    '1-1/2': 1.900,
-    '2': 2.375,
-    '2-1/2': 2.875,
-    '3': 3.500,
-    '3-1/2': 4.000,
-    '4': 4.500,
-    '5': 5.563,
-    '6': 6.625,
-    '8': 8.625,
-    '10': 10.750,
-    '12': 12.750,
-    '14': 14.000,
-    '16': 16.000,
-    '18': 18.000,
-    '20': 20.000,
-    '24': 24.000
-}
+def _schedule_OD(schedule):
+    return {nps: pipe_OD[nps] for nps, walls in nominal_wall.items() if schedule in walls}
 
-trueOD_120 = {
-    '1/2': 0.840,
-    '3/4': 1.050,
-    '1': 1.315,
-    '1-1/4': 1.660,
-    '1-1/2': 1.900,
-    '2': 2.375,
-    '2-1/2': 2.875,
-    '3': 3.500,
-    '3-1/2': 4.000,
-    '4': 4.500,
-    '5': 5.563,
-    '6': 6.625,
-    '8': 8.625,
-    '10': 10.750,
-    '12': 12.750,
-    '14': 14.000,
-    '16': 16.000,
-    '18': 18.000,
-    '20': 20.000,
-    '24': 24.000
-}
-
-trueOD_160 = {
-    '1/2': 0.840,
-    '3/4': 1.050,
-    '1': 1.315,
-    '1-1/4': 1.660,
-    '1-1/2': 1.900,
-    '2': 2.375,
-    '2-1/2': 2.875,
-    '3': 3.500,
-    '3-1/2': 4.000,
-    '4': 4.500,
-    '5': 5.563,
-    '6': 6.625,
-    '8': 8.625,
-    '10': 10.750,
-    '12': 12.750,
-    '14': 14.000,
-    '16': 16.000,
-    '18': 18.000,
-    '20': 20.000,
-    '24': 24.000
-}
\ No newline at end of file
+trueOD_10 = _schedule_OD("10")
+trueOD_40 = _schedule_OD("40")
+trueOD_80 = _schedule_OD("80")
+trueOD_120 = _schedule_OD("120")
+trueOD_160 = _schedule_OD("160")
@@ -0,0 +1,96 @@
+###########################################
+# ASME B36.10M / B36.19M Pipe Dimensions
+###########################################
+
+# Outside diameter (inches) is fixed by NPS; nominal wall (inches) is keyed by
+# NPS and schedule or wall designation. ID = OD - 2 * nominal wall.
+# B36.19M stainless schedules carry the "S" suffix.
+
+pipe_schedules = ["5", "5S", "10", "10S", "20", "30", "STD", "40", "40S", "60",
+                  "XS", "80", "80S", "100", "120", "140", "160", "XXS"]
+
+pipe_OD = {
+    '1/8': 0.405,
+    '1/4': 0.540,
+    '3/8': 0.675,
+    '1/2': 0.840,
+    '3/4': 1.050,
+    '1': 1.315,
+    '1-1/4': 1.660,
+    '1-1/2': 1.900,
+    '2': 2.375,
+    '2-1/2': 2.875,
+    '3': 3.500,
+    '3-1/2': 4.000,
+    '4': 4.500,
+    '5': 5.563,
+    '6': 6.625,
+    '8': 8.625,
+    '10': 10.750,
+    '12': 12.750,
+    '14': 14.000,
+    '16': 16.000,
+    '18': 18.000,
+    '20': 20.000,
+    '22': 22.000,
+    '24': 24.000,
+}
+
+nominal_wall = {
+    '1/8':   {"10": 0.049, "10S": 0.049, "30": 0.057, "STD": 0.068, "40": 0.068, "40S": 0.068,
+              "XS": 0.095, "80": 0.095, "80S": 0.095},
+    '1/4':   {"10": 0.065, "10S": 0.065, "30": 0.073, "STD": 0.088, "40": 0.088, "40S": 0.088,
+              "XS": 0.119, "80": 0.119, "80S": 0.119},
+    '3/8':   {"10": 0.065, "10S": 0.065, "30": 0.073, "STD": 0.091, "40": 0.091, "40S": 0.091,
+              "XS": 0.126, "80": 0.126, "80S": 0.126},
+    '1/2':   {"5": 0.065, "5S": 0.065, "10": 0.083, "10S": 0.083, "30": 0.095, "STD": 0.109, "40": 0.109,
+              "40S": 0.109, "XS": 0.147, "80": 0.147, "80S": 0.147, "160": 0.188, "XXS": 0.294},
+    '3/4':   {"5": 0.065, "5S": 0.065, "10": 0.083, "10S": 0.083, "30": 0.095, "STD": 0.113, "40": 0.113,
+              "40S": 0.113, "XS": 0.154, "80": 0.154, "80S": 0.154, "160": 0.219, "XXS": 0.308},
+    '1':     {"5": 0.065, "5S": 0.065, "10": 0.109, "10S": 0.109, "30": 0.114, "STD": 0.133, "40": 0.133,
+              "40S": 0.133, "XS": 0.179, "80": 0.179, "80S": 0.179, "160": 0.250, "XXS": 0.358},
+    '1-1/4': {"5": 0.065, "5S": 0.065, "10": 0.109, "10S": 0.109, "30": 0.117, "STD": 0.140, "40": 0.140,
+              "40S": 0.140, "XS": 0.191, "80": 0.191, "80S": 0.191, "160": 0.250, "XXS": 0.382},
+    '1-1/2': {"5": 0.065, "5S": 0.065, "10": 0.109, "10S": 0.109, "30": 0.125, "STD": 0.145, "40": 0.145,
+              "40S": 0.145, "XS": 0.200, "80": 0.200, "80S": 0.200, "160": 0.281, "XXS": 0.400},
+    '2':     {"5": 0.065, "5S": 0.065, "10": 0.109, "10S": 0.109, "30": 0.125, "STD": 0.154, "40": 0.154,
+              "40S": 0.154, "XS": 0.218, "80": 0.218, "80S": 0.218, "160": 0.344, "XXS": 0.436},
+    '2-1/2': {"5": 0.083, "5S": 0.083, "10": 0.120, "10S": 0.120, "30": 0.188, "STD": 0.203, "40": 0.203,
+              "40S": 0.203, "XS": 0.276, "80": 0.276, "80S": 0.276, "160": 0.375, "XXS": 0.552},
+    '3':     {"5": 0.083, "5S": 0.083, "10": 0.120, "10S": 0.120, "30": 0.188, "STD": 0.216, "40": 0.216,
+              "40S": 0.216, "XS": 0.300, "80": 0.300, "80S": 0.300, "160": 0.438, "XXS": 0.600},
+    '3-1/2': {"5": 0.083, "5S": 0.083, "10": 0.120, "10S": 0.120, "30": 0.188, "STD": 0.226, "40": 0.226,
+              "40S": 0.226, "XS": 0.318, "80": 0.318, "80S": 0.318},
+    '4':     {"5": 0.083, "5S": 0.083, "10": 0.120, "10S": 0.120, "30": 0.188, "STD": 0.237, "40": 0.237,
+              "40S": 0.237, "XS": 0.337, "80": 0.337, "80S": 0.337, "120": 0.438, "160": 0.531, "XXS": 0.674},
+    '5':     {"5": 0.109, "5S": 0.109, "10": 0.134, "10S": 0.134, "STD": 0.258, "40": 0.258, "40S": 0.258,
+              "XS": 0.375, "80": 0.375, "80S": 0.375, "120": 0.500, "160": 0.625, "XXS": 0.750},
+    '6':     {"5": 0.109, "5S": 0.109, "10": 0.134, "10S": 0.134, "STD": 0.280, "40": 0.280, "40S": 0.280,
+              "XS": 0.432, "80": 0.432, "80S": 0.432, "120": 0.562, "160": 0.719, "XXS": 0.864},
+    '8':     {"5": 0.109, "5S": 0.109, "10": 0.148, "10S": 0.148, "20": 0.250, "30": 0.277, "STD": 0.322,
+              "40": 0.322, "40S": 0.322, "60": 0.406, "XS": 0.500, "80": 0.500, "80S": 0.500, "100": 0.594,
+              "120": 0.719, "140": 0.812, "160": 0.906, "XXS": 0.875},
+    '10':    {"5": 0.134, "5S": 0.134, "10": 0.165, "10S": 0.165, "20": 0.250, "30": 0.307, "STD": 0.365,
+              "40": 0.365, "40S": 0.365, "60": 0.500, "XS": 0.500, "80": 0.594, "80S": 0.500, "100": 0.719,
+              "120": 0.844, "140": 1.000, "160": 1.125, "XXS": 1.000},
+    '12':    {"5": 0.156, "5S": 0.156, "10": 0.180, "10S": 0.180, "20": 0.250, "30": 0.330, "STD": 0.375,
+              "40": 0.406, "40S": 0.375, "60": 0.562, "XS": 0.500, "80": 0.688, "80S": 0.500, "100": 0.844,
+              "120": 1.000, "140": 1.125, "160": 1.312, "XXS": 1.000},
+    '14':    {"5": 0.156, "5S": 0.156, "10": 0.250, "10S": 0.188, "20": 0.312, "30": 0.375, "STD": 0.375,
+              "40": 0.438, "60": 0.594, "XS": 0.500, "80": 0.750, "100": 0.938, "120": 1.094, "140": 1.250,
+              "160": 1.406},
+    '16':    {"5": 0.165, "5S": 0.165, "10": 0.250, "10S": 0.188, "20": 0.312, "30": 0.375, "STD": 0.375,
+              "40": 0.500, "60": 0.656, "XS": 0.500, "80": 0.844, "100": 1.031, "120": 1.219, "140": 1.438,
+              "160": 1.594},
+    '18':    {"5": 0.165, "5S": 0.165, "10": 0.250, "10S": 0.188, "20": 0.312, "30": 0.438, "STD": 0.375,
+              "40": 0.562, "60": 0.750, "XS": 0.500, "80": 0.938, "100": 1.156, "120": 1.375, "140": 1.562,
+              "160": 1.781},
+    '20':    {"5": 0.188, "5S": 0.188, "10": 0.250, "10S": 0.218, "20": 0.375, "30": 0.500, "STD": 0.375,
+              "40": 0.594, "60": 0.812, "XS": 0.500, "80": 1.031, "100": 1.281, "120": 1.500, "140": 1.750,
+              "160": 1.969},
+    '22':    {"5": 0.188, "5S": 0.188, "10": 0.250, "10S": 0.218, "20": 0.375, "30": 0.500, "STD": 0.375,
+              "60": 0.875, "XS": 0.500, "80": 1.125, "100": 1.375, "120": 1.625, "140": 1.875, "160": 2.125},
+    '24':    {"5": 0.218, "5S": 0.218, "10": 0.250, "10S": 0.250, "20": 0.375, "30": 0.562, "STD": 0.375,
+              "40": 0.688, "60": 0.969, "XS": 0.500, "80": 1.219, "100": 1.531, "120": 1.812, "140": 2.062,
+              "160": 2.344},
+}
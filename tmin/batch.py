@@ -0,0 +1,468 @@
+"""
+Vectorized batch analysis for fleets of pipes
+
+A fleet is a mapping of column name -> sequence using the same field names as
+PIPE, plus the per-reading columns measured_thickness, year_inspected and
+joint_type. Scalar values are broadcast to every row.
+"""
+
+import numpy as np
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence
+
+from . import dimensions
+from .core import PIPE
+from .dates import as_of_year, decimal_years
+from .asmetables.ANSI_radii import ANSI_radii
+from .asmetables.materials import MATERIAL_NAMES
+from .editions import PRESSURE_CLASSES, get_edition
+from .metrics import METRICS, metered
+from .profiling import profiled, stage
+from .tablecache import load_tables
+from .units import get_units
+
+REQUIRED_COLUMNS = ["schedule", "nps", "pressure", "pressure_class", "metallurgy",
+                    "allowable_stress", "measured_thickness"]
+
+FLEET_DEFAULTS = {
+    "design_temp": 900,
+    "pipe_config": "straight",
+    "corrosion_rate": np.nan,
+    "default_retirement_limit": np.nan,
+    "API_table": "2025",
+    "year_inspected": np.nan,
+    "joint_type": "Seamless",
+}
+
+# Result arrays returned by analyze_batch, keyed like PIPE.analysis
+RESULT_COLUMNS = ["measured_thickness", "year_inspected", "actual_thickness", "tmin_pressure",
+                  "tmin_structural", "default_retirement_limit", "below_defaultRL", "api574_RL",
+                  "above_api574RL", "life_span", "governing_thickness", "governing_type"]
+
+PIPE_CONFIGS = ["straight", "90LR - Inner Elbow", "90LR - Outer Elbow"]
+
+_TABLES = load_tables()
+JOINT_TYPES = _TABLES["joint_types"].tolist()
+TEMPERATURES = _TABLES["temperatures"]
+
+# Joint factor grids indexed by [joint code, temperature index]
+E_GRID = _TABLES["E"]
+W_GRID = _TABLES["W"]
+
+# Material grids indexed by [material code, temperature index], codes taken from the material registry
+Y_GRID = _TABLES["Y"]
+ALLOWABLE_GRID = _TABLES["allowable_stress"]
+
+# Placeholder values for fields that a lookup does not depend on
+_TEMPLATE = {
+    "schedule": "40",
+    "nps": "2",
+    "pressure": 0.0,
+    "pressure_class": 150,
+    "metallurgy": "Other",
+    "allowable_stress": 0.0,
+}
+
+
+def _fleet_length(fleet: Mapping[str, Any]) -> int:
+    """Number of rows in a fleet, taken from its longest non-scalar column"""
+    lengths = {len(v) for v in fleet.values() if np.ndim(v) > 0}
+    if len(lengths) > 1:
+        raise ValueError(f"Fleet columns have mismatched lengths: {sorted(lengths)}")
+    return lengths.pop() if lengths else 1
+
+
+def _column(fleet: Mapping[str, Any], name: str, n: int, dtype) -> np.ndarray:
+    """Fetch a column as an array of length n, broadcasting scalars and defaults"""
+    if name in fleet:
+        values = fleet[name]
+    elif name in FLEET_DEFAULTS:
+        values = FLEET_DEFAULTS[name]
+    else:
+        raise ValueError(f"Fleet is missing required column '{name}'")
+
+    if dtype is float:
+        values = np.asarray(values, dtype=object)
+        values = np.where(np.equal(values, None) | np.equal(values, ""), np.nan, values).astype(float)
+    elif dtype is int:
+        values = np.asarray(values, dtype=np.int64)
+    else:
+        values = np.asarray(values, dtype=object).astype(str)
+    return np.broadcast_to(values, (n,))
+
+
+def _years(fleet: Mapping[str, Any], name: str, n: int) -> np.ndarray:
+    """Fetch a date column as decimal years of length n, NaN where missing"""
+    values = fleet[name] if name in fleet else FLEET_DEFAULTS[name]
+    return np.broadcast_to(decimal_years(values), (n,))
+
+
+def _factorize(*columns: np.ndarray):
+    """Return the unique row combinations of the given columns and the inverse index"""
+    records = np.rec.fromarrays([np.asarray(c) for c in columns])
+    uniques, inverse = np.unique(records, return_inverse=True)
+    return [tuple(u.tolist()) for u in uniques], inverse.reshape(-1)
+
+
+def _resolve(method: Callable[[PIPE], Optional[float]], **columns: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a scalar PIPE lookup once per unique combination of the given
+    columns and scatter the result back to every row. Failed lookups are NaN.
+    """
+    names = list(columns)
+    uniques, inverse = _factorize(*columns.values())
+    if METRICS.enabled:
+        METRICS.record_lookup(len(inverse), len(uniques))
+    values = np.empty(len(uniques))
+    for i, combo in enumerate(uniques):
+        pipe = PIPE(**{**_TEMPLATE, **dict(zip(names, combo))})
+        try:
+            value = method(pipe)
+        except (KeyError, ValueError, TypeError):
+            value = None
+        values[i] = np.nan if value is None else value
+    return values[inverse]
+
+
+def _codes(values: np.ndarray, categories, name: str) -> np.ndarray:
+    """Map a string column onto integer codes for the given categories"""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    lookup = {c: i for i, c in enumerate(categories)}
+    unknown = [u for u in uniques.tolist() if u not in lookup]
+    if unknown:
+        raise ValueError(f"Unknown {name} {unknown}. Valid values: {list(categories)}")
+    return np.array([lookup[u] for u in uniques.tolist()], dtype=np.intp)[inverse.reshape(-1)]
+
+
+def _nps_values(nps: np.ndarray) -> np.ndarray:
+    """NPS of each row in inches, NaN where the NPS string cannot be parsed"""
+    uniques, inverse = np.unique(nps, return_inverse=True)
+    values = []
+    for value in uniques.tolist():
+        try:
+            values.append(dimensions.nps_to_float(value))
+        except ValueError:
+            values.append(np.nan)
+    return np.array(values)[inverse.reshape(-1)]
+
+
+def _schedule_codes(schedule: np.ndarray) -> np.ndarray:
+    """Schedule code of each row, -1 where the designation is unknown"""
+    uniques, inverse = np.unique(schedule, return_inverse=True)
+    return dimensions.schedule_codes(uniques.tolist())[inverse.reshape(-1)]
+
+
+def _table_key(nps: float) -> str:
+    """Table key of a parsed NPS, formatted as PIPE._convert_nps_to_table_key ('1.5', '2')"""
+    key = str(float(nps))
+    return key[:-2] if key.endswith('.0') else key
+
+
+def _nps_table_keys(nps: np.ndarray):
+    """
+    Unique NPS table keys (e.g. '1.5' for '1-1/2') and the inverse index back to rows
+
+    NPS strings are parsed with dimensions.nps_to_float; unparseable ones get key None.
+    """
+    uniques, inverse = _factorize(nps)
+    keys = []
+    for (value,) in uniques:
+        try:
+            keys.append(_table_key(dimensions.nps_to_float(value)))
+        except ValueError:
+            keys.append(None)
+    return keys, inverse
+
+
+def _radii(nps_keys, nps_inverse: np.ndarray) -> np.ndarray:
+    """ANSI centerline bend radius of each row, NaN where the NPS has none"""
+    radii = [ANSI_radii.get(key) if key is not None else None for key in nps_keys]
+    return np.array([np.nan if r is None else r for r in radii], dtype=float)[nps_inverse]
+
+
+def _temperature_index(design_temp: np.ndarray) -> np.ndarray:
+    """Index of each row's design temperature on the shared table temperature axis"""
+    temps = _resolve(lambda p: p.round_temp(), design_temp=design_temp)
+    index = np.minimum(np.searchsorted(TEMPERATURES, temps), len(TEMPERATURES) - 1)
+    bad = TEMPERATURES[index] != temps
+    if bad.any():
+        raise ValueError(f"Invalid design_temp {sorted(set(design_temp[bad].tolist()))}")
+    return index
+
+
+def _check_lookup(values: np.ndarray, what: str, rows: np.ndarray) -> None:
+    missing = np.flatnonzero(np.isnan(values) & rows)
+    if missing.size:
+        raise ValueError(f"No {what} available for rows {missing[:10].tolist()}"
+                         f"{' ...' if missing.size > 10 else ''}")
+
+
+def _prepare(fleet: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Edition- and date-independent stage: pressure design thickness and the
+    integer codes used for structural table lookups
+    """
+    n = _fleet_length(fleet)
+    schedule = _column(fleet, "schedule", n, str)
+    nps = _column(fleet, "nps", n, str)
+    pressure = _column(fleet, "pressure", n, float)
+    pressure_class = _column(fleet, "pressure_class", n, int)
+    metallurgy = _column(fleet, "metallurgy", n, str)
+    S = _column(fleet, "allowable_stress", n, float)
+    design_temp = _column(fleet, "design_temp", n, str)
+    pipe_config = _column(fleet, "pipe_config", n, str)
+    corrosion_rate = _column(fleet, "corrosion_rate", n, float)
+    default_retirement_limit = _column(fleet, "default_retirement_limit", n, float)
+    measured_thickness = _column(fleet, "measured_thickness", n, float)
+    year_inspected = _years(fleet, "year_inspected", n)
+    joint_type = _column(fleet, "joint_type", n, str)
+
+    everywhere = np.ones(n, dtype=bool)
+
+    # Joint efficiency and weld strength reduction factors, per row
+    temp_index = _temperature_index(design_temp)
+    joint_code = _codes(joint_type, JOINT_TYPES, "joint_type")
+    E = E_GRID[joint_code, temp_index]
+    W = W_GRID[joint_code, temp_index]
+
+    # Pipe dimensions by binary search over the sorted (NPS, schedule) table
+    D, _ = dimensions.lookup(_nps_values(nps), _schedule_codes(schedule))
+    _check_lookup(D, "outside diameter for NPS/schedule", everywhere)
+
+    # Material dispatch through integer codes into the compiled grids
+    material_code = _codes(metallurgy, MATERIAL_NAMES, "metallurgy")
+    Y = Y_GRID[material_code, temp_index]
+    _check_lookup(Y, "Y coefficient", everywhere)
+    S = np.where(np.isnan(S), ALLOWABLE_GRID[material_code, temp_index], S)
+    _check_lookup(S, "allowable stress", everywhere)
+
+    # Bend factor: 1 for straight pipe, intrados/extrados factor for 90LR elbows
+    inner = pipe_config == "90LR - Inner Elbow"
+    outer = pipe_config == "90LR - Outer Elbow"
+    unknown_config = ~np.isin(pipe_config, PIPE_CONFIGS)
+    if unknown_config.any():
+        raise ValueError(f"Invalid pipe configuration {sorted(set(pipe_config[unknown_config].tolist()))}")
+    nps_keys, nps_inverse = _nps_table_keys(nps)
+    bend_factor = np.ones(n)
+    if (inner | outer).any():
+        R = _radii(nps_keys, nps_inverse)
+        _check_lookup(R, "ANSI radius", inner | outer)
+        ratio = 4 * (R / D)
+        bend_factor = np.where(inner, (ratio - 1) / (ratio - 2), bend_factor)
+        bend_factor = np.where(outer, (ratio + 1) / (ratio + 2), bend_factor)
+
+    tmin_pressure = (pressure * D) / (2 * ((S * E * W) / bend_factor + pressure * Y))
+
+    return {
+        "n": n,
+        "measured_thickness": measured_thickness,
+        "year_inspected": year_inspected,
+        "corrosion_rate": corrosion_rate,
+        "default_retirement_limit": default_retirement_limit,
+        "tmin_pressure": tmin_pressure,
+        "material_code": material_code,
+        "class_code": _codes(pressure_class, PRESSURE_CLASSES, "pressure_class"),
+        "nps_keys": nps_keys,
+        "nps_inverse": nps_inverse,
+    }
+
+
+def _project(state: Dict[str, Any], as_of: np.ndarray) -> np.ndarray:
+    """
+    Present-day thickness at the given as-of decimal years
+
+    A scalar as_of gives one thickness per row; a column of m dates (shape (m, 1))
+    broadcasts against the rows and gives an (m, n) thickness-versus-time grid.
+    """
+    year_inspected = state["year_inspected"]
+    corrosion_rate = state["corrosion_rate"]
+    corroding = ~np.isnan(year_inspected) & ~np.isnan(corrosion_rate)
+    years_elapsed = np.where(corroding, as_of - year_inspected, 0.0)
+    future = np.flatnonzero((years_elapsed < 0).any(axis=0) if years_elapsed.ndim > 1 else years_elapsed < 0)
+    if future.size:
+        raise ValueError(f"Inspection year cannot be in the future (rows {future[:10].tolist()})")
+    return np.where(corroding, state["measured_thickness"] - (corrosion_rate * 0.001) * years_elapsed,
+                    state["measured_thickness"])
+
+
+def _structural(state: Dict[str, Any], editions: np.ndarray) -> np.ndarray:
+    """Structural thickness per row from each row's code edition, one vectorized lookup per edition"""
+    tmin_structural = np.full(state["n"], np.nan)
+    for name in np.unique(editions).tolist():
+        edition = get_edition(name)
+        rows = editions == name
+        nps_index = edition.nps_index(state["nps_keys"])[state["nps_inverse"]]
+        tmin_structural[rows] = edition.lookup(state["material_code"][rows], nps_index[rows],
+                                               state["class_code"][rows])
+    _check_lookup(tmin_structural, "API 574 structural thickness", np.ones(state["n"], dtype=bool))
+    return tmin_structural
+
+
+def _results(state: Dict[str, Any], tmin_structural: np.ndarray,
+             actual_thickness: np.ndarray) -> Dict[str, np.ndarray]:
+    """Governing thickness, retirement limits and life span from both design stages"""
+    tmin_pressure = state["tmin_pressure"]
+
+    pressure_governs = tmin_pressure >= tmin_structural
+    governing_thickness = np.where(pressure_governs, tmin_pressure, tmin_structural)
+    governing_type = np.where(pressure_governs, "pressure", "structural")
+
+    below_defaultRL = state["default_retirement_limit"] - actual_thickness
+    below_defaultRL = np.where(below_defaultRL >= 0, below_defaultRL, np.nan)
+
+    above_api574RL = np.where(tmin_structural < actual_thickness, actual_thickness - tmin_structural, np.nan)
+    life_span = np.floor((above_api574RL * 1000) * state["corrosion_rate"])
+
+    return {
+        "measured_thickness": state["measured_thickness"],
+        "year_inspected": state["year_inspected"],
+        "actual_thickness": actual_thickness,
+        "tmin_pressure": tmin_pressure,
+        "tmin_structural": tmin_structural,
+        "default_retirement_limit": state["default_retirement_limit"],
+        "below_defaultRL": below_defaultRL,
+        "api574_RL": tmin_structural,
+        "above_api574RL": above_api574RL,
+        "life_span": life_span,
+        "governing_thickness": governing_thickness,
+        "governing_type": governing_type,
+    }
+
+
+def _scatter(results: Dict[str, np.ndarray], valid: np.ndarray) -> Dict[str, np.ndarray]:
+    """Expand results computed for the valid rows back to the full fleet length"""
+    full = {}
+    for name, values in results.items():
+        if values.dtype.kind in "US":
+            column = np.full(len(valid), "", dtype=values.dtype if values.size else "<U10")
+        else:
+            column = np.full(len(valid), np.nan)
+        column[valid] = values
+        full[name] = column
+    full["valid"] = valid
+    return full
+
+
+@profiled("batch.analyze")
+def analyze_batch(fleet: Mapping[str, Any], as_of=None, errors: str = "raise",
+                  validation=None, units=None) -> Dict[str, np.ndarray]:
+    """
+    Analyze a whole fleet of pipe readings in a single vectorized pass
+
+    Args:
+        fleet: Mapping of column name -> sequence (or scalar) of pipe fields and readings
+        as_of: Date the present-day thickness is projected to (date, ISO string or decimal year),
+            default today
+        errors: "raise" to fail on the first invalid column, or "reject" to validate the
+            fleet first (see tmin.validation) and analyze only the valid rows
+        validation: validate_batch result already computed for this fleet, reused by
+            errors="reject" instead of validating again
+        units: Unit system of the fleet and the thickness results (see tmin.units),
+            default psi, inches and mpy
+
+    Returns:
+        Dict of result arrays keyed like PIPE.analysis, with NaN where PIPE.analysis returns None.
+        With errors="reject", rejected rows are NaN (governing_type "") and a boolean
+        "valid" array marks the analyzed rows.
+    """
+    units = get_units(units)
+    fleet = units.to_internal(fleet)
+    if errors == "reject":
+        from .validation import validate_batch
+        if validation is None:
+            with stage("batch.validate"):
+                validation = validate_batch(fleet, as_of)
+        valid = validation.valid
+        if not valid.any():
+            empty = {name: np.array([]) for name in RESULT_COLUMNS}
+            empty["governing_type"] = np.array([], dtype=str)
+            return _scatter(empty, valid)
+        return units.from_internal(_scatter(_analyze(validation.subset(fleet), as_of), valid))
+    if errors != "raise":
+        raise ValueError(f"errors must be 'raise' or 'reject', got '{errors}'")
+    return units.from_internal(_analyze(fleet, as_of))
+
+
+@metered("batch")
+def _analyze(fleet: Mapping[str, Any], as_of) -> Dict[str, np.ndarray]:
+    """analyze_batch on a fleet that is valid or should raise"""
+    with stage("batch.lookup"):
+        state = _prepare(fleet)
+        editions = _column(fleet, "API_table", state["n"], str)
+        tmin_structural = _structural(state, editions)
+    with stage("batch.project"):
+        actual_thickness = _project(state, as_of_year(as_of))
+    with stage("batch.results"):
+        return _results(state, tmin_structural, actual_thickness)
+
+
+def analyze_editions(fleet: Mapping[str, Any], editions: Sequence[str],
+                     as_of=None, units=None) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Evaluate the same fleet under several code editions at once
+
+    The pressure design stage is computed once and shared; only the structural
+    lookup and governing comparison are repeated per edition.
+
+    Args:
+        fleet: Mapping of column name -> sequence (or scalar) of pipe fields and readings
+        editions: Names of registered editions (see tmin.editions)
+        as_of: Date the present-day thickness is projected to, default today
+        units: Unit system of the fleet and the thickness results, as for analyze_batch
+
+    Returns:
+        Dict of edition name -> result arrays as returned by analyze_batch
+    """
+    units = get_units(units)
+    state = _prepare(units.to_internal(fleet))
+    actual_thickness = _project(state, as_of_year(as_of))
+    return {
+        name: units.from_internal(_results(state, _structural(state, np.full(state["n"], name)), actual_thickness))
+        for name in editions
+    }
+
+
+def project_batch(fleet: Mapping[str, Any], as_of_dates: Sequence[Any], units=None) -> Dict[str, np.ndarray]:
+    """
+    Evaluate a fleet at many as-of dates in one vectorized call
+
+    Table lookups and pressure design run once; only the corrosion projection is
+    broadcast over the dates, giving thickness-versus-time for every row.
+
+    Args:
+        fleet: Mapping of column name -> sequence (or scalar) of pipe fields and readings
+        as_of_dates: Dates (date, ISO string or decimal year) to project to
+        units: Unit system of the fleet and the thickness results, as for analyze_batch
+
+    Returns:
+        Dict keyed like analyze_batch plus "as_of" (decimal years, shape (m,)). Date-dependent
+        results (actual_thickness, below_defaultRL, above_api574RL, life_span) have shape (m, n),
+        the rest shape (n,)
+    """
+    units = get_units(units)
+    fleet = units.to_internal(fleet)
+    as_of = decimal_years(list(as_of_dates))
+    state = _prepare(fleet)
+    editions = _column(fleet, "API_table", state["n"], str)
+    results = _results(state, _structural(state, editions), _project(state, as_of[:, None]))
+    results["as_of"] = as_of
+    return units.from_internal(results)
+
+
+def fleet_from_pipes(pipes: Iterable[PIPE], measured_thickness, year_inspected=None,
+                     joint_type="Seamless") -> Dict[str, list]:
+    """
+    Build a fleet mapping from PIPE instances and their readings
+
+    Args:
+        pipes: PIPE instances, one per row
+        measured_thickness: Measured thickness per pipe (or one value for all)
+        year_inspected: Inspection year per pipe (or one value for all)
+        joint_type: Joint type per pipe (or one value for all)
+    """
+    pipes = list(pipes)
+    fields = list(PIPE.__dataclass_fields__)
+    fleet = {name: [getattr(p, name) for p in pipes] for name in fields}
+    fleet["measured_thickness"] = measured_thickness
+    fleet["year_inspected"] = year_inspected
+    fleet["joint_type"] = joint_type
+    return fleet
@@ -6,24 +6,76 @@ Command Line Interface for TMIN Package
 import argparse
 import sys
 import textwrap
-import toml
+from contextlib import nullcontext
 from pathlib import Path
 from .core import PIPE
+from .batch import analyze_batch
+from .editions import available_editions, load_edition_file
+from .export import write_results
+from .manifest import READINGS, is_manifest, manifest_fleet, read_manifest, report_names
+from .metrics import METRICS
+from .profiling import profile
+from .units import UNIT_SYSTEMS, get_units
 
 def load_config_from_toml(file_path):
-    """Load pipe configuration from TOML file"""
+    """Load a pipe configuration or fleet manifest from a TOML, YAML or JSON file"""
     try:
-        with open(file_path, 'r') as f:
-            config = toml.load(f)
-        return config
+        return read_manifest(file_path)
     except Exception as e:
-        print(f"Error loading TOML file: {e}")
+        print(f"Error loading configuration file: {e}")
         sys.exit(1)
 
+def run_manifest(args, manifest, output_dir):
+    """Analyze every reading of a fleet manifest in one batch and write its reports"""
+    from .report_generator import ReportGenerator, dated_path
+    from .validation import validate_batch
+
+    fleet = manifest_fleet(manifest, args.readings)
+    n = len(fleet["measured_thickness"])
+    print(f"\nAnalyzing {n} readings from {args.file}")
+
+    validation = validate_batch(fleet, args.as_of)
+    units = get_units(args.units, args.precision)
+    results = analyze_batch(fleet, as_of=args.as_of, errors="reject", validation=validation, units=units)
+
+    report_gen = ReportGenerator(units)
+    report_gen.reports_dir = str(output_dir)
+    if args.by_severity:
+        files = {"reports": run_by_severity(args, fleet, results, output_dir, units)}
+    else:
+        files = {"reports": report_gen.write_batch_reports(fleet, results, archive=args.archive,
+                                                           names=report_names(fleet))}
+    files["results"] = dated_path(str(output_dir), f"TMIN_results.{args.results_format}")
+    write_results(files["results"], fleet, results, units=units)
+    if validation.n_rejected:
+        print(validation.summary())
+        files["rejected_rows"] = validation.write_report(dated_path(str(output_dir), "TMIN_rejected_rows.csv"))
+    return files
+
+def run_by_severity(args, fleet, results, output_dir, units):
+    """Write each reading's report and plots, most severe first, printing each as it finishes"""
+    from concurrent.futures import ProcessPoolExecutor
+    from .scheduler import iter_prioritized_reports
+    from .tablecache import attach_tables, share_tables
+
+    executor = None
+    if args.workers > 1:
+        share_tables()
+        executor = ProcessPoolExecutor(args.workers, initializer=attach_tables)
+    try:
+        for report in iter_prioritized_reports(fleet, args.as_of, str(output_dir), names=report_names(fleet),
+                                               executor=executor, window=2 * args.workers, results=results,
+                                               units=units):
+            print(f"  [{report.severity}] {report.name}: {report.files['full_report']}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return str(output_dir)
+
 def validate_required_args(args):
     """Check if we have all the important stuff we need"""
     required_fields = {
-        'schedule': 'Pipe schedule (10, 40, 80, 120, 160)',
+        'schedule': 'Pipe schedule (10, 40, 80, STD, XS, 10S, ...)',
         'nps': 'Nominal pipe size (e.g., "2", "3/4")',
         'pressure': 'Design pressure (psi)',
         'pressure_class': 'Pressure class (150, 300, 600, 900, 1500, 2500)',
@@ -65,7 +117,7 @@ def print_disclaimer():
     )
     print(textwrap.fill(disclaimer, width=80, replace_whitespace=False, subsequent_indent='    '))
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="TMIN - Pipe Thickness Analysis Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -83,6 +135,24 @@ Examples:
   # Analysis using TOML configuration file
   tmin -f pipe_config.toml -t 0.060
 
+  # Whole fleet from a manifest with [[pipe]] entries (TOML, YAML or JSON)
+  tmin -f fleet.toml --archive zip --results-format csv
+
+  # Per-reading reports and plots for a turnaround, worst pipes first
+  tmin -f fleet.toml --by-severity --workers 8
+
+  # Fleet manifest measured in MPa, mm and mm/yr
+  tmin -f fleet.toml --units metric
+
+  # Analysis against an owner-user code edition
+  tmin -f pipe_config.toml -t 0.060 --edition-file owner_2026.toml --api-table OWNER-2026
+
+  # Print a per-stage timing breakdown and save cProfile / Chrome-trace dumps
+  tmin -f pipe_config.toml -t 0.060 --profile --profile-dir ./profile
+
+  # Leave Prometheus metrics for the node_exporter textfile collector
+  tmin -f pipe_config.toml -t 0.060 --metrics-file /var/lib/node_exporter/tmin.prom
+
   # Show help
   tmin --help
         """
@@ -92,7 +162,7 @@ Examples:
     parser.add_argument(
         '-f', '--file',
         type=str,
-        help='Load configuration from TOML file'
+        help='Load a pipe configuration, or a fleet manifest with [[pipe]] entries, from TOML, YAML or JSON'
     )
 
     # Output directory
@@ -107,8 +177,8 @@ Examples:
     parser.add_argument(
         '-s', '--schedule',
         type=str,
-        choices=['10', '40', '80', '120', '160'],
-        help='Pipe schedule'
+        choices=PIPE.VALID_SCHEDULES,
+        help='Pipe schedule or wall designation (ASME B36.10M / B36.19M)'
     )
     parser.add_argument(
         '-n', '--nps',
@@ -172,13 +242,77 @@ Examples:
         '--api-table',
         type=str,
         default='2025',
-        choices=['2025', '2009'],
-        help='API table version (default: 2025)'
+        help='API table edition, 2025, 2009 or one loaded with --edition-file (default: 2025)'
+    )
+    parser.add_argument(
+        '--edition-file',
+        type=str,
+        action='append',
+        help='Load an owner-user code edition from a TOML, JSON or NPZ data file (repeatable)'
     )
     parser.add_argument(
         '-y', '--year-inspected',
+        help='Year or ISO date when thickness was measured (e.g. 2023 or 2023-06-30)'
+    )
+    parser.add_argument(
+        '--as-of',
+        help='Date to project the present-day thickness to, ISO date or decimal year (default: today)'
+    )
+    parser.add_argument(
+        '--readings',
+        choices=list(READINGS),
+        default='latest',
+        help='Manifest readings to analyze: each CML\'s latest, or all of them (default: latest)'
+    )
+    parser.add_argument(
+        '--archive',
+        choices=['zip', 'tar', 'txt'],
+        default='zip',
+        help='Manifest report archive format (default: zip)'
+    )
+    parser.add_argument(
+        '--results-format',
+        choices=['csv', 'jsonl'],
+        default='csv',
+        help='Manifest results file format (default: csv)'
+    )
+    parser.add_argument(
+        '--units',
+        choices=list(UNIT_SYSTEMS),
+        default='imperial',
+        help='Manifest runs: units of the pressure, thickness and corrosion rate columns, also used in '
+             'the reports and results file (default: imperial, psi/inches/mpy)'
+    )
+    parser.add_argument(
+        '--precision',
+        type=int,
+        help='Decimal places of thicknesses in reports and plots (default: 4, 3 on the number line plot)'
+    )
+    parser.add_argument(
+        '--by-severity',
+        action='store_true',
+        help='Manifest runs: write one report and plots per reading, most severe first, instead of an archive'
+    )
+    parser.add_argument(
+        '--workers',
         type=int,
-        help='Year when thickness was measured'
+        default=1,
+        help='With --by-severity, render in this many worker processes (default: 1)'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Time each stage (analysis, reports, plots, file writes) and print a breakdown'
+    )
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        help='With --profile, write tmin.prof (cProfile) and tmin_trace.json (Chrome trace) here'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        type=str,
+        help='Write Prometheus text-format metrics to this file when the run ends'
     )
     parser.add_argument(
         '--no-disclaimer',
@@ -186,61 +320,99 @@ Examples:
         help='Skip disclaimer message'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Print disclaimer unless skipped
     if not args.no_disclaimer:
         print_disclaimer()
 
     # Load configuration from TOML file if provided
+    manifest = None
     if args.file:
         config = load_config_from_toml(args.file)
-        # Update args with TOML values (command line args take precedence)
-        for key, value in config.items():
-            if not hasattr(args, key) or getattr(args, key) is None:
-                setattr(args, key, value)
+        if is_manifest(config):
+            manifest = config
+        else:
+            # Update args with TOML values (command line args take precedence)
+            for key, value in config.items():
+                if not hasattr(args, key) or getattr(args, key) is None:
+                    setattr(args, key, value)
+
+    # Register owner-user code editions before validating the selected one
+    for edition_file in args.edition_file or []:
+        try:
+            load_edition_file(edition_file)
+        except Exception as e:
+            print(f"Error loading edition file: {e}")
+            sys.exit(1)
+    if args.api_table not in available_editions():
+        print(f"Error: Unknown API table edition '{args.api_table}'. Available editions: {available_editions()}")
+        sys.exit(1)
 
     # Validate required arguments
-    validate_required_args(args)
+    if manifest is None:
+        if args.units != 'imperial':
+            print("Error: --units applies to fleet manifests; single-pipe runs take psi, inches and mpy")
+            sys.exit(1)
+        validate_required_args(args)
 
     # Set up output directory
     output_dir = Path(args.output)
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    profiling = profile(args.profile_dir) if args.profile else nullcontext()
+    if args.metrics_file:
+        METRICS.enable()
 
     try:
-        # Create pipe instance
-        pipe = PIPE(
-            schedule=args.schedule,
-            nps=args.nps,
-            pressure=args.pressure,
-            pressure_class=args.pressure_class,
-            metallurgy=args.metallurgy,
-            allowable_stress=args.allowable_stress,
-            design_temp=args.design_temp,
-            pipe_config=args.pipe_config,
-            corrosion_rate=args.corrosion_rate,
-            default_retirement_limit=args.default_retirement_limit,
-            API_table=args.api_table
-        )
-
-        # Generate full report
-        print(f"\nGenerating analysis and reports in: {output_dir}")
-        report_files = pipe.report(
-            measured_thickness=args.measured_thickness,
-            year_inspected=args.year_inspected
-        )
+        with profiling as profiler:
+            if manifest is not None:
+                report_files = run_manifest(args, manifest, output_dir)
+            else:
+                # Create pipe instance
+                pipe = PIPE(
+                    schedule=args.schedule,
+                    nps=args.nps,
+                    pressure=args.pressure,
+                    pressure_class=args.pressure_class,
+                    metallurgy=args.metallurgy,
+                    allowable_stress=args.allowable_stress,
+                    design_temp=args.design_temp,
+                    pipe_config=args.pipe_config,
+                    corrosion_rate=args.corrosion_rate,
+                    default_retirement_limit=args.default_retirement_limit,
+                    API_table=args.api_table
+                )
+
+                # Generate full report
+                print(f"\nGenerating analysis and reports in: {output_dir}")
+                report_files = pipe.report(
+                    measured_thickness=args.measured_thickness,
+                    year_inspected=args.year_inspected,
+                    as_of=getattr(args, 'as_of', None),
+                    precision=args.precision
+                )
 
         print("\nAnalysis complete! Generated files:")
         for file_type, file_path in report_files.items():
             if file_type != "analysis_results":
                 print(f"  {file_type}: {file_path}")
 
+        if profiler is not None:
+            print("\nProfile:")
+            print(profiler.summary())
+            if args.profile_dir:
+                print(f"  cProfile stats and Chrome trace written to: {args.profile_dir}")
+
     except ValueError as e:
         print(f"Error: Invalid input - {e}")
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if args.metrics_file:
+            METRICS.write_textfile(args.metrics_file)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
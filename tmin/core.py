@@ -4,30 +4,37 @@ from .asmetables.y_coeff import ferritic_steels_y, austenitic_steels_y, other_me
 from .asmetables.api_574_2025 import API574_CS_400F, API574_SS_400F
 from .asmetables.api_574_2009 import API574_2009_TABLE_6
 from .asmetables.ANSI_radii import ANSI_radii
+from .asmetables.joint_efficiency import joint_efficiency_E, weld_strength_W
+from .asmetables.materials import MATERIALS
+from .asmetables.pipe_dimensions import pipe_schedules
+from .editions import get_edition
+from .dimensions import get_dimensions, nps_to_float
+from .dates import as_of_year, decimal_year
+from .profiling import profiled
+from .metrics import metered
 
 import numpy as np
 from dataclasses import dataclass
 from typing import Literal, Optional, Dict
-import matplotlib.pyplot as plt
 from datetime import datetime
 
 @dataclass
 class PIPE:
 
-    schedule: str  # Pipe schedule (10, 40, 80, 120, 160)
+    schedule: str  # Pipe schedule or wall designation (10, 40, 80, STD, XS, 10S, ...)
     nps: str  # Nominal pipe size (e.g., '2', '3/4', '1-1/2')
     pressure: float  # Design pressure (psi)
     pressure_class: Literal[150, 300, 600, 900, 1500, 2500]
     metallurgy: Literal["Intermediate/Low CS", "SS 316/316L", "SS 304/304L", "Inconel 625", "Other"]
-    allowable_stress: float # User defined Allowable Stress
+    allowable_stress: Optional[float] # User defined Allowable Stress, None uses the material's curve
     design_temp: Literal["<900" ,900, 950, 1000, 1050, 1100, 1150, 1200, 1250, "1250+" ] = 900 
     pipe_config: Literal["straight", "90LR - Inner Elbow", "90LR - Outer Elbow"] = "straight"
     corrosion_rate: Optional[float] = None #mpy 
     default_retirement_limit: Optional[float] = None
-    API_table : Literal["2025", "2009"] = "2025"
+    API_table : Literal["2025", "2009"] = "2025" # Or any edition registered in tmin.editions
 
     VALID_PIPE_TYPES = ["straight", "bend-90", "bend-45", "tee", "elbow"]
-    VALID_SCHEDULES = ["10", "40", "80", "120", "160"]
+    VALID_SCHEDULES = pipe_schedules
 
     trueOD_10 = trueOD_10
     trueOD_40 = trueOD_40
@@ -44,25 +51,13 @@ class PIPE:
     API574_CS_400F = API574_CS_400F
     API574_SS_400F = API574_SS_400F
     API574_2009_TABLE_6 = API574_2009_TABLE_6
+    joint_efficiency_E = joint_efficiency_E
+    weld_strength_W = weld_strength_W
+    MATERIALS = MATERIALS
 
     def _convert_nps_to_float(self, nps_str: str) -> float:
-        """Convert NPS string to float, handling fractions like '3/4'"""
-        try:
-            return float(nps_str)
-        except ValueError:
-            try:
-                if '-' in nps_str:
-                    parts = nps_str.split('-')
-                    if len(parts) == 2:
-                        whole = float(parts[0])
-                        fraction = eval(parts[1])
-                        return whole + fraction
-                    else:
-                        raise ValueError(f"Invalid NPS format: {nps_str}")
-                else:
-                    return eval(nps_str)
-            except:
-                raise ValueError(f"Could not convert NPS '{nps_str}' to float")
+        """Convert NPS string to float, handling fractions like '3/4' and '1-1/2'"""
+        return nps_to_float(nps_str)
 
     def _convert_nps_to_table_key(self, nps_str: str) -> str:
         """Convert NPS to table key format - strips .0 from whole numbers"""
@@ -75,61 +70,51 @@ class PIPE:
     def allowable(self, Syield) -> float:
         return Syield*(2/3)
 
+    def get_dimensions(self):
+        """Get (OD, nominal wall, ID) from ASME B36.10M / B36.19M, or None if not tabulated"""
+        if self.schedule not in self.VALID_SCHEDULES:
+            raise ValueError(f"Invalid schedule: {self.schedule}")
+        return get_dimensions(self.nps, self.schedule)
+
     def get_OD(self) -> float:
         """Get outside diameter based on schedule and NPS"""
-        if self.schedule == "10":
-            return self.trueOD_10.get(self.nps)
-        elif self.schedule == "40":
-            return self.trueOD_40.get(self.nps)
-        elif self.schedule == "80":
-            return self.trueOD_80.get(self.nps)
-        elif self.schedule == "120":
-            return self.trueOD_120.get(self.nps)
-        elif self.schedule == "160":
-            return self.trueOD_160.get(self.nps)
-        else:
-            raise ValueError(f"Invalid schedule: {self.schedule}")
+        dimensions = self.get_dimensions()
+        return dimensions[0] if dimensions is not None else None
 
     def get_ID(self) -> float:
         """Get nominal inside diameter based on schedule and NPS"""
-        from .asmetables.id_table import trueID_10, trueID_40, trueID_80, trueID_120, trueID_160
-        
-        if self.schedule == "10":
-            return trueID_10.get(self.nps)
-        elif self.schedule == "40":
-            return trueID_40.get(self.nps)
-        elif self.schedule == "80":
-            return trueID_80.get(self.nps)
-        elif self.schedule == "120":
-            return trueID_120.get(self.nps)
-        elif self.schedule == "160":
-            return trueID_160.get(self.nps)
-        else:
-            raise ValueError(f"Invalid schedule: {self.schedule}")
+        dimensions = self.get_dimensions()
+        return dimensions[2] if dimensions is not None else None
+
+    def get_material(self) -> dict:
+        """Get the material registry entry for this pipe's metallurgy"""
+        return self.MATERIALS.get(self.metallurgy, self.MATERIALS["Other"])
 
     def get_Y_coefficient(self) -> float:
         """Get Y coefficient from ASME B31.1 Table 104.1.2-1"""
-        if self.metallurgy =='CS A106 GR B':
-            return self.ferritic_steels_y[self.round_temp()]
-        elif self.metallurgy =='SS 316/316S':
-            return self.austenitic_steels_y[self.round_temp()]
-        elif self.metallurgy =='Other':
-            return self.other_metals_y[self.round_temp()]
-        elif self.metallurgy =='Nickel Alloy':
-            return self.nickel_alloy_N06690_y[self.round_temp()]
-        elif self.metallurgy =='Nickel Alloys':
-            return self.nickel_alloys_N06617_N08800_N08810_N08825_y[self.round_temp()]
-        elif self.metallurgy =='Cast Iron':
-            return self.cast_iron_y[self.round_temp()]
-        else:
+        if self.metallurgy not in self.MATERIALS:
             return 0.4 # Default Y value for unknown metallurgy
+        return self.get_material()["y_table"][self.round_temp()]
+
+    def get_allowable_stress(self) -> float:
+        """Get the user-defined allowable stress, or the material's allowable stress curve value"""
+        if self.allowable_stress is not None:
+            return self.allowable_stress
+        curve = self.get_material()["allowable_stress"]
+        S = curve.get(self.round_temp()) if curve is not None else None
+        if S is None:
+            raise ValueError(f"No allowable stress curve for {self.metallurgy} at {self.design_temp} F, "
+                             f"allowable_stress must be specified")
+        return S
         
     def round_temp(self) -> int:
         """Used in temperature dependent look-up tables"""
         if self.design_temp == "<900":
             return 900
+        elif self.design_temp == "1250+":
+            return 1250
         else:
-            return self.design_temp 
+            return int(self.design_temp)
         
     def get_radii(self) -> float:
         """Get centerline radius for the pipe's NPS from ANSI standard"""
@@ -142,30 +127,23 @@ class PIPE:
         
         return radius
 
+    @profiled("pipe.tmin_pressure")
     def tmin_pressure(self, joint_type='Seamless') -> float:
         """
         Calculate minimum wall thickness for pressure design
         Based on ASME B31.1 Para. 304.1.2a Eq. 3a
         
         For seamless pipe (most common): E = 1.0, W = 1.0
-        For welded pipe: E and W depend on temperature and weld type
+        For welded pipe (ERW, EFW, ...): E and W depend on temperature and weld type
         """
         D = self.get_OD()
         if D is None:
             raise ValueError(f"Invalid NPS {self.nps} for schedule {self.schedule}")
         
-        S = self.allowable_stress  # User-defined allowable stress
+        S = self.get_allowable_stress()
         
         # Joint efficiency and weld strength reduction factors
-        if joint_type == 'Seamless':
-            E = 1.0  # Joint efficiency factor for seamless pipe
-            W = 1.0  # Weld strength reduction factor for seamless pipe
-        else:
-            # For welded pipe, E and W depend on temperature and weld type
-            # This would need to be implemented based on ASME B31.1 tables
-            raise ValueError(f"Welded pipe analysis (joint_type='{joint_type}') is not yet supported. "
-                           f"Currently only seamless pipe analysis is available. "
-                           f"Support for seam pipe is under development.")
+        E, W = self.get_joint_factors(joint_type)
         
         Y = self.get_Y_coefficient()
         if Y is None:
@@ -175,30 +153,38 @@ class PIPE:
             tmin_pressure = (self.pressure * D) / (2 * (S * E * W + self.pressure * Y))
             return tmin_pressure
         
-        elif self.pipe_config == '90LR - Inner Elbow':
-            R_ = self.get_radii()
-            def intrados(R, D):
-                return (4*(R/D) - 1) / (4*(R/D) - 2)
-            def extrados(R, D): 
-                return (4*(R/D) + 1) / (4*(R/D) +2)
-
-            if self.pipe_config == '90LR - Outer Elbow':
-                return (self.pressure * D) / (2 * ((S*E*W)/(intrados(R_, D)) + self.pressure * Y))
+        R_ = self.get_radii()
+        def intrados(R, D):
+            return (4*(R/D) - 1) / (4*(R/D) - 2)
+        def extrados(R, D): 
+            return (4*(R/D) + 1) / (4*(R/D) +2)
+
+        if self.pipe_config == '90LR - Inner Elbow':
+            return (self.pressure * D) / (2 * ((S*E*W)/(intrados(R_, D)) + self.pressure * Y))
         
-            elif self.pipe_config == '90LR - Outer Elbow':
-                return (self.pressure * D) / (2 * ((S*E*W)/(extrados(R_, D)) + self.pressure * Y))
+        elif self.pipe_config == '90LR - Outer Elbow':
+            return (self.pressure * D) / (2 * ((S*E*W)/(extrados(R_, D)) + self.pressure * Y))
+
+        else:
+            raise ValueError(f"Invalid pipe configuration: {self.pipe_config}")
+
+    def get_joint_factors(self, joint_type='Seamless'):
+        """
+        Get joint efficiency (E) and weld strength reduction (W) factors
+        from ASME B31.1 Tables 102.4.3 and 102.4.7
+        """
+        if joint_type not in self.joint_efficiency_E:
+            raise ValueError(f"Unknown joint_type '{joint_type}'. "
+                           f"Valid joint types: {list(self.joint_efficiency_E)}")
+        temp = self.round_temp()
+        return self.joint_efficiency_E[joint_type][temp], self.weld_strength_W[joint_type][temp]
         
+    @profiled("pipe.tmin_structural")
     def tmin_structural(self) -> float:
-        """API 574 Table D.2"""
-        if self.API_table == "2025":
-            nps_key = self._convert_nps_to_table_key(self.nps)
-            min_structural = self.API574_CS_400F[nps_key][self.pressure_class]
-            return min_structural
-        
-        else:
-            nps_key = self._convert_nps_to_table_key(self.nps)
-            min_structural = self.API574_2009_TABLE_6[nps_key]["default_minimum_structural_thickness"]
-            return min_structural
+        """API 574 Table D.2 (or the table of the registered edition named by API_table)"""
+        nps_key = self._convert_nps_to_table_key(self.nps)
+        edition = get_edition(self.API_table)
+        return edition.structural_thickness(self.metallurgy, nps_key, self.pressure_class)
     
     def life_span(self, excess, corrosion_rate) -> float:
         return np.floor(self.mil_conv(excess)*corrosion_rate)
@@ -267,23 +253,26 @@ class PIPE:
     # ANALYSIS
     ####################################################################################
 
-    def analysis(self, measured_thickness: float, year_inspected: Optional[int] = None, joint_type='Seamless'):
+    @metered("pipe")
+    @profiled("pipe.analysis")
+    def analysis(self, measured_thickness: float, year_inspected: Optional[int] = None, joint_type='Seamless',
+                 as_of=None):
         """
         Analyze pipe thickness against pressure and structural requirements
         
         Args:
             measured_thickness: Thickness measured during inspection (inches)
-            year_inspected: Year when thickness was measured (e.g., 2020)
+            year_inspected: Year or date when thickness was measured (e.g., 2020 or date(2020, 6, 30))
             joint_type: Joint type for calculations
+            as_of: Date the present-day thickness is projected to (date, ISO string or decimal year), default today
             
         Returns:
             Dict with analysis results and governing factor
         """
         
-        # Calculate present-day actual thickness based on inspection year and corrosion rate
+        # Calculate present-day actual thickness based on inspection date and corrosion rate
         if year_inspected is not None and self.corrosion_rate is not None:
-            current_year = 2025
-            years_elapsed = current_year - year_inspected
+            years_elapsed = as_of_year(as_of) - decimal_year(year_inspected)
             
             if years_elapsed < 0:
                 raise ValueError(f"Inspection year {year_inspected} cannot be in the future")
@@ -294,7 +283,7 @@ class PIPE:
             
             print(f"Time-based corrosion calculation:")
             print(f"  Measured thickness: {measured_thickness:.4f} inches (year {year_inspected})")
-            print(f"  Years elapsed: {years_elapsed}")
+            print(f"  Years elapsed: {years_elapsed:.2f}")
             print(f"  Corrosion rate: {self.corrosion_rate} mpy")
             print(f"  Corrosion loss: {corrosion_loss_inches:.4f} inches")
             print(f"  Present-day thickness: {actual_thickness:.4f} inches")
@@ -346,6 +335,8 @@ class PIPE:
                 corosion_allowance = None
 
         else:
+            api574_value = self.tmin_structural()
+            corosion_allowance = actual_thickness - api574_value if api574_value < actual_thickness else None
             if governing_thickness >= actual_thickness:
                 print(f"Actual Thickness is {governing_thickness - actual_thickness} inches ({self.mil_conv(governing_thickness - actual_thickness)} Mils), Retire Pipe Immediately, miniumum pressure containing thickness is not satisfied")
         
@@ -364,41 +355,72 @@ class PIPE:
             "governing_type": governing_type,
         }
 
-    def report(self, measured_thickness: float, year_inspected: Optional[int] = None, joint_type='Seamless') -> Dict[str, str]:
+    @profiled("pipe.report")
+    def report(self, measured_thickness: float, year_inspected: Optional[int] = None, joint_type='Seamless',
+               as_of=None, precision: Optional[int] = None) -> Dict[str, str]:
         """
         Generate analysis with text report and visualizations
         
         Args:
             measured_thickness: Thickness measured during inspection (inches)
-            year_inspected: Year when thickness was measured (e.g., 2020)
+            year_inspected: Year or date when thickness was measured (e.g., 2020)
             joint_type: Joint type for calculations
+            as_of: Date the present-day thickness is projected to, default today
+            precision: Decimal places of thicknesses in the reports and plots
+                (default: 4 in reports and the comparison chart, 3 on the number line)
             
         Returns:
             Dict containing paths to generated files
         """
-        from .report_generator import ReportGenerator
+        from .report_generator import ReportGenerator, run_id
+        from .units import get_units
         from .visualization import ThicknessVisualizer
         
+        units = get_units(None, precision)
+        
+        # One ID per call names every file, so concurrent reports never share a path
+        report_id = run_id()
+        
         # Perform analysis
-        analysis_results = self.analysis(measured_thickness, year_inspected, joint_type)
+        analysis_results = self.analysis(measured_thickness, year_inspected, joint_type, as_of)
         
         # Get the present-day actual thickness from results
         actual_thickness = analysis_results['actual_thickness']
         
         # Generate reports
-        report_gen = ReportGenerator()
-        full_report_path = report_gen.generate_report(self, analysis_results, actual_thickness)
-        summary_report_path = report_gen.generate_summary_report(self, analysis_results, actual_thickness)
+        report_gen = ReportGenerator(units)
+        full_report_path = report_gen.generate_report(self, analysis_results, actual_thickness,
+                                                      analysis_id=f"TMIN_{report_id}")
+        summary_report_path = report_gen.generate_summary_report(self, analysis_results, actual_thickness,
+                                                                 filename=f"TMIN_summary_{report_id}")
+        json_report_path = report_gen.generate_json_report(self, analysis_results,
+                                                           filename=f"TMIN_results_{report_id}")
         
         # Generate visualizations
-        visualizer = ThicknessVisualizer()
-        number_line_path = visualizer.create_thickness_number_line(self, analysis_results, actual_thickness)
-        comparison_chart_path = visualizer.create_comparison_chart(analysis_results, actual_thickness)
+        visualizer = ThicknessVisualizer(units)
+        number_line_path = visualizer.create_thickness_number_line(
+            self, analysis_results, actual_thickness, filename=f"thickness_analysis_number_line_{report_id}")
+        comparison_chart_path = visualizer.create_comparison_chart(
+            analysis_results, actual_thickness, filename=f"thickness_comparison_chart_{report_id}")
         
         return {
             "full_report": full_report_path,
             "summary_report": summary_report_path,
+            "json_report": json_report_path,
             "number_line_plot": number_line_path,
             "comparison_chart": comparison_chart_path,
             "analysis_results": analysis_results
-        }
\ No newline at end of file
+        }
+
+    async def analysis_async(self, measured_thickness: float, year_inspected: Optional[int] = None,
+                             joint_type='Seamless', as_of=None, executor=None):
+        """analysis() run in an executor so an asyncio event loop is not blocked (see tmin.aio)"""
+        from .aio import analysis_async
+        return await analysis_async(self, measured_thickness, year_inspected, joint_type, as_of, executor)
+
+    async def report_async(self, measured_thickness: float, year_inspected: Optional[int] = None,
+                           joint_type='Seamless', as_of=None, executor=None,
+                           precision: Optional[int] = None) -> Dict[str, str]:
+        """report() rendered in an executor so an asyncio event loop is not blocked (see tmin.aio)"""
+        from .aio import report_async
+        return await report_async(self, measured_thickness, year_inspected, joint_type, as_of, executor, precision)
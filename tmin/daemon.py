@@ -0,0 +1,344 @@
+"""
+Warm local worker for the tmin command
+
+`tmin daemon start` keeps one interpreter running with NumPy, the compiled
+lookup tables and the Agg matplotlib backend already loaded, listening on a
+Unix domain socket. Every later `tmin ...` invocation forwards its arguments,
+working directory and the environment variables tmin reads (TMIN_* and TZ) to
+the daemon, which forks a copy of the warm interpreter to run the command and
+streams its output back. When no
+daemon is running (or on platforms without Unix sockets and fork) the command
+runs in-process as before. Set TMIN_NO_DAEMON=1 to always run in-process.
+
+The socket lives in $XDG_RUNTIME_DIR or a private 0700 directory under the
+temp directory and is created 0600. Before forwarding anything, the client
+checks that the socket belongs to the current user and is not accessible to
+anyone else, and (where SO_PEERCRED is available) that the process listening on
+it runs as the current user, so a socket planted by another user is ignored.
+
+Only the standard library is imported at module level, so forwarding a
+command does not pay NumPy or matplotlib startup.
+"""
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Sequence
+
+PROTOCOL = 1
+
+SUPPORTED = hasattr(socket, "AF_UNIX") and hasattr(os, "fork")
+
+# Environment variables a forwarded command runs with: the ones tmin reads
+FORWARDED_ENV_PREFIX = "TMIN_"
+FORWARDED_ENV = {"TZ"}
+
+
+def socket_path() -> str:
+    """Daemon socket: $TMIN_DAEMON_SOCKET, else tmin.sock in $XDG_RUNTIME_DIR or a private per-user temp directory"""
+    path = os.environ.get("TMIN_DAEMON_SOCKET")
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"tmin-{os.getuid()}")
+    return os.path.join(directory, "tmin.sock")
+
+
+def forwarded_env(environ: Dict[str, str]) -> Dict[str, str]:
+    """The variables of an environment that are forwarded to the daemon"""
+    return {name: value for name, value in environ.items()
+            if name.startswith(FORWARDED_ENV_PREFIX) or name in FORWARDED_ENV}
+
+
+def _private(path: str) -> bool:
+    """True when path (not followed if a symlink) is owned by this user and closed to group and others"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def _peer_is_user(conn: socket.socket) -> bool:
+    """Whether the other end of the socket runs as this user; True where SO_PEERCRED is unavailable"""
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        return True
+    credentials = conn.getsockopt(socket.SOL_SOCKET, option, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid == os.getuid()
+
+
+def _send(conn: socket.socket, message: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _connect(path: str, timeout: float = 1.0) -> Optional[socket.socket]:
+    """Connect to a daemon socket owned by this user, None when there is none to trust"""
+    if not SUPPORTED or not os.path.exists(path):
+        return None
+    if not stat.S_ISSOCK(os.lstat(path).st_mode) or not _private(path):
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(timeout)
+    try:
+        conn.connect(path)
+        trusted = _peer_is_user(conn)
+    except OSError:
+        trusted = False
+    if not trusted:
+        conn.close()
+        return None
+    conn.settimeout(None)
+    return conn
+
+
+def request(message: Dict[str, Any], path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Send one control message (ping or stop) and return the reply, None when no daemon is running"""
+    conn = _connect(path or socket_path())
+    if conn is None:
+        return None
+    with conn, conn.makefile("rb") as replies:
+        _send(conn, {"protocol": PROTOCOL, **message})
+        line = replies.readline()
+    return json.loads(line) if line else None
+
+
+def forward(argv: Sequence[str], path: Optional[str] = None) -> Optional[int]:
+    """
+    Run a tmin command in the daemon, streaming its output to this process
+
+    Args:
+        argv: Command-line arguments, without the program name
+        path: Daemon socket (default: socket_path())
+
+    Returns:
+        The command's exit code, or None when no daemon accepted the command
+    """
+    conn = _connect(path or socket_path())
+    if conn is None:
+        return None
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    with conn, conn.makefile("rb") as replies:
+        try:
+            _send(conn, {"protocol": PROTOCOL, "command": "run", "argv": list(argv),
+                         "cwd": os.getcwd(), "env": forwarded_env(os.environ)})
+        except OSError:
+            return None
+        for line in replies:
+            message = json.loads(line)
+            if "exit" in message:
+                return message["exit"]
+            if "error" in message:
+                return None
+            streams[message["stream"]].write(message["data"])
+            streams[message["stream"]].flush()
+    # The worker died without reporting an exit code
+    return 1
+
+
+class _SocketStream(io.TextIOBase):
+    """Text stream that forwards writes to the client as output messages"""
+
+    def __init__(self, conn: socket.socket, name: str):
+        self._conn = conn
+        self._name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        if data:
+            _send(self._conn, {"stream": self._name, "data": data})
+        return len(data)
+
+
+def _exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _run_command(conn: socket.socket, message: Dict[str, Any]) -> None:
+    """In the forked worker: adopt the client's directory and tmin environment variables and run the CLI"""
+    from .cli import main
+
+    os.chdir(message["cwd"])
+    for name in forwarded_env(os.environ):
+        del os.environ[name]
+    os.environ.update(forwarded_env(message["env"]))
+    if hasattr(time, "tzset"):
+        time.tzset()
+    sys.stdout = _SocketStream(conn, "stdout")
+    sys.stderr = _SocketStream(conn, "stderr")
+    sys.argv = ["tmin"] + message["argv"]
+    try:
+        main(message["argv"])
+        code = 0
+    except SystemExit as e:
+        code = _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    _send(conn, {"exit": code})
+
+
+def warm_up() -> None:
+    """Load everything a command needs once, before the first fork"""
+    from . import cli, report_generator, streaming, validation, visualization  # noqa: F401
+
+    fig, ax = visualization.ThicknessVisualizer._figure((2, 2))
+    ax.plot([0, 1], [0, 1])
+    fig.canvas.draw()
+
+
+def serve(path: Optional[str] = None) -> None:
+    """
+    Run the daemon in the foreground until it receives a stop request
+
+    Args:
+        path: Socket to listen on (default: socket_path())
+    """
+    if not SUPPORTED:
+        raise OSError("The tmin daemon needs Unix domain sockets and fork")
+    path = path or socket_path()
+    if request({"command": "ping"}, path) is not None:
+        raise OSError(f"A tmin daemon is already listening on {path}")
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory, mode=0o700)
+    if path == socket_path() and not os.environ.get("TMIN_DAEMON_SOCKET") and not _private(directory):
+        raise OSError(f"{directory} must belong to you and be closed to other users (mode 0700)")
+    if os.path.exists(path):
+        os.unlink(path)
+
+    warm_up()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous_umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(previous_umask)
+    listener.listen(64)
+    # Forked workers are reaped automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    started, served = time.time(), 0
+
+    try:
+        while True:
+            conn, _ = listener.accept()
+            with conn:
+                if not _peer_is_user(conn):
+                    continue
+                conn.settimeout(5.0)
+                try:
+                    message = json.loads(conn.makefile("rb").readline())
+                except (OSError, ValueError):
+                    continue
+                conn.settimeout(None)
+                if message.get("protocol") != PROTOCOL:
+                    _send(conn, {"error": f"protocol {message.get('protocol')} is not supported"})
+                    continue
+                command = message.get("command")
+                if command == "ping":
+                    _send(conn, {"pid": os.getpid(), "uptime": time.time() - started, "served": served})
+                elif command == "stop":
+                    _send(conn, {"stopped": os.getpid()})
+                    break
+                elif command == "run":
+                    served += 1
+                    if os.fork() == 0:
+                        listener.close()
+                        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                        try:
+                            _run_command(conn, message)
+                        finally:
+                            os._exit(0)
+                else:
+                    _send(conn, {"error": f"unknown command '{command}'"})
+    finally:
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def _detach() -> bool:
+    """Fork into the background; returns True in the daemon process"""
+    if os.fork() != 0:
+        return False
+    os.setsid()
+    if os.fork() != 0:
+        os._exit(0)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    return True
+
+
+def daemon_main(argv: Sequence[str]) -> int:
+    """tmin daemon start|stop|status"""
+    parser = argparse.ArgumentParser(prog="tmin daemon", description="Warm local worker for the tmin command")
+    parser.add_argument("action", choices=["start", "stop", "status"])
+    parser.add_argument("--socket", help="Unix socket path (default: $TMIN_DAEMON_SOCKET or a per-user socket)")
+    parser.add_argument("--detach", action="store_true", help="With start, run in the background")
+    args = parser.parse_args(argv)
+    path = args.socket or socket_path()
+
+    if args.action == "start":
+        if request({"command": "ping"}, path) is not None:
+            print(f"tmin daemon is already running on {path}")
+            return 1
+        if args.detach and not _detach():
+            for _ in range(100):
+                if request({"command": "ping"}, path) is not None:
+                    print(f"tmin daemon started on {path}")
+                    return 0
+                time.sleep(0.1)
+            print(f"tmin daemon did not start on {path}")
+            return 1
+        if not args.detach:
+            print(f"tmin daemon listening on {path}")
+            sys.stdout.flush()
+        serve(path)
+        if args.detach:
+            os._exit(0)
+        return 0
+
+    reply = request({"command": "ping" if args.action == "status" else "stop"}, path)
+    if reply is None:
+        print(f"tmin daemon is not running ({path})")
+        return 1
+    if args.action == "status":
+        print(f"tmin daemon pid {reply['pid']} on {path}, up {reply['uptime']:.0f} s, "
+              f"{reply['served']} commands served")
+    else:
+        print(f"tmin daemon pid {reply['stopped']} stopped")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point of the tmin command: manage the daemon, forward to it, or run in-process"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["daemon"]:
+        sys.exit(daemon_main(argv[1:]))
+    if not os.environ.get("TMIN_NO_DAEMON"):
+        code = forward(argv)
+        if code is not None:
+            sys.exit(code)
+    from .cli import main as cli_main
+    cli_main(argv)
+
+
+if __name__ == "__main__":
+    main()
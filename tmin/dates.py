@@ -0,0 +1,78 @@
+"""
+As-of dates and inspection dates as fractional (decimal) years
+
+Corrosion loss is projected over the time between an inspection and the as-of
+date. Both may be given as a year (2023), a decimal year (2023.5), an ISO date
+string ('2023-07-02'), a datetime.date/datetime, or a numpy datetime64, and are
+converted to decimal years so partial years count.
+"""
+
+import numpy as np
+from datetime import date, datetime
+from typing import Any, Optional
+
+
+def decimal_year(value: Any) -> float:
+    """
+    Convert one date-like value to a decimal year
+
+    Args:
+        value: Year number, decimal year, ISO date string, date/datetime or numpy datetime64
+
+    Returns:
+        Year plus the elapsed fraction of that year, e.g. 2025-07-02 -> 2025.5
+    """
+    if isinstance(value, np.datetime64):
+        return float(decimal_years(np.array([value]))[0])
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            value = date.fromisoformat(value)
+    if isinstance(value, datetime):
+        start = datetime(value.year, 1, 1, tzinfo=value.tzinfo)
+        length = datetime(value.year + 1, 1, 1, tzinfo=value.tzinfo) - start
+        return value.year + (value - start) / length
+    if isinstance(value, date):
+        start = date(value.year, 1, 1).toordinal()
+        length = date(value.year + 1, 1, 1).toordinal() - start
+        return value.year + (value.toordinal() - start) / length
+    return float(value)
+
+
+def as_of_year(as_of: Optional[Any] = None) -> float:
+    """Decimal year of an as-of date, today when as_of is None"""
+    return decimal_year(date.today() if as_of is None else as_of)
+
+
+def decimal_years(values: Any) -> np.ndarray:
+    """
+    Vectorized decimal_year over a column of date-like values
+
+    Args:
+        values: Sequence or array of values accepted by decimal_year; None or "" means missing
+
+    Returns:
+        Float array of decimal years, NaN where a value is missing
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        days = values.astype("datetime64[D]")
+        years = days.astype("datetime64[Y]")
+        start = years.astype("datetime64[D]")
+        length = (years + 1).astype("datetime64[D]") - start
+        result = (years.astype(np.int64) + 1970) + (days - start) / length
+        return np.where(np.isnat(values), np.nan, result)
+    if values.dtype.kind in "biuf":
+        return values.astype(float)
+
+    # Mixed or object columns: convert each distinct value once
+    flat = values.astype(object).reshape(-1)
+    converted = {}
+    result = np.empty(flat.shape)
+    for i, value in enumerate(flat):
+        key = (type(value), value)
+        if key not in converted:
+            converted[key] = np.nan if value is None or value == "" else decimal_year(value)
+        result[i] = converted[key]
+    return result.reshape(values.shape)
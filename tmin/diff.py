@@ -0,0 +1,214 @@
+"""
+Campaign-to-campaign comparison of analysis results
+
+diff_results joins two result sets on their CML column with sorted-array
+set operations and compares them column-wise: CMLs whose governing type
+changed, that crossed (or cleared) a retirement limit, or that lost more
+than a threshold of remaining life. The ResultDiff can be printed as a text
+change report or saved as a JSON delta, so a new inspection campaign is
+reviewed by exception rather than by re-reading every report.
+
+A result set is a mapping with a 'cml' column and the analyze_batch result
+columns (e.g. {"cml": fleet["cml"], **results}, the output of
+InspectionStore.retiring_before) or a results file written by
+tmin.export.write_results.
+"""
+
+import json
+import numpy as np
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Union
+
+from .export import read_results
+
+# Columns carried into the delta for every changed CML
+COMPARED_COLUMNS = ["actual_thickness", "governing_thickness", "governing_type", "life_span", "api574_RL",
+                    "default_retirement_limit"]
+
+# Limit name -> results column the present-day thickness is compared against
+LIMITS = {"governing": "governing_thickness", "api574": "api574_RL", "retirement_limit": "default_retirement_limit"}
+
+ResultSet = Union[str, Path, Mapping[str, Any]]
+
+
+def _load(result_set: ResultSet, label: str) -> Dict[str, np.ndarray]:
+    """A result set as sorted columns keyed by CML, rows rejected by validation dropped"""
+    columns = read_results(result_set) if isinstance(result_set, (str, Path)) else result_set
+    if "cml" not in columns:
+        raise ValueError(f"The {label} result set has no 'cml' column")
+    cml = np.asarray(columns["cml"]).astype(str)
+    keep = np.asarray(columns.get("valid", np.ones(len(cml), dtype=bool)), dtype=bool)
+    order = np.argsort(cml, kind="stable")
+    order = order[keep[order]]
+    cml = cml[order]
+    duplicated = cml[1:][cml[1:] == cml[:-1]]
+    if duplicated.size:
+        raise ValueError(f"The {label} result set has repeated CMLs, e.g. {np.unique(duplicated)[:5].tolist()}")
+
+    loaded = {"cml": cml}
+    for name in COMPARED_COLUMNS:
+        values = np.asarray(columns[name]) if name in columns else np.full(len(columns["cml"]), np.nan)
+        if name == "governing_type":
+            loaded[name] = values.astype(str)[order]
+        else:
+            loaded[name] = np.asarray(np.where(np.equal(values, None), np.nan, values), dtype=float)[order]
+    return loaded
+
+
+def _below(results: Mapping[str, np.ndarray], column: str) -> np.ndarray:
+    """Present-day thickness under a limit; a missing or zero limit is never crossed"""
+    limit = results[column]
+    with np.errstate(invalid="ignore"):
+        return (limit > 0) & (results["actual_thickness"] < limit)
+
+
+def _json_value(value: Any) -> Any:
+    return None if isinstance(value, float) and value != value else value
+
+
+@dataclass
+class ResultDiff:
+    """Changes between two result sets for the CMLs they share, plus CMLs added and removed"""
+
+    cml: np.ndarray
+    before: Dict[str, np.ndarray]
+    after: Dict[str, np.ndarray]
+    governing_changed: np.ndarray
+    crossed: Dict[str, np.ndarray]
+    cleared: Dict[str, np.ndarray]
+    life_lost: np.ndarray
+    life_loss: float
+    added: np.ndarray
+    removed: np.ndarray
+
+    @property
+    def lost_life(self) -> np.ndarray:
+        """CMLs whose remaining life dropped by more than life_loss years"""
+        with np.errstate(invalid="ignore"):
+            return self.life_lost > self.life_loss
+
+    @property
+    def changed(self) -> np.ndarray:
+        """Boolean mask of shared CMLs with at least one reportable change"""
+        mask = self.governing_changed | self.lost_life
+        for limit in LIMITS:
+            mask = mask | self.crossed[limit] | self.cleared[limit]
+        return mask
+
+    def changes(self) -> List[List[str]]:
+        """Description of each changed CML's changes, in the order of cml[changed]"""
+        rows = np.flatnonzero(self.changed)
+        descriptions: List[List[str]] = [[] for _ in rows]
+        for limit in LIMITS:
+            for i in np.flatnonzero(self.crossed[limit][rows]).tolist():
+                descriptions[i].append(f"crossed {limit}")
+            for i in np.flatnonzero(self.cleared[limit][rows]).tolist():
+                descriptions[i].append(f"cleared {limit}")
+        for i in np.flatnonzero(self.governing_changed[rows]).tolist():
+            row = rows[i]
+            descriptions[i].append(f"governing {self.before['governing_type'][row]} -> "
+                                   f"{self.after['governing_type'][row]}")
+        for i in np.flatnonzero(self.lost_life[rows]).tolist():
+            descriptions[i].append(f"lost {self.life_lost[rows[i]]:.1f} years of life")
+        return descriptions
+
+    def counts(self) -> Dict[str, Any]:
+        return {
+            "compared": len(self.cml),
+            "changed": int(self.changed.sum()),
+            "governing_changed": int(self.governing_changed.sum()),
+            "crossed": {limit: int(mask.sum()) for limit, mask in self.crossed.items()},
+            "cleared": {limit: int(mask.sum()) for limit, mask in self.cleared.items()},
+            "lost_life": int(self.lost_life.sum()),
+            "added": len(self.added),
+            "removed": len(self.removed),
+        }
+
+    def summary(self) -> str:
+        """Short text summary of the changes"""
+        counts = self.counts()
+        lines = [f"Compared {counts['compared']} CMLs: {counts['changed']} changed, "
+                 f"{counts['added']} added, {counts['removed']} removed"]
+        for limit in LIMITS:
+            lines.append(f"  {limit}: {counts['crossed'][limit]} crossed, {counts['cleared'][limit]} cleared")
+        lines.append(f"  governing type changed: {counts['governing_changed']}")
+        lines.append(f"  lost more than {self.life_loss:g} years of life: {counts['lost_life']}")
+        return "\n".join(lines)
+
+    def delta(self) -> Dict[str, Any]:
+        """JSON-serializable delta: counts, added and removed CMLs, and before/after values of changed CMLs"""
+        rows = np.flatnonzero(self.changed)
+        sides = {side: {name: [_json_value(v) for v in values[rows].tolist()] for name, values in columns.items()
+                        if name != "cml"}
+                 for side, columns in (("before", self.before), ("after", self.after))}
+        life_lost = [_json_value(v) for v in self.life_lost[rows].tolist()]
+        return {
+            "life_loss": self.life_loss,
+            "counts": self.counts(),
+            "added": self.added.tolist(),
+            "removed": self.removed.tolist(),
+            "changed": [
+                {"cml": cml, "changes": changes, "life_lost": lost,
+                 "before": {name: values[i] for name, values in sides["before"].items()},
+                 "after": {name: values[i] for name, values in sides["after"].items()}}
+                for i, (cml, changes, lost) in enumerate(zip(self.cml[rows].tolist(), self.changes(), life_lost))
+            ],
+        }
+
+    def write_json(self, path: Union[str, Path]) -> str:
+        """Write the JSON delta"""
+        with open(path, 'w') as f:
+            json.dump(self.delta(), f, indent=2)
+        return str(path)
+
+    def write_report(self, path: Union[str, Path]) -> str:
+        """Write the text change report: the summary, then one line per changed, added or removed CML"""
+        rows = np.flatnonzero(self.changed)
+        with open(path, 'w') as f:
+            f.write(self.summary() + "\n\n")
+            for cml, changes, before, after in zip(self.cml[rows].tolist(), self.changes(),
+                                                   self.before["actual_thickness"][rows].tolist(),
+                                                   self.after["actual_thickness"][rows].tolist()):
+                f.write(f"{cml}: {'; '.join(changes)} (thickness {before:.4f} -> {after:.4f} in)\n")
+            f.writelines(f"{cml}: added\n" for cml in self.added.tolist())
+            f.writelines(f"{cml}: removed\n" for cml in self.removed.tolist())
+        return str(path)
+
+
+def diff_results(before: ResultSet, after: ResultSet, life_loss: float = 5.0) -> ResultDiff:
+    """
+    Compare two result sets CML by CML
+
+    Args:
+        before: Earlier result set (mapping with a 'cml' column, or a results file path)
+        after: Later result set, same forms
+        life_loss: Years of remaining life a CML must lose to be reported
+
+    Returns:
+        ResultDiff for the CMLs in both sets, with the CMLs only in one of them
+    """
+    before = _load(before, "before")
+    after = _load(after, "after")
+    cml, b, a = np.intersect1d(before["cml"], after["cml"], assume_unique=True, return_indices=True)
+    old = {name: values[b] for name, values in before.items()}
+    new = {name: values[a] for name, values in after.items()}
+
+    crossed, cleared = {}, {}
+    for limit, column in LIMITS.items():
+        was_below, is_below = _below(old, column), _below(new, column)
+        crossed[limit] = is_below & ~was_below
+        cleared[limit] = was_below & ~is_below
+
+    return ResultDiff(
+        cml=cml,
+        before=old,
+        after=new,
+        governing_changed=old["governing_type"] != new["governing_type"],
+        crossed=crossed,
+        cleared=cleared,
+        life_lost=old["life_span"] - new["life_span"],
+        life_loss=life_loss,
+        added=np.setdiff1d(after["cml"], before["cml"], assume_unique=True),
+        removed=np.setdiff1d(before["cml"], after["cml"], assume_unique=True),
+    )
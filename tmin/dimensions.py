@@ -0,0 +1,77 @@
+"""
+Pipe dimension lookups over the ASME B36.10M / B36.19M table
+
+Every (NPS, schedule) pair in tmin.asmetables.pipe_dimensions is encoded as one
+integer key, NPS in eighths of an inch times the number of schedules plus the
+schedule code. The compiled keys are sorted, so both single and whole-column
+lookups are a binary search (np.searchsorted) into the table cache arrays.
+"""
+
+import numpy as np
+from fractions import Fraction
+from typing import Optional, Sequence, Tuple
+
+from .asmetables.pipe_dimensions import pipe_schedules
+from .tablecache import load_tables
+
+SCHEDULES = list(pipe_schedules)
+_SCHEDULE_CODES = {schedule: i for i, schedule in enumerate(SCHEDULES)}
+
+
+def nps_to_float(nps: str) -> float:
+    """Convert an NPS string such as '3/4', '1-1/2' or '1.5' to a float"""
+    nps = str(nps).strip()
+    whole, _, fraction = nps.partition('-') if '/' in nps else (nps, '', '')
+    try:
+        value = Fraction(whole)
+        if fraction:
+            value += Fraction(fraction)
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Could not convert NPS '{nps}' to float")
+    return float(value)
+
+
+def dimension_keys(nps: np.ndarray, schedule_code: np.ndarray) -> np.ndarray:
+    """Encode NPS values (inches) and schedule codes as sorted-table keys, -1 where invalid"""
+    eighths = np.rint(np.asarray(nps, dtype=float) * 8)
+    valid = np.isfinite(eighths) & (np.asarray(schedule_code) >= 0)
+    keys = np.where(valid, eighths, 0).astype(np.int64) * len(SCHEDULES) + np.asarray(schedule_code)
+    return np.where(valid, keys, -1)
+
+
+def schedule_codes(schedules: Sequence[str]) -> np.ndarray:
+    """Integer code of each schedule designation, -1 when the designation is unknown"""
+    return np.array([_SCHEDULE_CODES.get(str(s), -1) for s in schedules], dtype=np.int64)
+
+
+def lookup(nps: np.ndarray, schedule_code: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized OD and nominal wall lookup
+
+    Args:
+        nps: NPS values in inches
+        schedule_code: Schedule codes from schedule_codes
+
+    Returns:
+        (OD, nominal wall) arrays, NaN where the pair is not in the table
+    """
+    tables = load_tables()
+    table_keys = tables["dimension_keys"]
+    keys = dimension_keys(nps, schedule_code)
+    index = np.minimum(np.searchsorted(table_keys, keys), len(table_keys) - 1)
+    found = table_keys[index] == keys
+    od = np.where(found, tables["dimension_od"][index], np.nan)
+    wall = np.where(found, tables["dimension_wall"][index], np.nan)
+    return od, wall
+
+
+def get_dimensions(nps: str, schedule: str) -> Optional[Tuple[float, float, float]]:
+    """(OD, nominal wall, ID) for one NPS and schedule, or None when not tabulated"""
+    try:
+        value = nps_to_float(nps)
+    except ValueError:
+        return None
+    od, wall = lookup(np.array([value]), schedule_codes([schedule]))
+    if np.isnan(od[0]):
+        return None
+    return float(od[0]), float(wall[0]), round(float(od[0] - 2 * wall[0]), 3)
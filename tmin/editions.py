@@ -0,0 +1,191 @@
+"""
+Code edition registry for API 574 structural minimum thickness tables
+
+Each edition is compiled once per process into a dense array indexed by
+[material code, NPS, pressure class]. The built-in "2025" and "2009" editions
+come from tmin.asmetables; owner-user editions and overrides are loaded from
+versioned TOML, JSON or NPZ data files with load_edition_file.
+"""
+
+import json
+import numpy as np
+import toml
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+from .asmetables.materials import MATERIALS, MATERIAL_NAMES
+from .asmetables.api_574_2009 import API574_2009_TABLE_6
+
+PRESSURE_CLASSES = (150, 300, 600, 900, 1500, 2500)
+
+
+@dataclass(frozen=True)
+class Edition:
+    """A compiled code edition: structural thickness indexed by [material, NPS, class]"""
+
+    name: str
+    version: str
+    nps_keys: tuple
+    structural: np.ndarray
+    pressure_classes: tuple = PRESSURE_CLASSES
+    description: str = ""
+
+    def nps_index(self, nps_keys: Sequence[str]) -> np.ndarray:
+        """Index of each NPS table key on this edition's NPS axis, -1 when not tabulated"""
+        positions = {key: i for i, key in enumerate(self.nps_keys)}
+        return np.array([positions.get(key, -1) for key in nps_keys], dtype=np.intp)
+
+    def lookup(self, material_code: np.ndarray, nps_index: np.ndarray, class_code: np.ndarray) -> np.ndarray:
+        """Vectorized structural thickness lookup, NaN where the NPS is not tabulated"""
+        values = self.structural[material_code, np.maximum(nps_index, 0), class_code]
+        return np.where(nps_index >= 0, values, np.nan)
+
+    def structural_thickness(self, metallurgy: str, nps_key: str, pressure_class: int) -> float:
+        """Scalar structural thickness lookup, raises KeyError when not tabulated"""
+        material = MATERIALS.get(metallurgy, MATERIALS["Other"])["code"]
+        try:
+            value = self.structural[material, self.nps_keys.index(nps_key),
+                                    self.pressure_classes.index(int(pressure_class))]
+        except ValueError:
+            raise KeyError(f"{self.name} has no structural thickness for NPS {nps_key} class {pressure_class}")
+        if np.isnan(value):
+            raise KeyError(f"{self.name} has no structural thickness for {metallurgy} NPS {nps_key}")
+        return float(value)
+
+
+def compile_edition(name: str, tables: Mapping[str, Mapping[str, Mapping]], version: str = "",
+                    description: str = "", base: Optional[Edition] = None) -> Edition:
+    """
+    Compile nested {metallurgy: {nps_key: {pressure_class: thickness}}} tables into an Edition
+
+    A metallurgy of "*" applies to every material. Entries missing from the tables
+    are taken from the base edition when one is given and are NaN otherwise.
+    """
+    nps_keys = list(base.nps_keys) if base is not None else []
+    for table in tables.values():
+        nps_keys += [str(key) for key in table if str(key) not in nps_keys]
+
+    structural = np.full((len(MATERIAL_NAMES), len(nps_keys), len(PRESSURE_CLASSES)), np.nan)
+    if base is not None:
+        structural[:, :len(base.nps_keys)] = base.structural
+
+    for metallurgy in sorted(tables, key=lambda m: m != "*"):
+        if metallurgy == "*":
+            materials = list(range(len(MATERIAL_NAMES)))
+        elif metallurgy in MATERIALS:
+            materials = [MATERIALS[metallurgy]["code"]]
+        else:
+            raise ValueError(f"Unknown metallurgy '{metallurgy}' in edition {name}")
+        for nps_key, row in tables[metallurgy].items():
+            for pressure_class, thickness in row.items():
+                if int(pressure_class) not in PRESSURE_CLASSES:
+                    raise ValueError(f"Unknown pressure class {pressure_class} in edition {name}")
+                structural[materials, nps_keys.index(str(nps_key)),
+                           PRESSURE_CLASSES.index(int(pressure_class))] = thickness
+
+    structural.setflags(write=False)
+    return Edition(name=name, version=version, nps_keys=tuple(nps_keys), structural=structural,
+                   description=description)
+
+
+def _builtin_2025() -> Edition:
+    return compile_edition("2025", {m: MATERIALS[m]["api574_table"] for m in MATERIAL_NAMES},
+                           version="API 574-2025", description="API 574 Table D.2, 400F")
+
+
+def _builtin_2009() -> Edition:
+    default = {nps_key: {c: row["default_minimum_structural_thickness"] for c in PRESSURE_CLASSES}
+               for nps_key, row in API574_2009_TABLE_6.items()}
+    return compile_edition("2009", {"*": default}, version="API 574-2009",
+                           description="API 574 Table 6, carbon and low-alloy steel")
+
+
+# Compilers for the built-in editions, used by tmin.tablecache to build the binary table cache
+BUILTIN_EDITIONS: Dict[str, Callable[[], Edition]] = {
+    "2025": _builtin_2025,
+    "2009": _builtin_2009,
+}
+
+
+def _load_builtin(name: str) -> Edition:
+    """Load a built-in edition from the memory-mapped table cache"""
+    from .tablecache import load_tables
+
+    tables = load_tables()
+    return Edition(name=name, version=str(tables[f"edition_{name}_version"]),
+                   nps_keys=tuple(tables[f"edition_{name}_nps"].tolist()),
+                   structural=tables[f"edition_{name}_structural"],
+                   description=str(tables[f"edition_{name}_description"]))
+
+
+_LOADERS: Dict[str, Callable[[], Edition]] = {
+    name: (lambda name=name: _load_builtin(name)) for name in BUILTIN_EDITIONS
+}
+_COMPILED: Dict[str, Edition] = {}
+
+
+def register_edition(name: str, loader: Union[Edition, Callable[[], Edition]]) -> None:
+    """Register (or replace) an edition by name; loaders are compiled lazily on first use"""
+    _LOADERS[name] = loader if callable(loader) else (lambda: loader)
+    _COMPILED.pop(name, None)
+
+
+def available_editions() -> List[str]:
+    """Names of all registered editions"""
+    return list(_LOADERS)
+
+
+def get_edition(name: str) -> Edition:
+    """Get a compiled edition, compiling it once per process"""
+    edition = _COMPILED.get(name)
+    if edition is None:
+        if name not in _LOADERS:
+            raise ValueError(f"Unknown code edition '{name}'. Available editions: {available_editions()}")
+        edition = _COMPILED[name] = _LOADERS[name]()
+    return edition
+
+
+def load_edition_file(path: Union[str, Path], register: bool = True) -> Edition:
+    """
+    Load an edition from a versioned TOML, JSON or NPZ data file
+
+    TOML and JSON files hold name, version, an optional base edition and optional
+    description, plus a [structural] table of metallurgy -> NPS -> class -> thickness.
+    NPZ files hold the compiled arrays written by save_edition_npz.
+    """
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            materials = [str(m) for m in data["materials"]]
+            if materials != MATERIAL_NAMES:
+                raise ValueError(f"Edition file {path} was compiled for materials {materials}")
+            structural = np.array(data["structural"])
+            structural.setflags(write=False)
+            edition = Edition(name=str(data["name"]), version=str(data["version"]),
+                              nps_keys=tuple(str(k) for k in data["nps_keys"]), structural=structural,
+                              description=str(data["description"]))
+    else:
+        if path.suffix == ".toml":
+            spec = toml.load(path)
+        elif path.suffix == ".json":
+            with open(path, 'r') as f:
+                spec = json.load(f)
+        else:
+            raise ValueError(f"Unsupported edition file type: {path.suffix}")
+        if "name" not in spec or "version" not in spec:
+            raise ValueError(f"Edition file {path} must define 'name' and 'version'")
+        base = get_edition(spec["base"]) if "base" in spec else None
+        edition = compile_edition(spec["name"], spec.get("structural", {}), version=spec["version"],
+                                  description=spec.get("description", ""), base=base)
+
+    if register:
+        register_edition(edition.name, edition)
+    return edition
+
+
+def save_edition_npz(edition: Edition, path: Union[str, Path]) -> None:
+    """Write a compiled edition to an NPZ file readable by load_edition_file"""
+    np.savez(path, name=edition.name, version=edition.version, description=edition.description,
+             nps_keys=np.array(edition.nps_keys), materials=np.array(MATERIAL_NAMES),
+             structural=edition.structural)
@@ -0,0 +1,211 @@
+"""
+Machine-readable analysis outputs
+
+Results are written as JSON Lines or CSV, one record per CML, with the
+PIPE.analysis fields plus the report's adequacy, status and recommendation
+fields. ResultWriter appends chunk after chunk to one open file, so batch
+runs of any size stream straight into a file that databases can bulk load
+(CSV missing values are empty fields, as COPY ... CSV expects).
+"""
+
+import csv
+import json
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, IO, List, Mapping, Optional, Union
+
+from .batch import RESULT_COLUMNS
+from .dates import decimal_year
+from .profiling import profiled
+from .report_generator import ReportGenerator
+
+# Fleet columns copied into each record when present, to key it downstream
+ID_COLUMNS = ["cml", "circuit", "nps", "schedule", "pressure_class", "metallurgy", "API_table"]
+
+ASSESSMENT_COLUMNS = ["pressure_adequate", "structural_adequate", "retirement_status", "api574_status",
+                      "recommendations"]
+
+FORMATS = ("jsonl", "csv")
+
+
+def _recommendation_lines(text: str) -> List[str]:
+    return [line.lstrip("• ") for line in text.splitlines()]
+
+
+def record_columns(fleet: Mapping[str, Any], results: Dict[str, np.ndarray],
+                   id_columns: Optional[List[str]] = None, units=None) -> Dict[str, List[Any]]:
+    """
+    Build the output record columns for a results table
+
+    Args:
+        fleet: The fleet passed to tmin.batch.analyze_batch
+        results: Results from tmin.batch.analyze_batch
+        id_columns: Fleet columns to include (default: those of ID_COLUMNS present in the fleet)
+        units: Unit system the results are in (see tmin.units), default imperial
+
+    Returns:
+        Dict of field name -> list of Python values (None where missing), valid rows only
+    """
+    n = len(results["governing_type"])
+    keep = np.asarray(results.get("valid", np.ones(n, dtype=bool)), dtype=bool)
+    if id_columns is None:
+        id_columns = [name for name in ID_COLUMNS if name in fleet]
+
+    columns: Dict[str, List[Any]] = {}
+    for name in id_columns:
+        values = np.broadcast_to(np.asarray(fleet[name], dtype=object), (n,))
+        columns[name] = values[keep].tolist()
+    for name in RESULT_COLUMNS:
+        values = np.asarray(results[name])[keep]
+        if values.dtype.kind == "f":
+            columns[name] = np.where(np.isnan(values), None, values.astype(object)).tolist()
+        else:
+            columns[name] = values.tolist()
+
+    assessment = ReportGenerator.assessment_columns(results, units)
+    for name in ASSESSMENT_COLUMNS:
+        columns[name] = np.asarray(assessment[name], dtype=object)[keep].tolist()
+    lines = {text: _recommendation_lines(text) for text in set(columns["recommendations"])}
+    columns["recommendations"] = [lines[text] for text in columns["recommendations"]]
+    return columns
+
+
+class ResultWriter:
+    """
+    Streaming JSON Lines or CSV writer for batch results
+
+    Use as a context manager and call write() once per batch or chunk; the CSV
+    header is written with the first chunk.
+    """
+
+    def __init__(self, destination: Union[str, Path, IO[str]], format: Optional[str] = None,
+                 id_columns: Optional[List[str]] = None, units=None):
+        """
+        Args:
+            destination: Output path or open text file
+            format: "jsonl" or "csv" (default: taken from the file extension)
+            id_columns: Fleet columns to include in each record
+            units: Unit system the results are in (see tmin.units), default imperial
+        """
+        if format is None:
+            suffix = Path(str(getattr(destination, "name", destination))).suffix.lstrip(".").lower()
+            format = {"json": "jsonl", "ndjson": "jsonl"}.get(suffix, suffix)
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {list(FORMATS)}, got '{format}'")
+        self.format = format
+        self.id_columns = id_columns
+        self.units = units
+        self.fields: Optional[List[str]] = None
+        self.rows_written = 0
+        self._owns_file = isinstance(destination, (str, Path))
+        self._file = open(destination, "w", newline="", buffering=1 << 20) if self._owns_file else destination
+        self._csv = csv.writer(self._file) if format == "csv" else None
+
+    @profiled("io.write_results")
+    def write(self, fleet: Mapping[str, Any], results: Dict[str, np.ndarray]) -> int:
+        """Append the records of one results table, returns the number of rows written"""
+        columns = record_columns(fleet, results, self.id_columns, self.units)
+        if self.fields is None:
+            self.fields = list(columns)
+            self.id_columns = [name for name in self.fields if name not in RESULT_COLUMNS + ASSESSMENT_COLUMNS]
+            if self._csv is not None:
+                self._csv.writerow(self.fields)
+        elif list(columns) != self.fields:
+            raise ValueError(f"Chunk columns {list(columns)} do not match the file columns {self.fields}")
+
+        if self._csv is not None:
+            columns["recommendations"] = ["; ".join(lines) for lines in columns["recommendations"]]
+            for name in ("pressure_adequate", "structural_adequate"):
+                columns[name] = ["true" if value else "false" for value in columns[name]]
+            self._csv.writerows(zip(*(["" if v is None else v for v in columns[name]] for name in self.fields)))
+        else:
+            encode = json.JSONEncoder(ensure_ascii=False).encode
+            self._file.writelines(encode(dict(zip(self.fields, row))) + "\n"
+                                  for row in zip(*(columns[name] for name in self.fields)))
+        count = len(columns["governing_type"])
+        self.rows_written += count
+        return count
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_results(destination: Union[str, Path, IO[str]], fleet: Mapping[str, Any],
+                  results: Dict[str, np.ndarray], format: Optional[str] = None, units=None) -> int:
+    """
+    Write one results table as JSON Lines or CSV
+
+    Args:
+        destination: Output path or open text file
+        fleet: The fleet passed to tmin.batch.analyze_batch
+        results: Results from tmin.batch.analyze_batch
+        format: "jsonl" or "csv" (default: taken from the file extension)
+        units: Unit system the results are in (see tmin.units), default imperial
+
+    Returns:
+        Number of records written
+    """
+    with ResultWriter(destination, format, units=units) as writer:
+        return writer.write(fleet, results)
+
+
+def read_results(source: Union[str, Path, IO[str]], format: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Read a JSON Lines or CSV results file back into columns
+
+    Args:
+        source: Path or open text file written by write_results or ResultWriter
+        format: "jsonl" or "csv" (default: taken from the file extension)
+
+    Returns:
+        Dict of field name -> array: RESULT_COLUMNS as floats (NaN where missing) except
+        governing_type, every other field as objects
+    """
+    if format is None:
+        suffix = Path(str(getattr(source, "name", source))).suffix.lstrip(".").lower()
+        format = {"json": "jsonl", "ndjson": "jsonl"}.get(suffix, suffix)
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {list(FORMATS)}, got '{format}'")
+    f = open(source, newline="") if isinstance(source, (str, Path)) else source
+    try:
+        if format == "csv":
+            reader = csv.reader(f)
+            fields = next(reader, [])
+            rows = list(reader)
+        else:
+            records = [json.loads(line) for line in f if line.strip()]
+            fields = list(records[0]) if records else []
+            rows = [[record.get(name) for name in fields] for record in records]
+    finally:
+        if f is not source:
+            f.close()
+
+    values = zip(*rows) if rows else [()] * len(fields)
+    columns = {}
+    for name, column in zip(fields, values):
+        column = np.array(column, dtype=object)
+        if name in RESULT_COLUMNS and name != "governing_type":
+            column = np.where(np.equal(column, None) | np.equal(column, ""), np.nan, column).astype(float)
+        columns[name] = column
+    return columns
+
+
+def analysis_record(pipe, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Output record for a single PIPE.analysis result, same fields as the batch records"""
+    fleet = {name: [getattr(pipe, name)] for name in ID_COLUMNS if hasattr(pipe, name)}
+    values = dict(analysis_results)
+    # Inspection dates are recorded as decimal years, as in the batch results
+    if values["year_inspected"] is not None:
+        values["year_inspected"] = decimal_year(values["year_inspected"])
+    results = {name: np.array([np.nan if values[name] is None else values[name]]) for name in RESULT_COLUMNS}
+    columns = record_columns(fleet, results)
+    return {name: values[0] for name, values in columns.items()}
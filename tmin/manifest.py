@@ -0,0 +1,179 @@
+"""
+Fleet manifests: many pipes and their readings in one file
+
+A manifest is a TOML, YAML or JSON file with a list of pipes, optional
+fleet-wide defaults and optional per-circuit defaults:
+
+    [defaults]
+    pressure_class = 150
+    metallurgy = "Intermediate/Low CS"
+
+    [circuit.C-101]
+    pressure = 50.0
+    corrosion_rate = 10.0
+
+    [[pipe]]
+    cml = "CML-001"
+    circuit = "C-101"
+    schedule = "40"
+    nps = "2"
+    allowable_stress = 23333.0
+    readings = [
+        {measured_thickness = 0.062, year_inspected = 2021},
+        {measured_thickness = 0.058, year_inspected = "2024-03-15"},
+    ]
+
+A pipe's fields override its circuit's, which override the defaults. Each
+reading is a measured thickness or a table of per-reading fields, and a pipe
+may give measured_thickness directly instead of a readings list. The
+manifest becomes one fleet row per reading, ready for tmin.batch.
+"""
+
+import json
+import math
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Union
+
+import toml
+
+from .dates import decimal_year
+from .streaming import RECORD_COLUMNS, _chunk_fleet
+
+MANIFEST_FIELDS = ["cml", "circuit"] + RECORD_COLUMNS
+
+# Spellings accepted from the single-pipe TOML configuration and CLI flags
+ALIASES = {"api_table": "API_table"}
+
+READINGS = ("latest", "all")
+
+
+def read_manifest(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Parse a manifest or configuration file by its extension
+
+    Args:
+        path: .toml, .yaml/.yml or .json file
+
+    Returns:
+        The parsed document
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with open(path) as f:
+        if suffix in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("YAML manifests require PyYAML (pip install pyyaml)") from e
+            document = yaml.safe_load(f)
+        elif suffix == ".json":
+            document = json.load(f)
+        else:
+            document = toml.load(f)
+    if not isinstance(document, dict):
+        raise ValueError(f"{path} does not contain a table of settings")
+    return document
+
+
+def is_manifest(document: Mapping[str, Any]) -> bool:
+    """True for a multi-pipe manifest, False for a flat single-pipe configuration"""
+    return "pipe" in document
+
+
+def _fields(table: Mapping[str, Any], where: str) -> Dict[str, Any]:
+    fields = {ALIASES.get(key, key): value for key, value in table.items()}
+    unknown = sorted(set(fields) - set(MANIFEST_FIELDS) - {"readings"})
+    if unknown:
+        raise ValueError(f"Unknown field(s) {unknown} in {where}. Valid fields: {MANIFEST_FIELDS + ['readings']}")
+    return fields
+
+
+def _reading_year(reading: Mapping[str, Any]) -> float:
+    """
+    Sort key for picking a pipe's latest reading
+
+    A missing date sorts first. An unparseable one sorts last, so the reading
+    is kept and validation rejects its row with a reason instead of the whole
+    manifest failing to load or an older reading being reported as current.
+    """
+    value = reading.get("year_inspected")
+    if value in (None, ""):
+        return -math.inf
+    try:
+        return decimal_year(value)
+    except (TypeError, ValueError):
+        return math.inf
+
+
+def manifest_fleet(document: Mapping[str, Any], readings: str = "latest") -> Dict[str, list]:
+    """
+    Flatten a parsed manifest into a columnar fleet
+
+    Args:
+        document: Parsed manifest (see read_manifest)
+        readings: "latest" for each pipe's most recent reading, or "all" for one row per reading
+
+    Returns:
+        Fleet mapping of column name -> list, one row per selected reading
+    """
+    if readings not in READINGS:
+        raise ValueError(f"readings must be one of {list(READINGS)}, got '{readings}'")
+    pipes = document.get("pipe")
+    if not isinstance(pipes, list) or not pipes:
+        raise ValueError("Manifest has no [[pipe]] entries")
+
+    defaults = _fields(document.get("defaults", {}), "[defaults]")
+    circuits = {str(name): _fields(table, f"[circuit.{name}]")
+                for name, table in document.get("circuit", {}).items()}
+
+    rows: List[Dict[str, Any]] = []
+    for i, table in enumerate(pipes):
+        where = f"pipe {table.get('cml', i)}"
+        pipe = _fields(table, where)
+        circuit = pipe.get("circuit", defaults.get("circuit"))
+        if circuit is not None and circuits and str(circuit) not in circuits:
+            raise ValueError(f"Unknown circuit '{circuit}' in {where}. Defined circuits: {sorted(circuits)}")
+        base = {**defaults, **circuits.get(str(circuit), {}), **pipe}
+
+        entries = [_fields(r, where) if isinstance(r, Mapping) else {"measured_thickness": r}
+                   for r in base.pop("readings", None) or [{}]]
+        if readings == "latest":
+            entries = [max(reversed(entries), key=_reading_year)]
+        rows.extend({**base, **entry} for entry in entries)
+
+    fleet = _chunk_fleet(rows, None)
+    fleet.setdefault("measured_thickness", [None] * len(rows))
+    return fleet
+
+
+def load_manifest(path: Union[str, Path], readings: str = "latest") -> Dict[str, list]:
+    """
+    Read a manifest file into a columnar fleet
+
+    Args:
+        path: .toml, .yaml/.yml or .json manifest
+        readings: "latest" or "all", as for manifest_fleet
+
+    Returns:
+        Fleet mapping of column name -> list
+    """
+    return manifest_fleet(read_manifest(path), readings)
+
+
+def report_names(fleet: Mapping[str, Any]) -> List[str]:
+    """One unique report name per row: the CML, numbered when a CML has several readings"""
+    n = len(next(iter(fleet.values())))
+    cmls = [str(cml) for cml in fleet.get("cml", [None] * n)]
+    repeated = {cml for cml, count in Counter(cmls).items() if count > 1}
+    seen: Counter = Counter()
+    names = []
+    for row, cml in enumerate(cmls):
+        if cml == "None":
+            names.append(str(row))
+        elif cml in repeated:
+            seen[cml] += 1
+            names.append(f"{cml}_{seen[cml]}")
+        else:
+            names.append(cml)
+    return names
@@ -0,0 +1,232 @@
+"""
+Out-of-core result columns backed by np.memmap
+
+analyze_to_memmap runs the batch engine chunk by chunk and appends every
+result column to its own raw binary file in an output directory, so only one
+chunk of results is ever in memory. open_results reopens the directory with
+np.memmap: numeric columns are zero-copy views of the files, which reports,
+charts and exports can read in slices. governing_type is stored as a small
+integer code (0 rejected, 1 pressure, 2 structural) and decoded on access.
+
+project_to_memmap does the same for thickness-versus-time projections. Date
+dependent columns are written as (n, m) row blocks and reopened transposed,
+giving the (m, n) layout of tmin.batch.project_batch without a copy.
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+from .batch import _fleet_length, analyze_batch, project_batch
+from .dates import as_of_year, decimal_years
+from .streaming import iter_analyze
+from .units import get_units
+
+MANIFEST = "results.json"
+
+GOVERNING_TYPES = ["", "pressure", "structural"]
+
+
+def _fleet_slice(fleet: Mapping, start: int, stop: int) -> Dict[str, Any]:
+    """Rows start:stop of a fleet, scalar columns kept as scalars"""
+    return {name: values[start:stop] if np.ndim(values) > 0 else values for name, values in fleet.items()}
+
+
+def _fleet_chunks(fleet: Mapping, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    for start in range(0, _fleet_length(fleet), chunk_size):
+        yield _fleet_slice(fleet, start, start + chunk_size)
+
+
+class MemmapWriter:
+    """Append result chunks column by column to raw binary files in a directory"""
+
+    def __init__(self, directory: Union[str, Path], **metadata):
+        """
+        Args:
+            directory: Output directory, created if missing; previous results in it are replaced
+            metadata: Extra JSON-serializable manifest entries; a list "as_of" is exposed as the as_of column
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Without a manifest a half-written directory cannot be mistaken for finished results
+        if (self.directory / MANIFEST).exists():
+            (self.directory / MANIFEST).unlink()
+        self.metadata = metadata
+        self.columns: Dict[str, Dict[str, Any]] = {}
+        self.n = 0
+        self._files = {}
+
+    def _encode(self, name: str, values: np.ndarray) -> np.ndarray:
+        if name == "governing_type":
+            codes = np.zeros(values.shape, dtype=np.uint8)
+            for code, label in enumerate(GOVERNING_TYPES[1:], start=1):
+                codes[values == label] = code
+            return codes
+        if values.dtype.kind == "b":
+            return values.astype(np.bool_)
+        return values.astype(np.float64)
+
+    def append(self, results: Mapping[str, np.ndarray]) -> int:
+        """Append one chunk of results (row-aligned columns); returns rows written"""
+        rows = None
+        for name, values in results.items():
+            values = np.asarray(values)
+            if name == "as_of":
+                continue
+            # Projected columns arrive as (m, rows); store rows first so chunks append
+            if values.ndim == 2:
+                values = values.T
+            encoded = np.ascontiguousarray(self._encode(name, values))
+            if name not in self.columns:
+                if self.n:
+                    raise ValueError(f"Column '{name}' first appears after {self.n} rows")
+                self.columns[name] = {"dtype": encoded.dtype.str, "shape": list(encoded.shape[1:])}
+                self._files[name] = open(self.directory / f"{name}.bin", "wb")
+            elif list(encoded.shape[1:]) != self.columns[name]["shape"]:
+                raise ValueError(f"Column '{name}' changed shape from {self.columns[name]['shape']}")
+            encoded.tofile(self._files[name])
+            rows = len(encoded)
+        missing = set(self.columns) - {name for name in results if name != "as_of"}
+        if missing:
+            raise ValueError(f"Chunk is missing columns {sorted(missing)}")
+        self.n += rows or 0
+        return rows or 0
+
+    def close(self) -> "MemmapResults":
+        """Finish the files, write the manifest and reopen the results read-only"""
+        for f in self._files.values():
+            f.close()
+        manifest = {"n": self.n, "columns": self.columns, "governing_types": GOVERNING_TYPES, **self.metadata}
+        with open(self.directory / MANIFEST, "w") as f:
+            json.dump(manifest, f, indent=2)
+        return MemmapResults(self.directory)
+
+    def __enter__(self) -> "MemmapWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is None:
+            self.close()
+        else:
+            for f in self._files.values():
+                f.close()
+
+
+class MemmapResults(Mapping):
+    """
+    Results reopened from a directory written by MemmapWriter
+
+    Behaves like the dict returned by analyze_batch (or project_batch): numeric
+    columns are read-only np.memmap views, governing_type is decoded to strings
+    when accessed.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST) as f:
+            self.manifest = json.load(f)
+        self.n = self.manifest["n"]
+
+    def raw(self, name: str) -> np.ndarray:
+        """A column exactly as stored, as a zero-copy memmap (governing_type as codes)"""
+        spec = self.manifest["columns"][name]
+        shape = (self.n, *spec["shape"])
+        if self.n == 0:
+            return np.empty(shape, dtype=spec["dtype"])
+        return np.memmap(self.directory / f"{name}.bin", dtype=spec["dtype"], mode="r", shape=shape)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == "as_of" and "as_of" in self.manifest:
+            return np.asarray(self.manifest["as_of"], dtype=float)
+        if name not in self.manifest["columns"]:
+            raise KeyError(name)
+        values = self.raw(name)
+        if name == "governing_type":
+            return np.asarray(self.manifest["governing_types"])[values]
+        return values.T if values.ndim == 2 else values
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.manifest["columns"]
+        if "as_of" in self.manifest:
+            yield "as_of"
+
+    def __len__(self) -> int:
+        return len(self.manifest["columns"]) + ("as_of" in self.manifest)
+
+    def chunks(self, chunk_size: int = 100000) -> Iterator[Tuple[slice, Dict[str, np.ndarray]]]:
+        """(row slice, results for those rows) in order, to process the results piece by piece"""
+        for start in range(0, self.n, chunk_size):
+            rows = slice(start, min(start + chunk_size, self.n))
+            chunk = {}
+            for name in self.manifest["columns"]:
+                values = self.raw(name)[rows]
+                if name == "governing_type":
+                    values = np.asarray(self.manifest["governing_types"])[values]
+                chunk[name] = values.T if values.ndim == 2 else values
+            yield rows, chunk
+
+
+def open_results(directory: Union[str, Path]) -> MemmapResults:
+    """Reopen results written by analyze_to_memmap or project_to_memmap"""
+    return MemmapResults(directory)
+
+
+def analyze_to_memmap(fleet: Union[Mapping[str, Any], Iterable[Any]], directory: Union[str, Path],
+                      chunk_size: int = 100000, as_of=None, errors: str = "raise",
+                      units=None) -> MemmapResults:
+    """
+    Analyze a fleet chunk by chunk, writing the results to memory-mapped column files
+
+    Args:
+        fleet: Fleet mapping (columns may themselves be memmaps) or an iterable of
+            records as accepted by tmin.streaming.iter_analyze
+        directory: Output directory for one <column>.bin file per result column
+        chunk_size: Rows analyzed and held in memory at a time
+        as_of: Date the present-day thickness is projected to, default today
+        errors: "raise" or "reject", as for analyze_batch
+        units: Unit system of the fleet and the stored thickness columns, as for analyze_batch
+
+    Returns:
+        The results reopened read-only from the directory
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    # Resolved once, so a run that crosses midnight projects every chunk to the recorded date
+    as_of = as_of_year(as_of)
+    if isinstance(fleet, Mapping):
+        chunks = (analyze_batch(chunk, as_of=as_of, errors=errors, units=units)
+                  for chunk in _fleet_chunks(fleet, chunk_size))
+    else:
+        chunks = (results for _, results in iter_analyze(fleet, chunk_size, as_of=as_of, errors=errors, units=units))
+
+    with MemmapWriter(directory, as_of_year=as_of, units=asdict(get_units(units))) as writer:
+        for results in chunks:
+            writer.append(results)
+    return MemmapResults(directory)
+
+
+def project_to_memmap(fleet: Mapping[str, Any], as_of_dates: Sequence[Any], directory: Union[str, Path],
+                      chunk_size: int = 100000) -> MemmapResults:
+    """
+    project_batch chunk by chunk, writing the (m, n) projections to memory-mapped files
+
+    Args:
+        fleet: Fleet mapping
+        as_of_dates: Dates to project to
+        directory: Output directory
+        chunk_size: Rows projected at a time; memory use grows with chunk_size * len(as_of_dates)
+
+    Returns:
+        The projection reopened read-only, keyed like project_batch
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    as_of = decimal_years(list(as_of_dates))
+    with MemmapWriter(directory, as_of=as_of.tolist()) as writer:
+        for chunk in _fleet_chunks(fleet, chunk_size):
+            writer.append(project_batch(chunk, as_of))
+    return MemmapResults(directory)
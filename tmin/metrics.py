@@ -0,0 +1,333 @@
+"""
+Optional Prometheus-style metrics for scheduled jobs and the local service
+
+The registry is off by default. Once enabled it counts pipes analyzed (and
+the analysis throughput of the last batch), lookup cache hits, validation
+rejects, failures, stage latencies such as report and plot rendering, and
+report worker utilization. The metrics are rendered in the Prometheus text
+exposition format, either written to a file at the end of a run (for the
+node_exporter textfile collector) or served over HTTP at /metrics.
+"""
+
+import os
+import threading
+import time
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .profiling import PROFILER
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric:
+    """A named metric family, one value per combination of label values"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {list(self.labelnames)}, got {sorted(labels)}")
+        return tuple(labels[name] for name in self.labelnames)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            if not self.labelnames and not self._values:
+                return [f"{self.name} 0"]
+            return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}"
+                    for key, value in sorted(self._values.items())]
+
+    def render(self) -> str:
+        return "\n".join([f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self.samples())
+
+
+class Counter(Metric):
+    """Monotonically increasing total"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError(f"Counters can only increase, got {amount}")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or is computed by a function when rendered"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labelnames)
+        self.function = function
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        if self.function is not None:
+            return self.function()
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        if self.function is not None:
+            return [f"{self.name} {_number(self.function())}"]
+        return super().samples()
+
+
+class Histogram(Metric):
+    """Observation counts in cumulative buckets, with their sum and count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * len(self.buckets) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-1] += value
+
+    def count(self, **labels) -> int:
+        counts = self._values.get(self._key(labels))
+        return 0 if counts is None else counts[-2]
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, counts in sorted(self._values.items()):
+                for bound, count in zip(self.buckets, counts):
+                    le = 'le="%s"' % _number(bound)
+                    lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {count}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(counts[-1])}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {counts[-2]}")
+        return lines
+
+
+class MetricsRegistry:
+    """The tmin metrics, recorded only while enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.metrics: List[Metric] = []
+        self.pipes_analyzed = self.counter(
+            "tmin_pipes_analyzed_total", "Pipe readings analyzed", ["source"])
+        self.analysis_seconds = self.counter(
+            "tmin_analysis_seconds_total", "Time spent analyzing pipe readings", ["source"])
+        self.pipes_per_second = self.gauge(
+            "tmin_pipes_per_second", "Analysis throughput of the most recent batch")
+        self.errors = self.counter(
+            "tmin_errors_total", "Analysis and validation calls that raised", ["source"])
+        self.lookups = self.counter(
+            "tmin_lookup_requests_total", "Rows resolved through the memoized table lookups")
+        self.lookup_misses = self.counter(
+            "tmin_lookup_misses_total", "Memoized table lookups that had to be evaluated")
+        self.lookup_hit_ratio = self.gauge(
+            "tmin_lookup_cache_hit_ratio", "Share of lookup rows served from an already evaluated configuration",
+            function=self._hit_ratio)
+        self.validation_rows = self.counter(
+            "tmin_validation_rows_total", "Rows checked by validate_batch")
+        self.validation_rejected = self.counter(
+            "tmin_validation_rejected_rows_total", "Rows rejected by validate_batch")
+        self.validation_errors = self.counter(
+            "tmin_validation_errors_total", "Failed validation checks", ["column"])
+        self.stage_seconds = self.histogram(
+            "tmin_stage_duration_seconds", "Latency of analysis, report, plot and file write stages", ["stage"])
+        self.workers_busy = self.gauge(
+            "tmin_workers_busy", "Report workers currently rendering")
+        self.worker_busy_seconds = self.counter(
+            "tmin_worker_busy_seconds_total", "Time report workers spent rendering")
+        self.worker_utilization = self.gauge(
+            "tmin_worker_utilization", "Busy share of the report workers over the most recent run")
+        self.last_write = self.gauge(
+            "tmin_last_write_timestamp_seconds", "Unix time the metrics file was last written")
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = (),
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(name, help, labelnames, function))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def _register(self, metric: Metric) -> Metric:
+        if any(existing.name == metric.name for existing in self.metrics):
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self.metrics.append(metric)
+        return metric
+
+    def _hit_ratio(self) -> float:
+        requests = self.lookups.value()
+        return (requests - self.lookup_misses.value()) / requests if requests else 0.0
+
+    def _observe_stage(self, stage: str, seconds: float) -> None:
+        self.stage_seconds.observe(seconds, stage=stage)
+
+    def enable(self) -> None:
+        """Start recording, including stage latencies from tmin.profiling"""
+        if not self.enabled:
+            self.enabled = True
+            PROFILER.add_listener(self._observe_stage)
+
+    def disable(self) -> None:
+        if self.enabled:
+            self.enabled = False
+            PROFILER.remove_listener(self._observe_stage)
+
+    def reset(self) -> None:
+        for metric in self.metrics:
+            metric.reset()
+
+    def record_analysis(self, source: str, rows: int, seconds: float) -> None:
+        self.pipes_analyzed.inc(rows, source=source)
+        self.analysis_seconds.inc(seconds, source=source)
+        if source == "batch" and seconds > 0:
+            self.pipes_per_second.set(rows / seconds)
+
+    def record_lookup(self, rows: int, unique: int) -> None:
+        self.lookups.inc(rows)
+        self.lookup_misses.inc(unique)
+
+    def record_validation(self, validation) -> None:
+        self.validation_rows.inc(validation.n)
+        self.validation_rejected.inc(validation.n_rejected)
+        for column in validation.columns.tolist():
+            self.validation_errors.inc(column=column)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+    def write_textfile(self, path: str) -> str:
+        """Write the metrics file atomically, so a collector never reads a partial file"""
+        self.last_write.set(time.time())
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            f.write(self.render())
+        os.replace(temporary, path)
+        return path
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve the metrics at http://host:port/metrics from a background thread
+
+        Args:
+            port: TCP port, 0 picks a free one (see server.server_address)
+            host: Interface to bind, localhost by default
+
+        Returns:
+            The running server; call shutdown() to stop it
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="tmin-metrics", daemon=True).start()
+        return server
+
+
+METRICS = MetricsRegistry()
+
+
+def metered(source: str) -> Callable:
+    """
+    Decorator recording the calls of an analysis entry point while metrics are enabled
+
+    Args:
+        source: "pipe" (one reading per call), "batch" (rows of the returned results)
+            or "validation" (a returned ValidationResult)
+    """
+    def decorate(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                METRICS.errors.inc(source=source)
+                raise
+            if source == "validation":
+                METRICS.record_validation(result)
+            else:
+                rows = 1 if source == "pipe" else len(result["governing_type"])
+                METRICS.record_analysis(source, rows, time.perf_counter() - start)
+            return result
+        return wrapper
+    return decorate
@@ -0,0 +1,162 @@
+"""
+Opt-in stage timers for finding where a run spends its time
+
+Hot paths (analysis, batch stages, report rendering, plotting, file writes) are
+wrapped in named stages. While profiling is disabled, which is the default, a
+stage is a shared no-op context manager. Once enabled, every stage records its
+call count and wall time, plus one Chrome-trace event per call that can be
+loaded in chrome://tracing or Perfetto. Listeners (such as the tmin.metrics
+latency histograms) receive every stage duration even while profiling is off.
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional
+
+_DISABLED = nullcontext()
+
+
+class Profiler:
+    """Per-stage call counts and wall time, and the Chrome-trace events behind them"""
+
+    def __init__(self):
+        self.enabled = False
+        self.active = False
+        self.listeners: List[Callable[[str, float], None]] = []
+        self.calls: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+        self.events: List[dict] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._started: Optional[float] = None
+        self._wall = 0.0
+
+    def enable(self) -> None:
+        self.enabled = self.active = True
+        self._started = time.perf_counter()
+
+    def disable(self) -> None:
+        if self.enabled and self._started is not None:
+            self._wall += time.perf_counter() - self._started
+        self.enabled = False
+        self.active = bool(self.listeners)
+        self._started = None
+
+    def add_listener(self, listener: Callable[[str, float], None]) -> None:
+        """Call listener(stage, seconds) after every stage, whether or not profiling is enabled"""
+        self.listeners.append(listener)
+        self.active = True
+
+    def remove_listener(self, listener: Callable[[str, float], None]) -> None:
+        self.listeners.remove(listener)
+        self.active = self.enabled or bool(self.listeners)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.seconds.clear()
+            self.events.clear()
+            self._wall = 0.0
+            self._started = time.perf_counter() if self.enabled else None
+
+    def stage(self, name: str):
+        """Context manager timing one call of a stage, a no-op while disabled without listeners"""
+        return self._record(name) if self.active else _DISABLED
+
+    @contextmanager
+    def _record(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if self.enabled:
+                with self._lock:
+                    self.calls[name] = self.calls.get(name, 0) + 1
+                    self.seconds[name] = self.seconds.get(name, 0.0) + (end - start)
+                    self.events.append({
+                        "name": name, "cat": name.split(".")[0], "ph": "X",
+                        "ts": (start - self._origin) * 1e6, "dur": (end - start) * 1e6,
+                        "pid": os.getpid(), "tid": threading.get_ident(),
+                    })
+            for listener in self.listeners:
+                listener(name, end - start)
+
+    def wall_time(self) -> float:
+        """Seconds spent with profiling enabled"""
+        running = time.perf_counter() - self._started if self.enabled and self._started is not None else 0.0
+        return self._wall + running
+
+    def summary(self) -> str:
+        """Stage breakdown table, slowest stage first"""
+        wall = self.wall_time() or 1.0
+        lines = [f"{'Stage':<36} {'Calls':>8} {'Total (s)':>10} {'Mean (ms)':>10} {'% Wall':>7}"]
+        for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            calls = self.calls[name]
+            lines.append(f"{name:<36} {calls:>8} {seconds:>10.4f} {seconds / calls * 1000:>10.3f} "
+                         f"{seconds / wall * 100:>6.1f}%")
+        lines.append(f"{'Wall time':<36} {'':>8} {self.wall_time():>10.4f}")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path: str) -> str:
+        """Write the recorded stages as Chrome trace-event JSON"""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+PROFILER = Profiler()
+
+
+def stage(name: str):
+    """Time a block as a named stage of the global profiler"""
+    return PROFILER.stage(name)
+
+
+def profiled(name: str) -> Callable:
+    """Decorator timing every call of a function as a named stage"""
+    def decorate(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.active:
+                return func(*args, **kwargs)
+            with PROFILER._record(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def profile(output_dir: Optional[str] = None, cprofile: bool = True) -> Iterator[Profiler]:
+    """
+    Enable stage timing (and cProfile) for the enclosed block
+
+    Args:
+        output_dir: Directory for tmin.prof (cProfile stats) and tmin_trace.json
+            (Chrome trace); nothing is written when None
+        cprofile: Also run cProfile over the block
+
+    Yields:
+        The global Profiler, for summary() once the block ends
+    """
+    PROFILER.reset()
+    PROFILER.enable()
+    profiler = cProfile.Profile() if cprofile else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield PROFILER
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        PROFILER.disable()
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+            if profiler is not None:
+                profiler.dump_stats(os.path.join(output_dir, "tmin.prof"))
+            PROFILER.write_chrome_trace(os.path.join(output_dir, "tmin_trace.json"))
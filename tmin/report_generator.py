@@ -1,69 +1,156 @@
-from typing import Dict, Any, Optional
-from datetime import datetime
+import io
+import json
 import os
+import tarfile
+import uuid
+import zipfile
+import numpy as np
+from string import Template
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Sequence, Tuple
+from datetime import datetime
 
-class ReportGenerator:
-    """
-    Generates text reports for pipe thickness analysis
-    """
-    
-    def __init__(self):
-        self.report_template = """
+from .profiling import profiled, stage
+from .units import get_units
+
+# Full report layout, shared by generate_report and the compiled bulk renderer
+REPORT_TEMPLATE = Template("""
 TMIN - PIPE THICKNESS ANALYSIS REPORT
 =====================================
 
-Report Generated: {timestamp}
-Analysis ID: {analysis_id}
+Report Generated: $timestamp
+Analysis ID: $analysis_id
 
 PIPE SPECIFICATIONS
 -------------------
-Nominal Pipe Size (NPS): {nps}
-Schedule: {schedule}
-Pressure Class: {pressure_class}
-Metallurgy: {metallurgy}
-Design Pressure: {pressure} psi
-Pipe Configuration: {pipe_config}
-Corrosion Rate: {corrosion_rate} mpy
+Nominal Pipe Size (NPS): $nps
+Schedule: $schedule
+Pressure Class: $pressure_class
+Metallurgy: $metallurgy
+Design Pressure: $pressure $pressure_unit
+Pipe Configuration: $pipe_config
+Corrosion Rate: $corrosion_rate $rate_unit
 
 THICKNESS MEASUREMENT DATA
 --------------------------
-Measured Thickness: {measured_thickness:.4f} inches
-Inspection Year: {year_inspected}
-Present-Day Thickness: {actual_thickness:.4f} inches
+Measured Thickness: $measured_thickness $length_unit
+Inspection Year: $year_inspected
+Present-Day Thickness: $actual_thickness $length_unit
 
 DESIGN REQUIREMENTS
 -------------------
-Pressure Design Minimum: {tmin_pressure:.4f} inches
-Structural Minimum (API 574): {tmin_structural:.4f} inches
-Governing Thickness: {governing_thickness:.4f} inches
-Governing Factor: {governing_type}
+Pressure Design Minimum: $tmin_pressure $length_unit
+Structural Minimum (API 574): $tmin_structural $length_unit
+Governing Thickness: $governing_thickness $length_unit
+Governing Factor: $governing_type
 
 RETIREMENT LIMITS
 -----------------
-Retirement Limit: {retirement_limit}
-API 574 Retirement Limit: {api574_RL:.4f} inches
+Retirement Limit: $retirement_limit
+API 574 Retirement Limit: $api574_RL $length_unit
 
 THICKNESS ANALYSIS
 ------------------
-Pressure Design Adequacy: {pressure_adequate}
-Structural Adequacy: {structural_adequate}
-Retirement Status: {retirement_status}
-API 574 Status: {api574_status}
+Pressure Design Adequacy: $pressure_adequate
+Structural Adequacy: $structural_adequate
+Retirement Status: $retirement_status
+API 574 Status: $api574_status
 
 CORROSION ALLOWANCE
 -------------------
-Above API 574 RL: {above_api574} inches
-Below Retirement Limit: {below_retirement} inches
-Estimated Life Span: {life_span} years
+Above API 574 RL: $above_api574 $length_unit
+Below Retirement Limit: $below_retirement $length_unit
+Estimated Life Span: $life_span years
 
 RECOMMENDATIONS
 ---------------
-{recommendations}
+$recommendations
 
 NOTES
 -----
-{notes}
-"""
+$notes
+""")
+
+
+def run_id() -> str:
+    """Timestamp plus a random suffix, so reports written in the same second get distinct names"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def safe_name(name: Any) -> str:
+    """A CML or circuit name usable as one path component: anything but letters, digits, '-' and '_' becomes '_'"""
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in str(name))
+
+
+def safe_names(names: Sequence[Any]) -> List[str]:
+    """
+    safe_name of each name, made unique: a name that collides with an earlier one
+    (e.g. "CML/1" after "CML_1") gets its position appended
+    """
+    used = set()
+    unique = []
+    for i, name in enumerate(names):
+        candidate = safe_name(name)
+        while candidate in used:
+            candidate = f"{candidate}_{i}"
+        used.add(candidate)
+        unique.append(candidate)
+    return unique
+
+
+def dated_path(directory: str, base_name: str) -> str:
+    """Path of an output file in directory, named base_name behind the current date and time"""
+    return os.path.join(directory, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{base_name}")
+
+
+def compile_template(template: Template) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Compile a string.Template into a positional format string and its field order,
+    so each render is one C-level str.format call instead of a regex substitution
+    """
+    parts, fields, position = [], [], 0
+    for match in template.pattern.finditer(template.template):
+        parts.append(template.template[position:match.start()].replace("{", "{{").replace("}", "}}"))
+        if match.group("escaped") is not None:
+            parts.append(template.delimiter)
+        else:
+            fields.append(match.group("named") or match.group("braced"))
+            parts.append("{}")
+        position = match.end()
+    parts.append(template.template[position:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts), tuple(fields)
+
+
+_REPORT_FORMAT, _REPORT_FIELDS = compile_template(REPORT_TEMPLATE)
+
+# Recommendation lines per finding, in report order
+RECOMMENDATIONS = (
+    ("• IMMEDIATE ACTION REQUIRED: Actual thickness is below pressure design minimum",
+     "• Consider pipe replacement or pressure reduction"),
+    ("• IMMEDIATE ACTION REQUIRED: Actual thickness is below structural minimum",
+     "• Fit-for-service assessment recommended"),
+    ("• RETIREMENT RECOMMENDED: Below API 574 retirement limit",
+     "• Immediate retirement or detailed engineering assessment required"),
+    ("• MONITORING REQUIRED: Below Retirement Limit",
+     "• Increase inspection frequency"),
+    ("• SHORT REMAINING LIFE: Less than 5 years estimated",
+     "• Plan for replacement or detailed corrosion assessment"),
+)
+NO_FINDINGS = ("• Pipe thickness is adequate for current service conditions",
+               "• Continue with normal inspection schedule")
+
+class ReportGenerator:
+    """
+    Generates text reports for pipe thickness analysis
+    """
+    
+    def __init__(self, units=None):
+        """
+        Args:
+            units: Unit system of the batch results being reported (see tmin.units),
+                default psi, inches and mpy; its precision sets the decimal places of
+                thicknesses in every report (default 4)
+        """
+        self.units = get_units(units)
         # Create Reports directory if it doesn't exist
         self.reports_dir = "Reports"
         os.makedirs(self.reports_dir, exist_ok=True)
@@ -71,13 +158,14 @@ NOTES
     def _get_filename_with_date(self, base_name: str, filename: Optional[str] = None) -> str:
         """Generate filename with date prefix"""
         if filename is None:
-            date_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{date_str}_{base_name}"
+            return dated_path(self.reports_dir, base_name)
         
         return os.path.join(self.reports_dir, filename)
     
+    @profiled("report.generate")
     def generate_report(self, pipe_instance, analysis_results: Dict[str, Any], 
-                       actual_thickness: float, filename: Optional[str] = None) -> str:
+                       actual_thickness: float, filename: Optional[str] = None,
+                       analysis_id: Optional[str] = None) -> str:
         """
         Generate a text report
         
@@ -86,13 +174,19 @@ NOTES
             analysis_results: Results from analyze_pipe_thickness method
             actual_thickness: The actual measured thickness
             filename: Optional filename to save the report (without extension)
+            analysis_id: Optional analysis ID (default: unique per call)
             
         Returns:
             str: Path to saved report file
         """
         
         # Generate analysis ID
-        analysis_id = f"TMIN_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if analysis_id is None:
+            analysis_id = f"TMIN_{run_id()}"
+        # PIPE works in psi, inches and mpy; only the precision comes from this generator's units
+        units = get_units(None, self.units.precision)
+        digits = units.decimals()
+        length_unit = units.length_label
         
         # Determine adequacy status
         pressure_adequate = "ADEQUATE" if actual_thickness >= analysis_results.get('tmin_pressure', 0) else "INADEQUATE"
@@ -100,11 +194,11 @@ NOTES
         
         # Replace Table 5 RL with Retirement Limit
         retirement_limit = analysis_results.get('default_retirement_limit', None)
-        retirement_limit_str = f"{retirement_limit:.4f}" if retirement_limit is not None else "N/A"
+        retirement_limit_str = f"{retirement_limit:.{digits}f}" if retirement_limit is not None else "N/A"
         if retirement_limit is not None and actual_thickness >= retirement_limit:
             retirement_status = "ABOVE RETIREMENT LIMIT"
         elif retirement_limit is not None:
-            retirement_status = f"BELOW RETIREMENT LIMIT by {retirement_limit - actual_thickness:.4f} inches"
+            retirement_status = f"BELOW RETIREMENT LIMIT by {retirement_limit - actual_thickness:.{digits}f} {length_unit}"
         else:
             retirement_status = "NO DATA AVAILABLE"
         
@@ -113,7 +207,7 @@ NOTES
         if api574_RL and actual_thickness >= api574_RL:
             api574_status = "ABOVE RETIREMENT LIMIT"
         elif api574_RL:
-            api574_status = f"BELOW RETIREMENT LIMIT by {api574_RL - actual_thickness:.4f} inches"
+            api574_status = f"BELOW RETIREMENT LIMIT by {api574_RL - actual_thickness:.{digits}f} {length_unit}"
         else:
             api574_status = "NO DATA AVAILABLE"
         
@@ -124,7 +218,7 @@ NOTES
         notes = self._generate_notes(pipe_instance, analysis_results)
         
         # Format the report
-        report_content = self.report_template.format(
+        report_content = REPORT_TEMPLATE.substitute(
             timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             analysis_id=analysis_id,
             nps=pipe_instance.nps,
@@ -132,17 +226,20 @@ NOTES
             pressure_class=pipe_instance.pressure_class,
             metallurgy=pipe_instance.metallurgy,
             pressure=pipe_instance.pressure,
+            pressure_unit=units.pressure,
             pipe_config=pipe_instance.pipe_config,
             corrosion_rate=pipe_instance.corrosion_rate if pipe_instance.corrosion_rate else "Not specified",
-            measured_thickness=analysis_results.get('measured_thickness', 'N/A'),
+            rate_unit=units.rate,
+            measured_thickness=f"{analysis_results['measured_thickness']:.{digits}f}",
+            length_unit=length_unit,
             year_inspected=analysis_results.get('year_inspected', 'N/A'),
-            actual_thickness=actual_thickness,
-            tmin_pressure=analysis_results.get('tmin_pressure', 0),
-            tmin_structural=analysis_results.get('tmin_structural', 0),
-            governing_thickness=analysis_results.get('governing_thickness', 0),
+            actual_thickness=f"{actual_thickness:.{digits}f}",
+            tmin_pressure=f"{analysis_results.get('tmin_pressure', 0):.{digits}f}",
+            tmin_structural=f"{analysis_results.get('tmin_structural', 0):.{digits}f}",
+            governing_thickness=f"{analysis_results.get('governing_thickness', 0):.{digits}f}",
             governing_type=analysis_results.get('governing_type', 'Unknown'),
             retirement_limit=retirement_limit_str,
-            api574_RL=api574_RL,
+            api574_RL=f"{api574_RL:.{digits}f}",
             pressure_adequate=pressure_adequate,
             structural_adequate=structural_adequate,
             retirement_status=retirement_status,
@@ -159,70 +256,63 @@ NOTES
             filename = f"TMIN_report_{analysis_id}"
         
         filepath = self._get_filename_with_date(f"{filename}.txt")
-        with open(filepath, 'w') as f:
+        with stage("io.write"), open(filepath, 'w') as f:
             f.write(report_content)
         
         return filepath
     
     def _generate_recommendations(self, analysis_results: Dict[str, Any], actual_thickness: float) -> str:
         """Generate recommendations based on analysis results"""
-        recommendations = []
-        
-        # Check pressure design adequacy
         tmin_pressure = analysis_results.get('tmin_pressure', 0)
-        if actual_thickness < tmin_pressure:
-            recommendations.append("• IMMEDIATE ACTION REQUIRED: Actual thickness is below pressure design minimum")
-            recommendations.append("• Consider pipe replacement or pressure reduction")
-        
-        # Check structural adequacy
         tmin_structural = analysis_results.get('tmin_structural', 0)
-        if actual_thickness < tmin_structural:
-            recommendations.append("• IMMEDIATE ACTION REQUIRED: Actual thickness is below structural minimum")
-            recommendations.append("• Fit-for-service assessment recommended")
-        
-        # Check API 574 retirement limit
         api574_RL = analysis_results.get('api574_RL', 0)
-        if api574_RL and actual_thickness < api574_RL:
-            recommendations.append("• RETIREMENT RECOMMENDED: Below API 574 retirement limit")
-            recommendations.append("• Immediate retirement or detailed engineering assessment required")
-        
-        # Check Retirement Limit
         retirement_limit = analysis_results.get('default_retirement_limit', 0)
-        if retirement_limit and actual_thickness < retirement_limit:
-            recommendations.append("• MONITORING REQUIRED: Below Retirement Limit")
-            recommendations.append("• Increase inspection frequency")
-        
-        # Check life span
         life_span = analysis_results.get('life_span', None)
-        if life_span is not None and life_span < 5:
-            recommendations.append("• SHORT REMAINING LIFE: Less than 5 years estimated")
-            recommendations.append("• Plan for replacement or detailed corrosion assessment")
+        
+        findings = (
+            actual_thickness < tmin_pressure,  # pressure design adequacy
+            actual_thickness < tmin_structural,  # structural adequacy
+            bool(api574_RL and actual_thickness < api574_RL),  # API 574 retirement limit
+            bool(retirement_limit and actual_thickness < retirement_limit),  # retirement limit
+            life_span is not None and life_span < 5,  # life span
+        )
+        return self._recommendation_text(findings)
+    
+    @staticmethod
+    def _recommendation_text(findings: Sequence[bool]) -> str:
+        """Recommendation lines for a set of findings (see RECOMMENDATIONS)"""
+        recommendations = [line for found, lines in zip(findings, RECOMMENDATIONS) if found for line in lines]
         
         # If no issues found
         if not recommendations:
-            recommendations.append("• Pipe thickness is adequate for current service conditions")
-            recommendations.append("• Continue with normal inspection schedule")
+            recommendations.extend(NO_FINDINGS)
         
         return "\n".join(recommendations)
     
     def _generate_notes(self, pipe_instance, analysis_results: Dict[str, Any]) -> str:
         """Generate additional notes about the analysis"""
+        return self._notes_text(pipe_instance.get_Y_coefficient(), pipe_instance.corrosion_rate,
+                                analysis_results.get('governing_type', 'Unknown'))
+    
+    @staticmethod
+    def _notes_text(y_coefficient, corrosion_rate, governing_type, rate_unit: str = "mpy") -> str:
+        """Notes for one Y coefficient, corrosion rate and governing factor"""
         notes = []
         
         notes.append(f"• Analysis based on ASME B31.1 pressure design equations")
         notes.append(f"• Structural requirements from API 574 Table D.2")
-        notes.append(f"• Y-coefficient used: {pipe_instance.get_Y_coefficient()}")
+        notes.append(f"• Y-coefficient used: {y_coefficient}")
         
-        if pipe_instance.corrosion_rate:
-            notes.append(f"• Corrosion rate considered: {pipe_instance.corrosion_rate} mpy")
+        if corrosion_rate:
+            notes.append(f"• Corrosion rate considered: {corrosion_rate} {rate_unit}")
         else:
             notes.append("• No corrosion rate specified - life span calculation not performed")
         
-        governing_type = analysis_results.get('governing_type', 'Unknown')
         notes.append(f"• Governing factor for design: {governing_type}")
         
         return "\n".join(notes)
     
+    @profiled("report.summary")
     def generate_summary_report(self, pipe_instance, analysis_results: Dict[str, Any], 
                               actual_thickness: float, filename: Optional[str] = None) -> str:
         """
@@ -273,8 +363,8 @@ Metallurgy: {metallurgy}
 Design Pressure: {pressure} psi
 
 Thickness Analysis:
-Actual Thickness: {actual_thickness:.4f} inches
-Governing Thickness: {governing_thickness:.4f} inches
+Actual Thickness: {actual_thickness:.{digits}f} inches
+Governing Thickness: {governing_thickness:.{digits}f} inches
 Governing Factor: {governing_type}
 
 Status: {status}
@@ -322,6 +412,7 @@ Report Generated: {timestamp}
             actual_thickness=actual_thickness,
             governing_thickness=analysis_results.get('governing_thickness', 0),
             governing_type=analysis_results.get('governing_type', 'Unknown'),
+            digits=self.units.decimals(),
             status=status,
             findings="\n".join(findings),
             recommendations="\n".join(recommendations),
@@ -330,10 +421,271 @@ Report Generated: {timestamp}
         
         # Save summary report
         if filename is None:
-            filename = f"TMIN_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            filename = f"TMIN_summary_{run_id()}"
         
         filepath = self._get_filename_with_date(f"{filename}.txt")
-        with open(filepath, 'w') as f:
+        with stage("io.write"), open(filepath, 'w') as f:
             f.write(summary_content)
         
-        return filepath 
\ No newline at end of file
+        return filepath 
+    
+    @profiled("report.json")
+    def generate_json_report(self, pipe_instance, analysis_results: Dict[str, Any],
+                             filename: Optional[str] = None) -> str:
+        """
+        Generate a machine-readable JSON record of the analysis (see tmin.export)
+        
+        Args:
+            pipe_instance: PIPE instance
+            analysis_results: Results from PIPE.analysis
+            filename: Optional filename to save the record (without extension)
+            
+        Returns:
+            str: Path to saved JSON file
+        """
+        from .export import analysis_record
+        
+        if filename is None:
+            filename = f"TMIN_results_{run_id()}"
+        
+        filepath = self._get_filename_with_date(f"{filename}.json")
+        content = json.dumps(analysis_record(pipe_instance, analysis_results), indent=2, ensure_ascii=False)
+        # Written under a temporary name and renamed, so a failed write never leaves a partial file
+        temporary = f"{filepath}.{os.getpid()}.tmp"
+        with stage("io.write"):
+            with open(temporary, 'w') as f:
+                f.write(content)
+            os.replace(temporary, filepath)
+        
+        return filepath
+    
+    #####################################################################################
+    # BULK REPORTS
+    ####################################################################################
+    
+    @staticmethod
+    def _text(values: np.ndarray) -> np.ndarray:
+        """Float column as report text the way str.format shows it, 'None' where missing"""
+        values = np.asarray(values, dtype=float)
+        return np.where(np.isnan(values), "None", values.astype(str))
+    
+    @staticmethod
+    def _is_number(texts: np.ndarray) -> np.ndarray:
+        """Which entries of a text column are numbers, testing each distinct text once"""
+        uniques, inverse = np.unique(texts, return_inverse=True)
+        
+        def is_number(text: str) -> bool:
+            try:
+                float(text)
+            except ValueError:
+                return False
+            return True
+        
+        return np.array([is_number(text) for text in uniques.tolist()], dtype=bool)[inverse.reshape(-1)]
+    
+    @staticmethod
+    def _decode(uniques: Sequence[Tuple], render, inverse: np.ndarray) -> np.ndarray:
+        """Render text once per unique combination and scatter it back to every row"""
+        return np.array([render(*combo) for combo in uniques], dtype=object)[inverse]
+    
+    @classmethod
+    def assessment_columns(cls, results: Dict[str, np.ndarray], units=None) -> Dict[str, np.ndarray]:
+        """
+        Adequacy, retirement status and recommendations for every row of a results table
+        
+        Args:
+            results: Results from tmin.batch.analyze_batch
+            units: Unit system of the results, for the status text
+            
+        Returns:
+            Dict of pressure_adequate and structural_adequate (bool), retirement_status and
+            api574_status (report text), findings (bit code, see RECOMMENDATIONS) and
+            recommendations (report text)
+        """
+        actual = np.asarray(results["actual_thickness"], dtype=float)
+        tmin_pressure = np.asarray(results["tmin_pressure"], dtype=float)
+        tmin_structural = np.asarray(results["tmin_structural"], dtype=float)
+        api574_RL = np.asarray(results["api574_RL"], dtype=float)
+        retirement_limit = np.asarray(results["default_retirement_limit"], dtype=float)
+        life_span = np.asarray(results["life_span"], dtype=float)
+        units = get_units(units)
+        length_unit = " " + units.length_label
+        thickness = f"%.{units.decimals()}f"
+        
+        # Status text, one vectorized pass per field
+        with np.errstate(invalid='ignore'):
+            above_rl = actual >= retirement_limit
+            above_api574 = actual >= api574_RL
+        has_api574 = ~np.isnan(api574_RL) & (api574_RL != 0)
+        retirement_status = np.where(
+            np.isnan(retirement_limit), "NO DATA AVAILABLE",
+            np.where(above_rl, "ABOVE RETIREMENT LIMIT",
+                     np.char.add("BELOW RETIREMENT LIMIT by ",
+                                 np.char.add(np.char.mod(thickness, retirement_limit - actual), length_unit))))
+        api574_status = np.where(
+            ~has_api574, "NO DATA AVAILABLE",
+            np.where(above_api574, "ABOVE RETIREMENT LIMIT",
+                     np.char.add("BELOW RETIREMENT LIMIT by ",
+                                 np.char.add(np.char.mod(thickness, api574_RL - actual), length_unit))))
+        
+        # Recommendations depend only on five findings, so at most 32 distinct blocks
+        findings = np.stack([
+            actual < tmin_pressure,
+            actual < tmin_structural,
+            has_api574 & (actual < api574_RL),
+            (retirement_limit != 0) & (actual < retirement_limit),
+            life_span < 5,
+        ])
+        codes = (findings.astype(np.int64) << np.arange(5)[:, None]).sum(axis=0)
+        code_uniques, code_inverse = np.unique(codes, return_inverse=True)
+        recommendations = cls._decode(
+            [(c,) for c in code_uniques.tolist()],
+            lambda c: cls._recommendation_text([bool(c >> i & 1) for i in range(5)]), code_inverse.reshape(-1))
+        
+        return {
+            "pressure_adequate": actual >= tmin_pressure,
+            "structural_adequate": actual >= tmin_structural,
+            "retirement_status": retirement_status,
+            "api574_status": api574_status,
+            "findings": codes,
+            "recommendations": recommendations,
+        }
+    
+    def render_batch_reports(self, fleet: Mapping[str, Any], results: Dict[str, np.ndarray],
+                             names: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Render full reports for a whole batch from its results table
+        
+        Numbers are formatted column-wise, and recommendation and note blocks are built
+        once per distinct combination; each report is then one positional format call
+        on the precompiled REPORT_TEMPLATE. Rows rejected by validation are skipped.
+        
+        Args:
+            fleet: The fleet passed to tmin.batch.analyze_batch
+            results: Results from tmin.batch.analyze_batch
+            names: Optional report name per row (default: the fleet's 'cml' column, else the row number)
+            
+        Yields:
+            (name, report text) for each analyzed row
+        """
+        from .batch import _column, _factorize, _resolve
+        
+        n = len(results["governing_type"])
+        actual = np.asarray(results["actual_thickness"], dtype=float)
+        tmin_pressure = np.asarray(results["tmin_pressure"], dtype=float)
+        tmin_structural = np.asarray(results["tmin_structural"], dtype=float)
+        api574_RL = np.asarray(results["api574_RL"], dtype=float)
+        retirement_limit = np.asarray(results["default_retirement_limit"], dtype=float)
+        year_inspected = np.asarray(results["year_inspected"], dtype=float)
+        governing_type = np.asarray(results["governing_type"]).astype(str)
+        corrosion_rate = _column(fleet, "corrosion_rate", n, float)
+        metallurgy = _column(fleet, "metallurgy", n, str)
+        design_temp = _column(fleet, "design_temp", n, str)
+        
+        if names is None:
+            names = fleet["cml"] if "cml" in fleet else np.arange(n)
+        names = np.broadcast_to(np.asarray(names).astype(str), (n,))
+        
+        assessment = self.assessment_columns(results, self.units)
+        
+        # Y coefficient once per metallurgy and design temperature, notes once per distinct combination
+        y = _resolve(lambda p: p.get_Y_coefficient(), metallurgy=metallurgy, design_temp=design_temp)
+        note_uniques, note_inverse = _factorize(y, np.nan_to_num(corrosion_rate), governing_type)
+        notes = self._decode(
+            note_uniques, lambda y_value, rate, kind: self._notes_text(y_value, rate or None, kind, self.units.rate),
+            note_inverse)
+        
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        thickness = f"%.{self.units.decimals()}f"
+        raw_year = _column(fleet, "year_inspected", n, str)
+        columns = {
+            "nps": _column(fleet, "nps", n, str),
+            "schedule": _column(fleet, "schedule", n, str),
+            "pressure_class": _column(fleet, "pressure_class", n, str),
+            "metallurgy": metallurgy,
+            "pressure": self._text(_column(fleet, "pressure", n, float)),
+            "pipe_config": _column(fleet, "pipe_config", n, str),
+            "corrosion_rate": np.where(np.nan_to_num(corrosion_rate) != 0, self._text(corrosion_rate),
+                                       "Not specified"),
+            "measured_thickness": np.char.mod(thickness, results["measured_thickness"]),
+            # Inspection dates print as given and whole-number years as the year, like the scalar report
+            "year_inspected": np.where(
+                np.isnan(year_inspected), "None",
+                np.where(~self._is_number(raw_year), raw_year,
+                         np.where(year_inspected == np.floor(year_inspected),
+                                  np.nan_to_num(year_inspected).astype(np.int64).astype(str),
+                                  year_inspected.astype(str)))),
+            "actual_thickness": np.char.mod(thickness, actual),
+            "tmin_pressure": np.char.mod(thickness, tmin_pressure),
+            "tmin_structural": np.char.mod(thickness, tmin_structural),
+            "governing_thickness": np.char.mod(thickness, results["governing_thickness"]),
+            "governing_type": governing_type,
+            "retirement_limit": np.where(np.isnan(retirement_limit), "N/A", np.char.mod(thickness, retirement_limit)),
+            "api574_RL": np.char.mod(thickness, api574_RL),
+            "pressure_adequate": np.where(assessment["pressure_adequate"], "ADEQUATE", "INADEQUATE"),
+            "structural_adequate": np.where(assessment["structural_adequate"], "ADEQUATE", "INADEQUATE"),
+            "retirement_status": assessment["retirement_status"],
+            "api574_status": assessment["api574_status"],
+            "above_api574": self._text(results["above_api574RL"]),
+            "below_retirement": self._text(results["below_defaultRL"]),
+            "life_span": self._text(results["life_span"]),
+            "recommendations": assessment["recommendations"],
+            "notes": notes,
+        }
+        
+        for field, unit in (("pressure_unit", self.units.pressure), ("length_unit", self.units.length_label),
+                            ("rate_unit", self.units.rate)):
+            columns[field] = np.broadcast_to(unit, (n,))
+        columns["timestamp"] = np.broadcast_to(timestamp, (n,))
+        columns["analysis_id"] = np.char.add(f"TMIN_{stamp}_", names)
+        
+        valid = np.asarray(results.get("valid", np.ones(n, dtype=bool)))
+        rows = zip(names.tolist(), valid.tolist(), *(columns[field].tolist() for field in _REPORT_FIELDS))
+        for name, is_valid, *values in rows:
+            if is_valid:
+                yield name, _REPORT_FORMAT.format(*values)
+    
+    @profiled("report.batch")
+    def write_batch_reports(self, fleet: Mapping[str, Any], results: Dict[str, np.ndarray],
+                            archive: str = "zip", filename: Optional[str] = None,
+                            names: Optional[Sequence[str]] = None) -> str:
+        """
+        Write every report of a batch into a single file
+        
+        Args:
+            fleet: The fleet passed to tmin.batch.analyze_batch
+            results: Results from tmin.batch.analyze_batch
+            archive: "zip" or "tar" for one member per report, or "txt" for one buffered text
+                file with reports separated by form feeds
+            filename: Optional filename to save the archive (without extension)
+            names: Optional report name per row; members are named after safe_name(name)
+            
+        Returns:
+            str: Path to saved archive
+        """
+        if archive not in ("zip", "tar", "txt"):
+            raise ValueError(f"archive must be 'zip', 'tar' or 'txt', got '{archive}'")
+        if filename is None:
+            filename = "TMIN_reports"
+        extension = {"zip": "zip", "tar": "tar.gz", "txt": "txt"}[archive]
+        filepath = self._get_filename_with_date(f"{filename}.{extension}")
+        reports = self.render_batch_reports(fleet, results, names)
+        
+        if archive == "zip":
+            with zipfile.ZipFile(filepath, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+                for name, text in reports:
+                    zf.writestr(f"TMIN_report_{safe_name(name)}.txt", text)
+        elif archive == "tar":
+            with tarfile.open(filepath, 'w:gz') as tf:
+                for name, text in reports:
+                    data = text.encode()
+                    info = tarfile.TarInfo(f"TMIN_report_{safe_name(name)}.txt")
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+        else:
+            with open(filepath, 'w', buffering=1 << 20) as f:
+                for _, text in reports:
+                    f.write(text)
+                    f.write("\f")
+        return filepath
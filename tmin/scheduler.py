@@ -0,0 +1,214 @@
+"""
+Severity-first scheduling of per-pipe reports and plots
+
+For a turnaround the worst pipes are needed first. iter_prioritized_reports
+analyzes the whole fleet in one vectorized pass, orders the rows by severity
+(below the pressure minimum, then below the API 574 retirement limit, then
+everything else; shortest remaining life first within each tier) and then
+renders each pipe's text report and plots in that order. Finished reports are
+yielded as soon as they are written, so the critical ones can be reviewed
+while the lower-risk ones are still rendering.
+
+With an executor, up to `window` pipes render at once and are submitted in
+priority order. Plots are drawn without pyplot, so thread pools and
+ProcessPoolExecutors both render in parallel.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch import RESULT_COLUMNS, analyze_batch
+from .core import PIPE
+from .profiling import profiled, stage
+
+SEVERITY_LABELS = ["below pressure tmin", "below API 574 RL", "in service"]
+
+_PIPE_FIELDS = list(PIPE.__dataclass_fields__)
+
+
+def severity(results: Mapping[str, np.ndarray]) -> np.ndarray:
+    """
+    Severity tier of every row: 0 below pressure tmin, 1 below the API 574 RL, 2 otherwise
+
+    Args:
+        results: Results from tmin.batch.analyze_batch
+
+    Returns:
+        Integer tier per row (index into SEVERITY_LABELS)
+    """
+    actual = np.asarray(results["actual_thickness"], dtype=float)
+    tmin_pressure = np.asarray(results["tmin_pressure"], dtype=float)
+    api574_RL = np.asarray(results["api574_RL"], dtype=float)
+    with np.errstate(invalid='ignore'):
+        below_pressure = actual < tmin_pressure
+        below_api574 = (api574_RL != 0) & (actual < api574_RL)
+    return np.where(below_pressure, 0, np.where(below_api574, 1, 2))
+
+
+def priority_order(results: Mapping[str, np.ndarray]) -> np.ndarray:
+    """
+    Row indices most severe first, skipping rows rejected by validation
+
+    Rows are ordered by severity tier, then by remaining life (shortest first,
+    unknown life last), then by input order.
+    """
+    tier = severity(results)
+    life_span = np.asarray(results["life_span"], dtype=float)
+    life = np.where(np.isnan(life_span), np.inf, life_span)
+    order = np.lexsort((np.arange(len(tier)), life, tier))
+    valid = np.asarray(results.get("valid", np.ones(len(tier), dtype=bool)))
+    return order[valid[order]]
+
+
+@dataclass
+class PrioritizedReport:
+    """One pipe's finished report, in the order it was scheduled"""
+
+    rank: int  # Position in the priority order, 0 is the most severe
+    row: int  # Row of the fleet
+    name: str
+    severity: str  # One of SEVERITY_LABELS
+    life_span: float
+    files: Dict[str, str] = field(default_factory=dict)
+
+
+def _value(values: Any, row: int) -> Any:
+    """One row of a column (scalars broadcast) as a Python value, NaN and "" as None"""
+    value = values[row] if np.ndim(values) > 0 else values
+    value = value.item() if isinstance(value, np.generic) else value
+    return None if value == "" or (isinstance(value, float) and value != value) else value
+
+
+def _pipe_fields(fleet: Mapping[str, Any], row: int) -> Dict[str, Any]:
+    """PIPE keyword arguments for one fleet row; missing fields take the PIPE default"""
+    kwargs = {}
+    for name in _PIPE_FIELDS:
+        if name in fleet:
+            value = _value(fleet[name], row)
+            if value is not None:
+                kwargs[name] = value
+    kwargs.setdefault("allowable_stress", None)
+    return kwargs
+
+
+@profiled("report.prioritized")
+def render_pipe(reports_dir: str, name: str, text: str, pipe_fields: Optional[Dict[str, Any]],
+                analysis_results: Dict[str, Any], units=None) -> Dict[str, str]:
+    """
+    Write one pipe's text report and, given its PIPE fields, its two plots
+
+    Module-level so a ProcessPoolExecutor can run it. Files are named after
+    safe_name(name), so a CML cannot place them outside reports_dir.
+
+    Returns:
+        Dict of file type -> path
+    """
+    from .report_generator import safe_name
+
+    name = safe_name(name)
+    os.makedirs(reports_dir, exist_ok=True)
+    files = {"full_report": os.path.join(reports_dir, f"TMIN_report_{name}.txt")}
+    with stage("io.write"), open(files["full_report"], "w") as f:
+        f.write(text)
+    if pipe_fields is not None:
+        from .visualization import ThicknessVisualizer
+
+        visualizer = ThicknessVisualizer(units)
+        visualizer.reports_dir = reports_dir
+        pipe = PIPE(**pipe_fields)
+        actual = analysis_results["actual_thickness"]
+        files["number_line_plot"] = visualizer.create_thickness_number_line(
+            pipe, analysis_results, actual, filename=f"{name}_number_line")
+        files["comparison_chart"] = visualizer.create_comparison_chart(
+            analysis_results, actual, filename=f"{name}_comparison_chart")
+    return files
+
+
+def iter_prioritized_reports(fleet: Mapping[str, Any], as_of=None, reports_dir: str = "Reports",
+                             names: Optional[Sequence[str]] = None, plots: bool = True,
+                             executor: Optional[Executor] = None, window: int = 8,
+                             results: Optional[Dict[str, np.ndarray]] = None,
+                             units=None) -> Iterator[PrioritizedReport]:
+    """
+    Render a fleet's reports most severe first, yielding each as it is finished
+
+    Args:
+        fleet: Fleet mapping, as for analyze_batch
+        as_of: Date the present-day thickness is projected to, default today
+        reports_dir: Directory the reports and plots are written to
+        names: Report name per row (default: the fleet's 'cml' column, else the row number);
+            files are named after safe_names(names), so no two rows share a file
+        plots: Also draw each pipe's number line and comparison chart
+        executor: Executor to render in; None renders one pipe at a time in this thread
+        window: With an executor, how many pipes are rendering or queued at once
+        results: Results of analyze_batch(fleet, as_of, errors="reject", units=units) if already computed
+        units: Unit system of the fleet (see tmin.units), default imperial
+
+    Yields:
+        PrioritizedReport per analyzed row. Without an executor they arrive strictly in
+        priority order; with one, in completion order among the pipes in the window.
+        Rows rejected by validation are skipped.
+    """
+    from .report_generator import ReportGenerator, safe_names
+
+    if window < 1:
+        raise ValueError(f"window must be positive, got {window}")
+    if results is None:
+        results = analyze_batch(fleet, as_of=as_of, errors="reject", units=units)
+    n = len(results["governing_type"])
+    if names is None:
+        names = fleet["cml"] if "cml" in fleet else np.arange(n)
+    names = np.broadcast_to(np.asarray(names).astype(str), (n,))
+    # Distinct names can sanitize to the same file name; each row gets its own files
+    file_names = safe_names(names.tolist())
+
+    with stage("schedule.order"):
+        order = priority_order(results)
+        tiers = severity(results)
+        life_span = np.asarray(results["life_span"], dtype=float)
+        report_gen = ReportGenerator(units)
+        report_gen.reports_dir = reports_dir
+        # render_batch_reports yields the valid rows in row order
+        valid = np.asarray(results.get("valid", np.ones(n, dtype=bool)))
+        texts = dict(zip(np.flatnonzero(valid).tolist(),
+                         (text for _, text in report_gen.render_batch_reports(fleet, results, names))))
+
+    def jobs() -> Iterator[Tuple[PrioritizedReport, tuple]]:
+        for rank, row in enumerate(order.tolist()):
+            name = names[row]
+            analysis_results = {column: _value(results[column], row) for column in RESULT_COLUMNS}
+            pipe_fields = _pipe_fields(fleet, row) if plots else None
+            report = PrioritizedReport(rank, row, name, SEVERITY_LABELS[tiers[row]], float(life_span[row]))
+            yield report, (reports_dir, file_names[row], texts.pop(row), pipe_fields, analysis_results, units)
+
+    if executor is None:
+        for report, args in jobs():
+            report.files = render_pipe(*args)
+            yield report
+        return
+
+    pending = {}
+    queue = jobs()
+    try:
+        for report, args in queue:
+            pending[executor.submit(render_pipe, *args)] = report
+            if len(pending) < window:
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: pending[f].rank):
+                report = pending.pop(future)
+                report.files = future.result()
+                yield report
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: pending[f].rank):
+                report = pending.pop(future)
+                report.files = future.result()
+                yield report
+    finally:
+        for future in pending:
+            future.cancel()
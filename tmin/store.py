@@ -0,0 +1,345 @@
+"""
+Embedded SQLite store for inspection history
+
+Pipes (one row per CML), thickness readings (any number per CML) and the
+most recent analysis of each CML live in one SQLite file. Ingestion is bulk
+executemany inside one transaction, and the queries return columnar fleets
+that go straight into tmin.batch.analyze_batch. Indexes cover circuit, CML,
+inspection date and retirement date, so the usual questions ("latest reading
+per CML", "which CMLs retire before 2030") are index scans rather than table
+scans. Inspection and retirement dates are stored as decimal years.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .batch import FLEET_DEFAULTS, RESULT_COLUMNS, _column, analyze_batch
+from .dates import as_of_year, decimal_years
+
+# Fields stored once per CML; the readings carry measured_thickness and year_inspected
+PIPE_COLUMNS = ["circuit", "schedule", "nps", "pressure", "pressure_class", "metallurgy", "allowable_stress",
+                "design_temp", "pipe_config", "corrosion_rate", "default_retirement_limit", "API_table",
+                "joint_type"]
+
+READING_COLUMNS = ["measured_thickness", "year_inspected"]
+
+# Stored per CML from its latest analysis, plus the reading analyzed, as-of date and retirement date
+STORED_RESULTS = [name for name in RESULT_COLUMNS if name not in READING_COLUMNS]
+
+TEXT_COLUMNS = {"cml", "circuit", "schedule", "nps", "metallurgy", "design_temp", "pipe_config", "API_table",
+                "joint_type", "governing_type"}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS pipes (
+    cml TEXT PRIMARY KEY,
+    circuit TEXT,
+    schedule TEXT NOT NULL,
+    nps TEXT NOT NULL,
+    pressure REAL,
+    pressure_class INTEGER,
+    metallurgy TEXT,
+    allowable_stress REAL,
+    design_temp TEXT,
+    pipe_config TEXT,
+    corrosion_rate REAL,
+    default_retirement_limit REAL,
+    API_table TEXT,
+    joint_type TEXT
+);
+CREATE TABLE IF NOT EXISTS readings (
+    id INTEGER PRIMARY KEY,
+    cml TEXT NOT NULL REFERENCES pipes(cml),
+    year_inspected REAL,
+    measured_thickness REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    cml TEXT PRIMARY KEY REFERENCES pipes(cml),
+    reading_id INTEGER REFERENCES readings(id),
+    as_of REAL NOT NULL,
+    retirement_year REAL,
+    {", ".join(f"{name} {'TEXT' if name == 'governing_type' else 'REAL'}" for name in STORED_RESULTS)}
+);
+CREATE INDEX IF NOT EXISTS pipes_circuit ON pipes(circuit);
+CREATE INDEX IF NOT EXISTS readings_cml_date ON readings(cml, year_inspected);
+CREATE INDEX IF NOT EXISTS readings_date ON readings(year_inspected);
+CREATE INDEX IF NOT EXISTS results_retirement ON results(retirement_year);
+"""
+
+
+def _nullable(values: np.ndarray) -> List[Any]:
+    """Column values as Python objects with NaN as None (SQL NULL)"""
+    if values.dtype.kind == "f":
+        return np.where(np.isnan(values), None, values.astype(object)).tolist()
+    return [None if isinstance(v, float) and v != v else v for v in values.tolist()]
+
+
+def _columns(cursor: sqlite3.Cursor) -> Dict[str, np.ndarray]:
+    """Fetch a query result as numpy columns, NULL as NaN in numeric columns"""
+    names = [description[0] for description in cursor.description]
+    rows = cursor.fetchall()
+    values = zip(*rows) if rows else [()] * len(names)
+    return {name: np.array(column, dtype=object if name in TEXT_COLUMNS else float)
+            for name, column in zip(names, values)}
+
+
+def retirement_years(as_of: float, results: Mapping[str, np.ndarray],
+                     corrosion_rate: np.ndarray) -> np.ndarray:
+    """
+    Decimal year each CML reaches its governing thickness at its corrosion rate
+
+    Args:
+        as_of: Decimal year the results were projected to
+        results: Results from tmin.batch.analyze_batch
+        corrosion_rate: Corrosion rate per row (mpy)
+
+    Returns:
+        as_of for CMLs already at or below the limit, NaN where there is no corrosion rate
+    """
+    margin = np.asarray(results["actual_thickness"], dtype=float) - np.asarray(results["governing_thickness"],
+                                                                               dtype=float)
+    rate = np.asarray(corrosion_rate, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        years = np.where(rate > 0, margin * 1000 / rate, np.nan)
+    return np.where(margin <= 0, as_of, as_of + years)
+
+
+class InspectionStore:
+    """SQLite-backed pipes, readings and latest analysis results"""
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Args:
+            path: Database file, created if missing (default: in-memory database)
+        """
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "InspectionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    #####################################################################################
+    # INGESTION
+    ####################################################################################
+
+    def ingest(self, fleet: Mapping[str, Any]) -> int:
+        """
+        Add or update pipes and append their readings from a fleet with a 'cml' column
+
+        Args:
+            fleet: Fleet mapping as for analyze_batch, plus cml (and optionally circuit).
+                Pipe fields of a CML are taken from its last row; rows with a
+                measured_thickness become readings.
+
+        Returns:
+            Number of readings added
+        """
+        if "cml" not in fleet:
+            raise ValueError("The fleet needs a 'cml' column to be stored")
+        n = max(np.size(values) for values in fleet.values())
+
+        cml = np.broadcast_to(np.asarray(fleet["cml"]).astype(str), (n,))
+        # The last row of each CML holds its pipe fields
+        last = n - 1 - np.unique(cml[::-1], return_index=True)[1]
+
+        def pipe_column(name):
+            values = np.asarray(fleet.get(name, FLEET_DEFAULTS.get(name)))
+            return _nullable(values[last] if values.ndim else np.broadcast_to(values, last.shape))
+
+        pipes = list(zip(cml[last].tolist(), *(pipe_column(name) for name in PIPE_COLUMNS)))
+        if any(row[2] is None or row[3] is None for row in pipes):
+            raise ValueError("Every CML needs a schedule and nps")
+
+        thickness = (_column(fleet, "measured_thickness", n, float) if "measured_thickness" in fleet
+                     else np.full(n, np.nan))
+        year = np.broadcast_to(decimal_years(fleet.get("year_inspected", np.nan)), (n,))
+        has_reading = ~np.isnan(thickness)
+        readings = zip(cml[has_reading].tolist(), _nullable(year[has_reading]), thickness[has_reading].tolist())
+
+        columns = ["cml"] + PIPE_COLUMNS
+        updates = ", ".join(f"{name}=excluded.{name}" for name in PIPE_COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO pipes ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT(cml) DO UPDATE SET {updates}", pipes)
+            self.conn.executemany(
+                "INSERT INTO readings (cml, year_inspected, measured_thickness) VALUES (?, ?, ?)", readings)
+        return int(has_reading.sum())
+
+    def add_readings(self, cml: Sequence[str], measured_thickness: Sequence[float],
+                     year_inspected: Optional[Sequence[Any]] = None) -> int:
+        """
+        Append readings for CMLs already in the store
+
+        Args:
+            cml: CML per reading
+            measured_thickness: Thickness per reading (inches)
+            year_inspected: Inspection year or date per reading
+
+        Returns:
+            Number of readings added
+        """
+        n = len(cml)
+        year = np.broadcast_to(decimal_years(np.nan if year_inspected is None else year_inspected), (n,))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO readings (cml, year_inspected, measured_thickness) VALUES (?, ?, ?)",
+                zip([str(c) for c in cml], _nullable(year), np.asarray(measured_thickness, dtype=float).tolist()))
+        return n
+
+    #####################################################################################
+    # QUERIES
+    ####################################################################################
+
+    def _where(self, circuit: Optional[str], cmls: Optional[Sequence[str]], alias: str = "p"):
+        clauses, params = [], []
+        if circuit is not None:
+            clauses.append(f"{alias}.circuit = ?")
+            params.append(circuit)
+        if cmls is not None:
+            # A temporary table instead of IN (?, ...), which is capped by SQLite's parameter limit
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS selected_cmls (cml TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM selected_cmls")
+            self.conn.executemany("INSERT OR IGNORE INTO selected_cmls VALUES (?)", ((str(c),) for c in cmls))
+            clauses.append(f"{alias}.cml IN (SELECT cml FROM selected_cmls)")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def latest_readings(self, circuit: Optional[str] = None,
+                        cmls: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        The most recent reading of every CML, joined with its pipe fields
+
+        Args:
+            circuit: Only CMLs of this circuit
+            cmls: Only these CMLs
+
+        Returns:
+            Columnar fleet (with reading_id) ready for analyze_batch
+        """
+        where, params = self._where(circuit, cmls)
+        # One seek into the (cml, year_inspected) index per selected pipe
+        query = (f"SELECT p.cml, {', '.join('p.' + name for name in PIPE_COLUMNS)}, "
+                 f"r.id AS reading_id, r.measured_thickness, r.year_inspected "
+                 f"FROM pipes p JOIN readings r ON r.id = ("
+                 f"    SELECT id FROM readings WHERE cml = p.cml ORDER BY year_inspected DESC, id DESC LIMIT 1)"
+                 f"{where} ORDER BY p.cml")
+        return _columns(self.conn.execute(query, params))
+
+    def readings(self, circuit: Optional[str] = None, cmls: Optional[Sequence[str]] = None,
+                 since=None, until=None) -> Dict[str, np.ndarray]:
+        """
+        Every reading in an inspection-date range, oldest first per CML
+
+        Args:
+            circuit: Only CMLs of this circuit
+            cmls: Only these CMLs
+            since, until: Inspection date bounds (inclusive), as for decimal_year
+
+        Returns:
+            Columnar fleet (with reading_id), one row per reading
+        """
+        where, params = self._where(circuit, cmls)
+        dates = []
+        if since is not None:
+            dates.append("r.year_inspected >= ?")
+            params.append(as_of_year(since))
+        if until is not None:
+            dates.append("r.year_inspected <= ?")
+            params.append(as_of_year(until))
+        if dates:
+            where = (where + " AND " if where else " WHERE ") + " AND ".join(dates)
+        query = (f"SELECT p.cml, {', '.join('p.' + name for name in PIPE_COLUMNS)}, "
+                 f"r.id AS reading_id, r.measured_thickness, r.year_inspected "
+                 f"FROM readings r JOIN pipes p ON p.cml = r.cml{where} ORDER BY p.cml, r.year_inspected")
+        return _columns(self.conn.execute(query, params))
+
+    def retiring_before(self, date, circuit: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        CMLs whose latest analysis reaches the governing thickness before a date
+
+        Args:
+            date: Cut-off date, as for decimal_year
+            circuit: Only CMLs of this circuit
+
+        Returns:
+            Columns cml, circuit, retirement_year, as_of and the stored results, soonest first
+        """
+        params: List[Any] = [as_of_year(date)]
+        circuit_clause = ""
+        if circuit is not None:
+            circuit_clause = " AND p.circuit = ?"
+            params.append(circuit)
+        query = (f"SELECT s.cml, p.circuit, s.retirement_year, s.as_of, "
+                 f"{', '.join('s.' + name for name in STORED_RESULTS)} "
+                 f"FROM results s JOIN pipes p ON p.cml = s.cml "
+                 f"WHERE s.retirement_year < ?{circuit_clause} ORDER BY s.retirement_year")
+        return _columns(self.conn.execute(query, params))
+
+    #####################################################################################
+    # ANALYSIS
+    ####################################################################################
+
+    def save_results(self, fleet: Mapping[str, Any], results: Mapping[str, np.ndarray], as_of=None) -> int:
+        """
+        Store analysis results as each CML's latest analysis
+
+        Args:
+            fleet: Fleet with cml (and reading_id) columns, e.g. from latest_readings
+            results: Results from analyze_batch for that fleet
+            as_of: The as-of date the results were projected to
+
+        Returns:
+            Number of results stored (rows rejected by validation are skipped)
+        """
+        n = len(results["governing_type"])
+        keep = np.asarray(results.get("valid", np.ones(n, dtype=bool)), dtype=bool)
+        year = as_of_year(as_of)
+        corrosion_rate = np.broadcast_to(
+            np.asarray(fleet.get("corrosion_rate", np.nan), dtype=float), (n,))
+        reading_id = np.broadcast_to(np.asarray(fleet.get("reading_id", np.nan), dtype=float), (n,))
+
+        columns = [np.asarray(fleet["cml"], dtype=object)[keep].tolist(),
+                   [None if v != v else int(v) for v in reading_id[keep].tolist()],
+                   [year] * int(keep.sum()),
+                   _nullable(retirement_years(year, results, corrosion_rate)[keep])]
+        columns += [_nullable(np.asarray(results[name])[keep]) for name in STORED_RESULTS]
+        names = ["cml", "reading_id", "as_of", "retirement_year"] + STORED_RESULTS
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO results ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                zip(*columns))
+        return int(keep.sum())
+
+    def analyze(self, as_of=None, circuit: Optional[str] = None,
+                cmls: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Analyze the latest reading of every (selected) CML and store the results
+
+        Args:
+            as_of: Date the present-day thickness is projected to, default today
+            circuit: Only CMLs of this circuit
+            cmls: Only these CMLs
+
+        Returns:
+            {"fleet": the analyzed fleet, "results": analyze_batch results (errors="reject")}
+        """
+        fleet = self.latest_readings(circuit, cmls)
+        if not len(fleet["cml"]):
+            return {"fleet": fleet, "results": {}}
+        # Resolved once, so the results are stored under the as-of they were projected to
+        as_of = as_of_year(as_of)
+        results = analyze_batch(fleet, as_of=as_of, errors="reject")
+        self.save_results(fleet, results, as_of)
+        return {"fleet": fleet, "results": results}
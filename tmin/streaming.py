@@ -0,0 +1,80 @@
+"""
+Streaming analysis over arbitrary iterables of records
+
+iter_analyze pulls records (dicts or tuples) from any iterable, such as a
+database cursor, csv.reader or a queue, groups them into fixed-size chunks,
+runs the vectorized batch engine on each chunk and yields the results lazily.
+Only one chunk is held in memory at a time, whatever the input size.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch import FLEET_DEFAULTS, REQUIRED_COLUMNS, analyze_batch
+
+# Default field order for tuple records
+RECORD_COLUMNS = REQUIRED_COLUMNS + ["design_temp", "pipe_config", "corrosion_rate",
+                                     "default_retirement_limit", "API_table", "year_inspected", "joint_type"]
+
+
+def _chunk_fleet(chunk: List[Any], columns: Optional[Sequence[str]]) -> Dict[str, list]:
+    """Turn a list of dict or tuple records into a columnar fleet"""
+    if isinstance(chunk[0], Mapping):
+        names = list(dict.fromkeys(name for record in chunk for name in record))
+        return {name: [record.get(name, FLEET_DEFAULTS.get(name)) for record in chunk] for name in names}
+
+    names = list(columns or RECORD_COLUMNS)
+    width = {len(record) for record in chunk}
+    if len(width) > 1 or width.pop() > len(names):
+        raise ValueError(f"Tuple records must have at most {len(names)} fields ({names})")
+    return {name: list(values) for name, values in zip(names, zip(*chunk))}
+
+
+def iter_analyze(records: Iterable[Any], chunk_size: int = 10000, columns: Optional[Sequence[str]] = None,
+                 as_of=None, errors: str = "raise",
+                 units=None) -> Iterator[Tuple[Dict[str, list], Dict[str, np.ndarray]]]:
+    """
+    Analyze a stream of records chunk by chunk
+
+    Args:
+        records: Iterable of dicts keyed like a fleet, or tuples in `columns` order
+        chunk_size: Records analyzed per vectorized pass
+        columns: Field order of tuple records (default: RECORD_COLUMNS, trailing fields optional)
+        as_of: Date the present-day thickness is projected to, default today
+        errors: "raise" or "reject", as for analyze_batch
+        units: Unit system of the records and the thickness results, as for analyze_batch
+
+    Yields:
+        (chunk fleet, chunk results) for each chunk, in input order
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        fleet = _chunk_fleet(chunk, columns)
+        yield fleet, analyze_batch(fleet, as_of=as_of, errors=errors, units=units)
+
+
+def iter_results(records: Iterable[Any], chunk_size: int = 10000, columns: Optional[Sequence[str]] = None,
+                 as_of=None, errors: str = "raise", units=None) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze a stream of records and yield one result dict per record
+
+    Arguments are as for iter_analyze. Each yielded dict holds the record's
+    fields followed by its results, with None where PIPE.analysis returns None.
+    """
+    for fleet, results in iter_analyze(records, chunk_size, columns, as_of, errors, units):
+        names = list(fleet) + [name for name in results if name not in fleet]
+        values = [fleet[name] for name in fleet]
+        for name in names[len(fleet):]:
+            column = results[name]
+            if column.dtype.kind == "f":
+                column = np.where(np.isnan(column), None, column.astype(object))
+            values.append(column.tolist())
+        for row in zip(*values):
+            yield dict(zip(names, row))
@@ -0,0 +1,192 @@
+"""
+Binary table cache for the compiled lookup tables
+
+`tmin-build-tables` compiles every lookup grid (joint factors, material
+Y and allowable stress grids, built-in code editions) from tmin.asmetables and
+writes one uncompressed .npy file per table plus a manifest into
+tmin/data/tables. At runtime the tables are opened with np.load(mmap_mode='r'),
+so worker processes share the same read-only pages instead of rebuilding the
+dictionaries. If the cache is missing or its fingerprint no longer matches the
+table sources, the tables are compiled in-process instead.
+
+Before starting a process pool, call share_tables() in the parent. It checks
+the cache once (or, when the shipped cache is stale, builds one in a temporary
+directory) and names it in $TMIN_TABLE_DIR, which workers inherit: each worker
+memory-maps that directory without rehashing the sources or compiling its own
+copy, so 32 workers hold one set of table pages between them.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+CACHE_FORMAT = 1
+TABLE_DIR = Path(__file__).parent / "data" / "tables"
+MANIFEST = "manifest.json"
+
+# Cache directory already verified by a parent process, see share_tables
+SHARED_DIR_ENV = "TMIN_TABLE_DIR"
+
+_PACKAGE_DIR = Path(__file__).parent
+_SOURCES = sorted((_PACKAGE_DIR / "asmetables").glob("*.py")) + [
+    _PACKAGE_DIR / "editions.py",
+    _PACKAGE_DIR / "dimensions.py",
+    Path(__file__),
+]
+
+_TABLES: Optional[Dict[str, np.ndarray]] = None
+
+
+def source_fingerprint() -> str:
+    """SHA-256 over the table source files, used to detect a stale cache"""
+    digest = hashlib.sha256(str(CACHE_FORMAT).encode())
+    for path in _SOURCES:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _grid_value(value) -> float:
+    return np.nan if value is None else value
+
+
+def compile_tables() -> Dict[str, np.ndarray]:
+    """Compile every lookup table from the tmin.asmetables dictionaries"""
+    from .asmetables.joint_efficiency import joint_efficiency_E, weld_strength_W, joint_temperatures
+    from .asmetables.materials import MATERIALS, MATERIAL_NAMES
+    from .asmetables.pipe_dimensions import pipe_OD, nominal_wall
+    from .editions import BUILTIN_EDITIONS
+    from .dimensions import SCHEDULES, dimension_keys, nps_to_float, schedule_codes
+
+    joint_types = list(joint_efficiency_E)
+    tables = {
+        "temperatures": np.array(joint_temperatures),
+        "joint_types": np.array(joint_types),
+        # Joint factor grids indexed by [joint code, temperature index]
+        "E": np.array([[joint_efficiency_E[j][t] for t in joint_temperatures] for j in joint_types]),
+        "W": np.array([[weld_strength_W[j][t] for t in joint_temperatures] for j in joint_types]),
+        # Material grids indexed by [material code, temperature index]
+        "materials": np.array(MATERIAL_NAMES),
+        "Y": np.array([[_grid_value(MATERIALS[m]["y_table"][t]) for t in joint_temperatures]
+                       for m in MATERIAL_NAMES]),
+        "allowable_stress": np.array([[_grid_value((MATERIALS[m]["allowable_stress"] or {}).get(t))
+                                       for t in joint_temperatures] for m in MATERIAL_NAMES]),
+    }
+
+    # Pipe dimensions sorted by (NPS, schedule) key for binary search
+    pairs = [(nps, schedule) for nps, walls in nominal_wall.items() for schedule in walls]
+    keys = dimension_keys([nps_to_float(nps) for nps, _ in pairs], schedule_codes([s for _, s in pairs]))
+    order = np.argsort(keys)
+    tables["schedules"] = np.array(SCHEDULES)
+    tables["dimension_keys"] = keys[order]
+    tables["dimension_od"] = np.array([pipe_OD[nps] for nps, _ in pairs])[order]
+    tables["dimension_wall"] = np.array([nominal_wall[nps][s] for nps, s in pairs])[order]
+
+    for name, compile_edition in BUILTIN_EDITIONS.items():
+        edition = compile_edition()
+        tables[f"edition_{name}_nps"] = np.array(edition.nps_keys)
+        tables[f"edition_{name}_structural"] = np.array(edition.structural)
+        tables[f"edition_{name}_version"] = np.array(edition.version)
+        tables[f"edition_{name}_description"] = np.array(edition.description)
+
+    for array in tables.values():
+        array.setflags(write=False)
+    return tables
+
+
+def build(directory: Union[str, Path] = TABLE_DIR) -> Path:
+    """Serialize the compiled tables to .npy files and a manifest in the given directory"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    tables = compile_tables()
+    for name, array in tables.items():
+        np.save(directory / f"{name}.npy", array, allow_pickle=False)
+    manifest = {
+        "format": CACHE_FORMAT,
+        "fingerprint": source_fingerprint(),
+        "tables": sorted(tables),
+    }
+    with open(directory / MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return directory
+
+
+def read_cache(directory: Union[str, Path] = TABLE_DIR, verify: bool = True) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Memory-map the cached tables, or return None if the cache is missing or stale
+
+    Args:
+        directory: Cache directory written by build
+        verify: Check the cache fingerprint against the table sources; False skips
+            hashing the sources for a directory another process has already checked
+    """
+    directory = Path(directory)
+    try:
+        with open(directory / MANIFEST, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format") != CACHE_FORMAT:
+        return None
+    if verify and manifest.get("fingerprint") != source_fingerprint():
+        return None
+    try:
+        return {name: np.load(directory / f"{name}.npy", mmap_mode='r', allow_pickle=False)
+                for name in manifest["tables"]}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def load_tables() -> Dict[str, np.ndarray]:
+    """Get the compiled lookup tables, memory-mapped from the cache when it is current"""
+    global _TABLES
+    if _TABLES is None:
+        shared = os.environ.get(SHARED_DIR_ENV)
+        _TABLES = (shared and read_cache(shared, verify=False)) or read_cache() or compile_tables()
+    return _TABLES
+
+
+def share_tables() -> Path:
+    """
+    Publish a current table cache to worker processes started after this call
+
+    The shipped cache is used when it is current; otherwise the tables are built
+    once into a temporary directory that is removed when this process exits.
+    The directory is exported as $TMIN_TABLE_DIR, so workers started by fork,
+    spawn or forkserver memory-map it read-only instead of compiling the tables.
+
+    Returns:
+        The shared cache directory
+    """
+    shared = os.environ.get(SHARED_DIR_ENV)
+    if shared and read_cache(shared, verify=False) is not None:
+        return Path(shared)
+    if read_cache(TABLE_DIR) is not None:
+        directory = TABLE_DIR
+    else:
+        directory = build(tempfile.mkdtemp(prefix="tmin-tables-"))
+        atexit.register(shutil.rmtree, directory, True)
+    os.environ[SHARED_DIR_ENV] = str(directory)
+    return directory
+
+
+def attach_tables() -> None:
+    """ProcessPoolExecutor initializer: map the shared tables when the worker starts, not on its first task"""
+    from . import batch  # noqa: F401
+
+
+def main(argv=None) -> None:
+    directory = build(*(argv if argv is not None else sys.argv[1:2]))
+    print(f"Wrote compiled table cache to {directory}")
+
+
+if __name__ == "__main__":
+    main()
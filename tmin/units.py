@@ -0,0 +1,137 @@
+"""
+Unit systems at the batch engine boundary
+
+The engine and its lookup tables work in psi, inches and mils per year. A
+UnitSystem converts whole fleet columns into those units before analysis and
+the thickness result columns back out afterwards, one array multiply per
+column, so metric fleets never go through the per-row path. Reports and plots
+given the same UnitSystem label their values accordingly, and print
+thicknesses to its precision (decimal places) when one is set.
+
+    results = analyze_batch(fleet, units="metric")   # MPa, mm, mm/yr in and out
+    ReportGenerator(get_units("metric", precision=2))
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Mapping, Optional, Union
+
+import numpy as np
+
+# Units per psi, per inch and per mil per year
+PRESSURE_UNITS = {"psi": 1.0, "kPa": 6.894757293168361, "MPa": 0.006894757293168361, "bar": 0.06894757293168361}
+LENGTH_UNITS = {"in": 1.0, "mm": 25.4}
+RATE_UNITS = {"mpy": 1.0, "mm/yr": 0.0254}
+
+# Fleet columns by quantity
+PRESSURE_COLUMNS = ["pressure", "allowable_stress"]
+LENGTH_COLUMNS = ["measured_thickness", "default_retirement_limit"]
+RATE_COLUMNS = ["corrosion_rate"]
+
+# Result columns that are thicknesses; life_span is in years whatever the units
+LENGTH_RESULTS = ["measured_thickness", "actual_thickness", "tmin_pressure", "tmin_structural",
+                  "default_retirement_limit", "below_defaultRL", "api574_RL", "above_api574RL",
+                  "governing_thickness"]
+
+
+def _scaled(values: Any, factor: float) -> Any:
+    """values * factor as floats, None and "" as NaN; scalars stay scalars"""
+    array = np.asarray(values)
+    if array.dtype.kind not in "fiub":
+        array = np.asarray(values, dtype=object)
+        array = np.where(np.equal(array, None) | np.equal(array, ""), np.nan, array)
+    scaled = array.astype(float) * factor
+    return float(scaled) if scaled.ndim == 0 else scaled
+
+
+@dataclass(frozen=True)
+class UnitSystem:
+    """Units of pressure (and allowable stress), thickness and corrosion rate, and the thickness precision"""
+
+    pressure: str = "psi"
+    length: str = "in"
+    rate: str = "mpy"
+    # Decimal places of thicknesses in reports and plots; None keeps each output's default
+    precision: Optional[int] = None
+
+    def __post_init__(self):
+        for unit, known in ((self.pressure, PRESSURE_UNITS), (self.length, LENGTH_UNITS),
+                            (self.rate, RATE_UNITS)):
+            if unit not in known:
+                raise ValueError(f"Unknown unit '{unit}'. Valid units: {list(known)}")
+        if self.precision is not None and (not isinstance(self.precision, int) or self.precision < 0):
+            raise ValueError(f"precision must be a non-negative integer, got {self.precision!r}")
+
+    @property
+    def is_internal(self) -> bool:
+        """True for psi, inches and mpy, the units the engine computes in"""
+        return (self.pressure, self.length, self.rate) == ("psi", "in", "mpy")
+
+    @property
+    def length_factor(self) -> float:
+        """Thickness units per inch"""
+        return LENGTH_UNITS[self.length]
+
+    def decimals(self, default: int = 4) -> int:
+        """Decimal places for a thickness: the precision if set, else the output's default"""
+        return default if self.precision is None else self.precision
+
+    @property
+    def length_label(self) -> str:
+        """Thickness unit as written in reports and axis labels"""
+        return "inches" if self.length == "in" else self.length
+
+    def to_internal(self, fleet: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a fleet's pressure, thickness and corrosion rate columns to psi, inches and mpy
+
+        Args:
+            fleet: Fleet mapping in this unit system
+
+        Returns:
+            The fleet unchanged when already in internal units, else a copy with converted columns
+        """
+        if self.is_internal:
+            return fleet
+        converted = dict(fleet)
+        for columns, factor in ((PRESSURE_COLUMNS, PRESSURE_UNITS[self.pressure]),
+                                (LENGTH_COLUMNS, LENGTH_UNITS[self.length]), (RATE_COLUMNS, RATE_UNITS[self.rate])):
+            for name in columns:
+                if name in converted:
+                    converted[name] = _scaled(converted[name], 1.0 / factor)
+        return converted
+
+    def from_internal(self, results: Mapping[str, Any]) -> Dict[str, Any]:
+        """Convert the thickness columns of analyze_batch or project_batch results to this unit system"""
+        if self.length == "in":
+            return dict(results)
+        return {name: _scaled(values, self.length_factor) if name in LENGTH_RESULTS else values
+                for name, values in results.items()}
+
+
+IMPERIAL = UnitSystem()
+METRIC = UnitSystem("MPa", "mm", "mm/yr")
+
+UNIT_SYSTEMS = {
+    "imperial": IMPERIAL,
+    "metric": METRIC,
+    "metric-bar": UnitSystem("bar", "mm", "mm/yr"),
+}
+
+
+def get_units(units: Optional[Union[str, UnitSystem]] = None, precision: Optional[int] = None) -> UnitSystem:
+    """
+    Resolve a unit system by name
+
+    Args:
+        units: UnitSystem, a name in UNIT_SYSTEMS, or None for imperial (psi, inches, mpy)
+        precision: Decimal places of thicknesses in reports and plots, overriding the system's
+    """
+    if units is None:
+        system = IMPERIAL
+    elif isinstance(units, UnitSystem):
+        system = units
+    elif units not in UNIT_SYSTEMS:
+        raise ValueError(f"Unknown unit system '{units}'. Available: {list(UNIT_SYSTEMS)}")
+    else:
+        system = UNIT_SYSTEMS[units]
+    return system if precision is None else replace(system, precision=precision)
@@ -0,0 +1,204 @@
+"""
+Vectorized input validation for batch analysis
+
+validate_batch checks whole fleet columns against the lookup tables with
+vectorized membership tests before any analysis runs. Bad rows are collected
+into a rejected-rows report instead of raising, so one bad reading never
+aborts a large run.
+"""
+
+import csv
+import numpy as np
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Union
+
+from . import batch, dimensions
+from .dates import as_of_year, decimal_year
+from .asmetables.materials import MATERIAL_NAMES
+from .editions import PRESSURE_CLASSES, available_editions, get_edition
+from .metrics import metered
+
+
+@dataclass
+class ValidationResult:
+    """Rows rejected by validate_batch, one entry per failed check"""
+
+    n: int
+    rows: np.ndarray
+    columns: np.ndarray
+    values: np.ndarray
+    reasons: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of rows that passed every check"""
+        mask = np.ones(self.n, dtype=bool)
+        mask[self.rows] = False
+        return mask
+
+    @property
+    def n_rejected(self) -> int:
+        return self.n - int(self.valid.sum())
+
+    def subset(self, fleet: Mapping[str, Any]) -> Dict[str, Any]:
+        """The fleet restricted to valid rows, scalar columns are kept as scalars"""
+        mask = self.valid
+        return {name: np.asarray(values, dtype=object)[mask] if np.ndim(values) > 0 else values
+                for name, values in fleet.items()}
+
+    def summary(self) -> str:
+        """Short text summary of rejected rows grouped by reason"""
+        lines = [f"Validation: {self.n - self.n_rejected} of {self.n} rows accepted, {self.n_rejected} rejected"]
+        for (column, reason), count in sorted(Counter(zip(self.columns.tolist(), self.reasons.tolist())).items()):
+            rows = self.rows[(self.columns == column) & (self.reasons == reason)]
+            lines.append(f"  {column}: {reason} ({count} rows, e.g. {rows[:5].tolist()})")
+        return "\n".join(lines)
+
+    def write_report(self, path: Union[str, Path]) -> str:
+        """Write the rejected-rows report as CSV (row, column, value, reason)"""
+        order = np.lexsort((self.columns, self.rows))
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["row", "column", "value", "reason"])
+            writer.writerows(zip(self.rows[order].tolist(), self.columns[order].tolist(),
+                                 self.values[order].tolist(), self.reasons[order].tolist()))
+        return str(path)
+
+
+def _numeric(fleet: Mapping[str, Any], name: str, n: int) -> np.ndarray:
+    """A numeric column as floats, NaN for missing or non-numeric entries"""
+    try:
+        return batch._column(fleet, name, n, float)
+    except (ValueError, TypeError):
+        values = np.atleast_1d(np.asarray(fleet[name], dtype=object))
+        coerced = np.empty(values.shape)
+        for i, value in enumerate(values):
+            try:
+                coerced[i] = np.nan if value is None else float(value)
+            except (ValueError, TypeError):
+                coerced[i] = np.nan
+        return np.broadcast_to(coerced, (n,))
+
+
+def _years(fleet: Mapping[str, Any], name: str, n: int):
+    """A date column as decimal years (NaN where missing), its raw values and the mask of unparseable entries"""
+    values = np.atleast_1d(np.asarray(fleet.get(name, batch.FLEET_DEFAULTS.get(name)), dtype=object))
+    years = np.full(values.shape, np.nan)
+    bad = np.zeros(values.shape, dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            years[i] = np.nan if value is None or value == "" else decimal_year(value)
+        except (ValueError, TypeError):
+            bad[i] = True
+    return tuple(np.broadcast_to(column, (n,)) for column in (years, values, bad))
+
+
+@metered("validation")
+def validate_batch(fleet: Mapping[str, Any], as_of=None) -> ValidationResult:
+    """
+    Validate every row of a fleet in one vectorized pass
+
+    Args:
+        fleet: Mapping of column name -> sequence (or scalar) as accepted by analyze_batch
+        as_of: As-of date used to reject inspection dates in the future, default today
+
+    Returns:
+        ValidationResult with the valid-row mask and the rejected-rows report
+    """
+    missing = [name for name in batch.REQUIRED_COLUMNS if name not in fleet]
+    if missing:
+        raise ValueError(f"Fleet is missing required columns {missing}")
+
+    n = batch._fleet_length(fleet)
+    schedule = batch._column(fleet, "schedule", n, str)
+    nps = batch._column(fleet, "nps", n, str)
+    metallurgy = batch._column(fleet, "metallurgy", n, str)
+    design_temp = batch._column(fleet, "design_temp", n, str)
+    pipe_config = batch._column(fleet, "pipe_config", n, str)
+    api_table = batch._column(fleet, "API_table", n, str)
+    joint_type = batch._column(fleet, "joint_type", n, str)
+    pressure = _numeric(fleet, "pressure", n)
+    pressure_class = _numeric(fleet, "pressure_class", n)
+    allowable_stress = _numeric(fleet, "allowable_stress", n)
+    corrosion_rate = _numeric(fleet, "corrosion_rate", n)
+    measured_thickness = _numeric(fleet, "measured_thickness", n)
+    year_inspected, year_values, unparseable_year = _years(fleet, "year_inspected", n)
+
+    rejected: List[tuple] = []
+
+    def reject(mask: np.ndarray, column: str, values: np.ndarray, reason: str) -> None:
+        rows = np.flatnonzero(mask)
+        if rows.size:
+            rejected.append((rows, column, np.asarray(values)[rows].astype(str), reason))
+
+    # Categorical columns: membership in the lookup table axes
+    known_schedule = np.isin(schedule, dimensions.SCHEDULES)
+    reject(~known_schedule, "schedule", schedule, "unknown schedule")
+    nps_values = batch._nps_values(nps)
+    parsed_nps = ~np.isnan(nps_values)
+    reject(~parsed_nps, "nps", nps, "unparseable NPS")
+    od, _ = dimensions.lookup(nps_values, batch._schedule_codes(schedule))
+    reject(np.isnan(od) & known_schedule & parsed_nps, "nps", nps, "NPS not available in schedule")
+
+    known_material = np.isin(metallurgy, MATERIAL_NAMES)
+    reject(~known_material, "metallurgy", metallurgy, "unknown metallurgy")
+    known_class = np.isin(pressure_class, PRESSURE_CLASSES)
+    reject(~known_class, "pressure_class", pressure_class, "unknown pressure class")
+    reject(~np.isin(joint_type, batch.JOINT_TYPES), "joint_type", joint_type, "unknown joint type")
+    reject(~np.isin(pipe_config, batch.PIPE_CONFIGS), "pipe_config", pipe_config, "unknown pipe configuration")
+    known_edition = np.isin(api_table, available_editions())
+    reject(~known_edition, "API_table", api_table, "unknown code edition")
+
+    temps = batch._resolve(lambda p: p.round_temp(), design_temp=design_temp)
+    temp_index = np.minimum(np.searchsorted(batch.TEMPERATURES, temps), len(batch.TEMPERATURES) - 1)
+    known_temp = batch.TEMPERATURES[temp_index] == temps
+    temp_index = np.where(known_temp, temp_index, 0)
+    reject(~known_temp, "design_temp", design_temp, "design temperature out of range")
+
+    # Table keys that depend on several columns
+    material_code = batch._codes(np.where(known_material, metallurgy, MATERIAL_NAMES[0]), MATERIAL_NAMES,
+                                 "metallurgy")
+    Y = batch.Y_GRID[material_code, temp_index]
+    reject(np.isnan(Y) & known_material & known_temp, "design_temp", design_temp,
+           "no Y coefficient for metallurgy at design temperature")
+    S = np.where(np.isnan(allowable_stress), batch.ALLOWABLE_GRID[material_code, temp_index], allowable_stress)
+    reject(np.isnan(S) & known_material & known_temp, "allowable_stress", allowable_stress,
+           "allowable stress missing and no material curve at design temperature")
+
+    # Table keys only for rows whose NPS parsed; the rest were rejected above
+    nps_keys, nps_inverse = batch._nps_table_keys(np.where(parsed_nps, nps, ""))
+    class_code = np.searchsorted(PRESSURE_CLASSES, np.where(known_class, pressure_class, PRESSURE_CLASSES[0]))
+    for name in np.unique(api_table[known_edition]).tolist():
+        edition = get_edition(name)
+        rows = (api_table == name) & known_material & known_class & parsed_nps
+        structural = edition.lookup(material_code, edition.nps_index(nps_keys)[nps_inverse], class_code)
+        reject(rows & np.isnan(structural), "nps", nps, f"no API 574 structural thickness in edition {name}")
+
+    elbow = np.isin(pipe_config, batch.PIPE_CONFIGS[1:])
+    if elbow.any():
+        radius = batch._radii(nps_keys, nps_inverse)
+        reject(elbow & np.isnan(radius) & parsed_nps, "nps", nps, "no ANSI radius for elbow NPS")
+
+    # Numeric columns: presence and range
+    reject(~(pressure >= 0), "pressure", pressure, "missing or negative design pressure")
+    reject(~(measured_thickness > 0), "measured_thickness", measured_thickness,
+           "missing or non-positive measured thickness")
+    reject(corrosion_rate < 0, "corrosion_rate", corrosion_rate, "negative corrosion rate")
+    reject(unparseable_year, "year_inspected", year_values, "unparseable inspection date")
+    # As in PIPE.analysis, a future inspection only matters when a corrosion rate projects it
+    reject((year_inspected > as_of_year(as_of)) & ~np.isnan(corrosion_rate), "year_inspected", year_values,
+           "inspection year in the future")
+
+    if rejected:
+        rows, columns, values, reasons = zip(*rejected)
+        return ValidationResult(
+            n=n,
+            rows=np.concatenate(rows),
+            columns=np.concatenate([np.full(len(r), c) for r, c in zip(rows, columns)]),
+            values=np.concatenate(values),
+            reasons=np.concatenate([np.full(len(r), reason) for r, reason in zip(rows, reasons)]),
+        )
+    empty = np.array([], dtype=str)
+    return ValidationResult(n=n, rows=np.array([], dtype=np.intp), columns=empty, values=empty, reasons=empty)
@@ -1,26 +1,62 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, Any, Optional
-from datetime import datetime
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from typing import Dict, Any, Optional, Sequence, Tuple
 import os
 
+from .profiling import profiled, stage
+from .report_generator import dated_path, safe_name
+from .units import get_units
+
 class ThicknessVisualizer:
     """
     Creates visualizations for pipe thickness analysis
+
+    Figures are built with the object-oriented Figure API on an Agg canvas rather
+    than pyplot, so nothing is registered in pyplot's global figure list, no GUI
+    backend is needed, and separate visualizers can render concurrently from threads.
     """
     
-    def __init__(self):
+    def __init__(self, units=None):
+        """
+        Args:
+            units: Unit system of the thickness values being plotted (see tmin.units),
+                default inches; its precision sets the decimal places of value labels
+        """
+        self.units = get_units(units)
         self.reports_dir = "Reports"
         os.makedirs(self.reports_dir, exist_ok=True)
     
+    @property
+    def _suffix(self) -> str:
+        """Thickness unit appended to value labels"""
+        return '"' if self.units.length == "in" else f" {self.units.length}"
+    
     def _get_filename_with_date(self, base_name: str, filename: Optional[str] = None) -> str:
         """Generate filename with date prefix"""
         if filename is None:
-            date_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{date_str}_{base_name}"
+            return dated_path(self.reports_dir, base_name)
         
         return os.path.join(self.reports_dir, filename)
     
+    @staticmethod
+    def _figure(figsize: Tuple[float, float]):
+        """New headless figure and its axes"""
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots()
+    
+    def _save(self, fig: Figure, filename: str, dpi: int) -> str:
+        """Lay out and write a figure as PNG, returns the file path"""
+        fig.tight_layout()
+        filepath = self._get_filename_with_date(f"{filename}.png")
+        with stage("plot.savefig"):
+            fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
+        return filepath
+    
+    @profiled("plot.thickness_number_line")
     def create_thickness_number_line(self, pipe_instance, analysis_results: Dict[str, Any], 
                                    actual_thickness: float, filename: Optional[str] = None) -> str:
         """
@@ -38,10 +74,18 @@ class ThicknessVisualizer:
         try:
             nominal_id = pipe_instance.get_ID()
             od = pipe_instance.get_OD()
+            if nominal_id is None or od is None:
+                raise ValueError(f"No dimensions for NPS {pipe_instance.nps} schedule {pipe_instance.schedule}")
+            # Table dimensions are in inches
+            nominal_id *= self.units.length_factor
+            od *= self.units.length_factor
         except:
             # Fallback if we can't get the actual dimensions
             nominal_id = 0.0
-            od = measured_thickness + 0.02
+            od = measured_thickness + 0.02 * self.units.length_factor
+        # Tick spacing and margins of 0.01", in the plot's units
+        step = 0.01 * self.units.length_factor
+        digits = self.units.decimals(3)
         
         # Calculate positions from OD inward (thickness measurements)
         # OD is at the rightmost position
@@ -55,16 +99,16 @@ class ThicknessVisualizer:
         min_pressure_pos = od - tmin_pressure
         
         # Create figure with proper graph style
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = self._figure((14, 8))
         
         # Set up the plot with proper axis
-        ax.set_xlim(nominal_id_pos - 0.01, od_pos + 0.01)
+        ax.set_xlim(nominal_id_pos - step, od_pos + step)
         ax.set_ylim(0, 1)
         
         # Add grid and tick marks
         ax.grid(True, alpha=0.3, axis='x')
-        ax.set_xticks(np.arange(nominal_id_pos, od_pos + 0.01, 0.01))
-        ax.set_xticklabels([f'{x:.3f}' for x in np.arange(nominal_id_pos, od_pos + 0.01, 0.01)], rotation=45, ha='right')
+        ax.set_xticks(np.arange(nominal_id_pos, od_pos + step, step))
+        ax.set_xticklabels([f'{x:.{digits}f}' for x in np.arange(nominal_id_pos, od_pos + step, step)], rotation=45, ha='right')
         ax.set_yticks([])
         
         # Fill regions
@@ -73,7 +117,7 @@ class ThicknessVisualizer:
         # Remaining wall (from actual ID to OD)
         ax.fill_betweenx([0, 1], actual_id_pos, od_pos, color='#e6e6e6', alpha=0.7, label='Remaining Pipe Wall')
         # OD bar
-        ax.fill_betweenx([0, 1], od_pos-0.002, od_pos, color='gray', alpha=1, label='OD')
+        ax.fill_betweenx([0, 1], od_pos - 0.2 * step, od_pos, color='gray', alpha=1, label='OD')
 
         # Draw vertical lines for all limits with proper styles
         ax.axvline(nominal_id_pos, color='black', linewidth=3, label='Nominal ID')
@@ -85,59 +129,55 @@ class ThicknessVisualizer:
         ax.axvline(min_pressure_pos, color='red', linestyle='--', linewidth=3, label='Min. Pressure Thk.')
 
         # Add value labels at the top
-        ax.text(nominal_id_pos, 1.05, f'Nominal Inner Dia.\n{nominal_id_pos:.3f}"', 
+        ax.text(nominal_id_pos, 1.05, f'Nominal Inner Dia.\n{nominal_id_pos:.{digits}f}{self._suffix}', 
                color='black', fontsize=12, fontweight='bold', ha='center', va='bottom', rotation=90)
         
         if default_rl_pos:
-            ax.text(default_rl_pos, 1.05, f'Default Retirement Limit\n{default_retirement_limit:.3f}"', 
+            ax.text(default_rl_pos, 1.05, f'Default Retirement Limit\n{default_retirement_limit:.{digits}f}{self._suffix}', 
                    color='orange', fontsize=12, fontweight='bold', ha='center', va='bottom', rotation=90)
         
-        ax.text(actual_id_pos, 1.05, f'Actual Inner Dia.\n{measured_thickness:.3f}" from OD', 
+        ax.text(actual_id_pos, 1.05, f'Actual Inner Dia.\n{measured_thickness:.{digits}f}{self._suffix} from OD', 
                color='blue', fontsize=12, fontweight='bold', ha='center', va='bottom', rotation=90)
         
         if api574_rl_pos:
-            ax.text(api574_rl_pos, 1.05, f'API 574 Retirement Limit\n{api574_RL:.3f}" from OD', 
+            ax.text(api574_rl_pos, 1.05, f'API 574 Retirement Limit\n{api574_RL:.{digits}f}{self._suffix} from OD', 
                    color='purple', fontsize=12, fontweight='bold', ha='center', va='bottom', rotation=90)
         
-        ax.text(min_pressure_pos, 1.05, f'Min. Pressure Containing\n{tmin_pressure:.3f}" from OD', 
+        ax.text(min_pressure_pos, 1.05, f'Min. Pressure Containing\n{tmin_pressure:.{digits}f}{self._suffix} from OD', 
                color='red', fontsize=12, fontweight='bold', ha='center', va='bottom', rotation=90)
         
-        ax.text(od_pos, 1.05, f'Outer Dia.\n{od_pos:.3f}"', 
+        ax.text(od_pos, 1.05, f'Outer Dia.\n{od_pos:.{digits}f}{self._suffix}', 
                color='gray', fontsize=12, fontweight='bold', ha='center', va='bottom', rotation=90)
 
         # Add axis labels
-        ax.text(nominal_id_pos - 0.01, 0.5, 'Nominal Inner Dia.', 
+        ax.text(nominal_id_pos - step, 0.5, 'Nominal Inner Dia.', 
                color='black', fontsize=14, fontweight='bold', ha='right', va='center', rotation=90)
-        ax.text(od_pos + 0.01, 0.5, 'Outer Dia.', 
+        ax.text(od_pos + step, 0.5, 'Outer Dia.', 
                color='gray', fontsize=14, fontweight='bold', ha='left', va='center', rotation=90)
 
         # Set labels and title
-        ax.set_xlabel('Profile of Pipe Wall (inches)', fontsize=14, fontweight='bold')
+        ax.set_xlabel(f'Profile of Pipe Wall ({self.units.length_label})', fontsize=14, fontweight='bold')
         ax.set_title('TMIN - Pipe Wall Thickness Analysis', fontsize=16, fontweight='bold')
 
         # Custom legend
         custom_lines = [
-            plt.Line2D([0], [0], color='#b3e6ff', lw=10, label='Fluid'),
-            plt.Line2D([0], [0], color='#e6e6e6', lw=10, label='Remaining Pipe Wall'),
-            plt.Line2D([0], [0], color='gray', lw=10, label='OD'),
-            plt.Line2D([0], [0], color='black', lw=3, label='Nominal ID'),
-            plt.Line2D([0], [0], color='blue', lw=3, label='Actual Thk.'),
-            plt.Line2D([0], [0], color='purple', lw=3, linestyle='--', label='API 574 RL'),
-            plt.Line2D([0], [0], color='orange', lw=3, linestyle='--', label='Default RL'),
-            plt.Line2D([0], [0], color='red', lw=3, linestyle='--', label='Min. Pressure Thk.'),
+            Line2D([0], [0], color='#b3e6ff', lw=10, label='Fluid'),
+            Line2D([0], [0], color='#e6e6e6', lw=10, label='Remaining Pipe Wall'),
+            Line2D([0], [0], color='gray', lw=10, label='OD'),
+            Line2D([0], [0], color='black', lw=3, label='Nominal ID'),
+            Line2D([0], [0], color='blue', lw=3, label='Actual Thk.'),
+            Line2D([0], [0], color='purple', lw=3, linestyle='--', label='API 574 RL'),
+            Line2D([0], [0], color='orange', lw=3, linestyle='--', label='Default RL'),
+            Line2D([0], [0], color='red', lw=3, linestyle='--', label='Min. Pressure Thk.'),
         ]
         ax.legend(handles=custom_lines, loc='lower right', fontsize=10, frameon=True)
 
-        plt.tight_layout()
-
         # Save plot
         if filename is None:
             filename = f"thickness_analysis_number_line"
-        filepath = self._get_filename_with_date(f"{filename}.png")
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        return filepath
+        return self._save(fig, filename, dpi=300)
     
+    @profiled("plot.comparison_chart")
     def create_comparison_chart(self, analysis_results: Dict[str, Any], 
                                actual_thickness: float, filename: Optional[str] = None) -> str:
         """
@@ -177,33 +217,304 @@ class ThicknessVisualizer:
             colors.append('green')
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._figure((10, 6))
         
         # Create bars
         bars = ax.bar(categories, values, color=colors, alpha=0.7)
         
         # Add value labels on bars
+        digits = self.units.decimals()
         for bar, value in zip(bars, values):
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{value:.4f}"', ha='center', va='bottom')
+                   f'{value:.{digits}f}{self._suffix}', ha='center', va='bottom')
         
         # Customize plot
-        ax.set_ylabel('Thickness (inches)', fontsize=12)
+        ax.set_ylabel(f'Thickness ({self.units.length_label})', fontsize=12)
         ax.set_title('TMIN - Thickness Comparison Chart', fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
         
         # Rotate x-axis labels for better readability
-        plt.xticks(rotation=45, ha='right')
-        
-        plt.tight_layout()
+        for label in ax.get_xticklabels():
+            label.set(rotation=45, ha='right')
         
         # Save plot
         if filename is None:
             filename = f"thickness_comparison_chart"
         
-        filepath = self._get_filename_with_date(f"{filename}.png")
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        return self._save(fig, filename, dpi=300)
+    
+    @profiled("plot.projection_plot")
+    def create_projection_plot(self, projection: Dict[str, np.ndarray], rows: Optional[np.ndarray] = None,
+                               labels: Optional[Sequence[str]] = None, title: Optional[str] = None,
+                               filename: Optional[str] = None, dpi: int = 150) -> str:
+        """
+        Plot thickness versus time for many CMLs on one figure
+        
+        Each CML's projected thickness, governing limit and retirement date are drawn
+        from the batched arrays as LineCollections, so the figure costs a handful of
+        artists however many CMLs it holds.
+        
+        Args:
+            projection: Results from tmin.batch.project_batch
+            rows: Optional index or boolean mask selecting the CMLs to draw
+            labels: Optional CML labels; the legend is only drawn for a few CMLs
+            title: Optional plot title
+            filename: Optional filename to save the plot (without extension)
+            dpi: Resolution of the saved image
+            
+        Returns:
+            str: Path to saved plot file
+        """
+        as_of = np.asarray(projection["as_of"], dtype=float)
+        thickness = np.asarray(projection["actual_thickness"], dtype=float).T
+        governing = np.asarray(projection["governing_thickness"], dtype=float)
+        if rows is not None:
+            thickness = thickness[rows]
+            governing = governing[rows]
+            labels = None if labels is None else np.asarray(labels)[rows]
+        retirement = self._retirement_years(as_of, thickness, governing)
+        n = len(thickness)
+        
+        # One (n, m, 2) segment array per layer instead of one ax.plot per CML
+        curves = np.stack([np.broadcast_to(as_of, thickness.shape), thickness], axis=-1)
+        limits = np.stack([np.broadcast_to(as_of[[0, -1]], (n, 2)), np.repeat(governing[:, None], 2, axis=1)],
+                          axis=-1)
+        years_left = np.clip(retirement - as_of[0], 0, as_of[-1] - as_of[0])
+        
+        fig, ax = self._figure((12, 7))
+        lines = LineCollection(curves, cmap='RdYlGn', linewidths=1.5)
+        lines.set_array(np.where(np.isnan(years_left), as_of[-1] - as_of[0], years_left))
+        ax.add_collection(lines)
+        ax.add_collection(LineCollection(limits, colors='red', linestyles='--', linewidths=0.8, alpha=0.5))
+        
+        retiring = (retirement >= as_of[0]) & (retirement <= as_of[-1])
+        ax.scatter(retirement[retiring], governing[retiring], marker='x', color='black', zorder=3,
+                   label='Projected Retirement')
+        if labels is not None and n <= 10:
+            for label, curve in zip(labels, thickness):
+                ax.annotate(str(label), (as_of[-1], curve[-1]), fontsize=8, xytext=(3, 0),
+                            textcoords='offset points', va='center')
+        
+        ax.autoscale()
+        ax.set_xlabel('Year', fontsize=12)
+        ax.set_ylabel(f'Projected Thickness ({self.units.length_label})', fontsize=12)
+        ax.set_title(title or f'TMIN - Thickness Projection ({n} CMLs)', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        fig.colorbar(lines, ax=ax, label='Years to Retirement')
+        ax.legend(handles=[
+            Line2D([0], [0], color='red', lw=1, linestyle='--', label='Governing Limit'),
+            Line2D([0], [0], color='black', marker='x', lw=0, label='Projected Retirement'),
+        ], loc='upper right', fontsize=10)
+        
+        if filename is None:
+            filename = "thickness_projection"
+        return self._save(fig, filename, dpi)
+    
+    def create_projection_plots(self, projection: Dict[str, np.ndarray], circuits: Sequence[str],
+                                labels: Optional[Sequence[str]] = None, dpi: int = 150) -> Dict[str, str]:
+        """
+        Render one thickness projection figure per circuit
+        
+        Args:
+            projection: Results from tmin.batch.project_batch
+            circuits: Circuit name of each row
+            labels: Optional CML labels
+            dpi: Resolution of the saved images
+            
+        Returns:
+            Dict of circuit name -> path to saved plot file
+        """
+        names, inverse = np.unique(np.asarray(circuits).astype(str), return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(names) + 1))
+        paths = {}
+        for i, name in enumerate(names.tolist()):
+            rows = order[bounds[i]:bounds[i + 1]]
+            paths[name] = self.create_projection_plot(projection, rows, labels, title=f'TMIN - Circuit {name}',
+                                                      filename=f"thickness_projection_{safe_name(name)}", dpi=dpi)
+        return paths
+    
+    @staticmethod
+    def _retirement_years(as_of: np.ndarray, thickness: np.ndarray, governing: np.ndarray) -> np.ndarray:
+        """Year each CML's projected thickness reaches its governing limit, NaN if it never does"""
+        if len(as_of) < 2:
+            return np.full(len(thickness), np.nan)
+        loss_rate = (thickness[:, 0] - thickness[:, -1]) / (as_of[-1] - as_of[0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            years = as_of[0] + (thickness[:, 0] - governing) / loss_rate
+        return np.where(loss_rate > 0, years, np.nan)
+
+    #####################################################################################
+    # FLEET DASHBOARD
+    ####################################################################################
+    
+    @staticmethod
+    def _categories(values: Sequence[Any], key=None):
+        """Sorted unique categories of a column and each row's category index"""
+        names, inverse = np.unique(np.asarray(values).astype(str), return_inverse=True)
+        if key is not None:
+            order = np.argsort([key(name) for name in names.tolist()], kind='stable')
+            names, inverse = names[order], np.argsort(order)[inverse.reshape(-1)]
+        return names, inverse.reshape(-1)
+    
+    @profiled("plot.remaining_life_histogram")
+    def create_remaining_life_histogram(self, results: Dict[str, np.ndarray], bins: int = 40,
+                                        filename: Optional[str] = None, dpi: int = 150) -> str:
+        """
+        Histogram of remaining life across a fleet
+        
+        Args:
+            results: Results from tmin.batch.analyze_batch
+            bins: Number of histogram bins
+            filename: Optional filename to save the plot (without extension)
+            dpi: Resolution of the saved image
+            
+        Returns:
+            str: Path to saved plot file
+        """
+        life = np.asarray(results["life_span"], dtype=float)
+        finite = life[np.isfinite(life)]
+        counts, edges = np.histogram(finite, bins=bins)
+        
+        fig, ax = self._figure((10, 6))
+        ax.stairs(counts, edges, fill=True, color='steelblue', alpha=0.8)
+        ax.set_xlabel('Remaining Life (years)', fontsize=12)
+        ax.set_ylabel('CMLs', fontsize=12)
+        ax.set_title(f'TMIN - Remaining Life Distribution ({finite.size} of {life.size} CMLs with a projected life)',
+                     fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3, axis='y')
+        
+        if filename is None:
+            filename = "fleet_remaining_life"
+        return self._save(fig, filename, dpi)
+    
+    @staticmethod
+    def _valid(results: Dict[str, np.ndarray], n: int) -> np.ndarray:
+        """Rows analyzed, i.e. not rejected by validation"""
+        return np.asarray(results.get("valid", np.ones(n, dtype=bool)), dtype=bool)
+    
+    def governing_type_counts(self, results: Dict[str, np.ndarray], nps: Sequence[str],
+                              pressure_class: Sequence[int]):
+        """
+        CML counts by NPS and pressure class, in total and pressure-governed, skipping rows rejected by validation
+        
+        Returns:
+            (NPS names, class names, total counts, pressure-governed counts), counts shaped (NPS, class)
+        """
+        from .dimensions import nps_to_float
+        n = len(results["governing_type"])
+        valid = self._valid(results, n)
+        nps_names, nps_index = self._categories(np.broadcast_to(nps, (n,))[valid], key=nps_to_float)
+        class_names, class_index = self._categories(np.broadcast_to(pressure_class, (n,))[valid], key=int)
+        shape = (len(nps_names), len(class_names))
+        ranges = [[-0.5, shape[0] - 0.5], [-0.5, shape[1] - 0.5]]
+        total, _, _ = np.histogram2d(nps_index, class_index, bins=shape, range=ranges)
+        pressure, _, _ = np.histogram2d(nps_index, class_index, bins=shape, range=ranges,
+                                        weights=np.asarray(results["governing_type"])[valid] == "pressure")
+        return nps_names, class_names, total.astype(np.int64), pressure.astype(np.int64)
+    
+    @profiled("plot.governing_heatmap")
+    def create_governing_heatmap(self, results: Dict[str, np.ndarray], nps: Sequence[str],
+                                 pressure_class: Sequence[int], filename: Optional[str] = None,
+                                 dpi: int = 150) -> str:
+        """
+        Heatmap of the pressure-governed share of CMLs by NPS and pressure class
+        
+        Args:
+            results: Results from tmin.batch.analyze_batch
+            nps: NPS of each row (or one value for all)
+            pressure_class: Pressure class of each row (or one value for all)
+            filename: Optional filename to save the plot (without extension)
+            dpi: Resolution of the saved image
+            
+        Returns:
+            str: Path to saved plot file
+        """
+        nps_names, class_names, total, pressure = self.governing_type_counts(results, nps, pressure_class)
+        with np.errstate(invalid='ignore'):
+            share = np.where(total > 0, pressure / total, np.nan)
+        
+        fig, ax = self._figure((max(6, len(class_names) * 1.2 + 3), max(5, len(nps_names) * 0.4 + 2)))
+        image = ax.imshow(share, cmap='coolwarm', vmin=0, vmax=1, aspect='auto')
+        for i, j in zip(*np.nonzero(total)):
+            ax.text(j, i, f'{pressure[i, j]}/{total[i, j]}', ha='center', va='center', fontsize=8)
+        ax.set_xticks(np.arange(len(class_names)), labels=class_names)
+        ax.set_yticks(np.arange(len(nps_names)), labels=[f'{name}"' for name in nps_names])
+        ax.set_xlabel('Pressure Class', fontsize=12)
+        ax.set_ylabel('NPS', fontsize=12)
+        ax.set_title('TMIN - Pressure-Governed CMLs by NPS and Class', fontsize=14, fontweight='bold')
+        fig.colorbar(image, ax=ax, label='Share Pressure Governed (rest Structural)')
         
-        return filepath 
\ No newline at end of file
+        if filename is None:
+            filename = "fleet_governing_type"
+        return self._save(fig, filename, dpi)
+    
+    def below_limit_counts(self, results: Dict[str, np.ndarray], circuits: Sequence[str]):
+        """
+        CMLs below the governing limit and below the default retirement limit, per circuit,
+        skipping rows rejected by validation
+        
+        Returns:
+            (circuit names, total CMLs, below governing, below default RL)
+        """
+        n = len(results["governing_type"])
+        valid = self._valid(results, n)
+        names, index = self._categories(np.broadcast_to(circuits, (n,))[valid])
+        actual = np.asarray(results["actual_thickness"], dtype=float)[valid]
+        below_governing = actual < np.asarray(results["governing_thickness"], dtype=float)[valid]
+        below_default = np.isfinite(np.asarray(results["below_defaultRL"], dtype=float)[valid])
+        size = len(names)
+        return (names, np.bincount(index, minlength=size),
+                np.bincount(index, weights=below_governing, minlength=size).astype(np.int64),
+                np.bincount(index, weights=below_default, minlength=size).astype(np.int64))
+    
+    @profiled("plot.below_limit_chart")
+    def create_below_limit_chart(self, results: Dict[str, np.ndarray], circuits: Sequence[str],
+                                 filename: Optional[str] = None, dpi: int = 150) -> str:
+        """
+        Bar chart of CMLs below limit by circuit
+        
+        Args:
+            results: Results from tmin.batch.analyze_batch
+            circuits: Circuit name of each row
+            filename: Optional filename to save the plot (without extension)
+            dpi: Resolution of the saved image
+            
+        Returns:
+            str: Path to saved plot file
+        """
+        names, total, below_governing, below_default = self.below_limit_counts(results, circuits)
+        y = np.arange(len(names))
+        
+        fig, ax = self._figure((10, max(4, len(names) * 0.35 + 2)))
+        ax.barh(y - 0.2, below_governing, height=0.4, color='red', alpha=0.7, label='Below Governing Limit')
+        ax.barh(y + 0.2, below_default, height=0.4, color='orange', alpha=0.7, label='Below Default RL')
+        for i in range(len(names)):
+            ax.text(max(below_governing[i], below_default[i]), i, f' of {total[i]}', va='center', fontsize=8)
+        ax.set_yticks(y, labels=names)
+        ax.invert_yaxis()
+        ax.set_xlabel('CMLs', fontsize=12)
+        ax.set_title('TMIN - CMLs Below Limit by Circuit', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3, axis='x')
+        ax.legend(loc='lower right', fontsize=10)
+        
+        if filename is None:
+            filename = "fleet_below_limit"
+        return self._save(fig, filename, dpi)
+    
+    @profiled("plot.fleet_dashboard")
+    def create_fleet_dashboard(self, results: Dict[str, np.ndarray], nps: Sequence[str],
+                               pressure_class: Sequence[int], circuits: Sequence[str],
+                               dpi: int = 150) -> Dict[str, str]:
+        """
+        Render every fleet dashboard chart, one figure per chart
+        
+        Returns:
+            Dict of chart name -> path to saved plot file
+        """
+        return {
+            "remaining_life": self.create_remaining_life_histogram(results, dpi=dpi),
+            "governing_type": self.create_governing_heatmap(results, nps, pressure_class, dpi=dpi),
+            "below_limit": self.create_below_limit_chart(results, circuits, dpi=dpi),
+        }